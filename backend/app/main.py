@@ -1,6 +1,7 @@
 """
 TubeVibe Library - Main Application Entry Point
 """
+import asyncio
 import logging
 from pathlib import Path
 from contextlib import asynccontextmanager
@@ -75,6 +76,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
 
+    # Load the tiktoken encoding (a network download on first use) off the request path
+    from app.services.summarization_service import warm_token_encoder
+    app.state.token_encoder_warmup = asyncio.create_task(warm_token_encoder())
+
     # Initialize Pinecone service
     from app.services.pinecone_service import get_pinecone_service
     try:
@@ -92,10 +97,18 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
 
+    # Let queued background Pinecone uploads finish (they record file IDs in the database)
+    from app.services.podcast_service import get_podcast_service
+    await get_podcast_service().shutdown()
+
     # Close database connection
     if hasattr(app.state, 'db'):
         await app.state.db.close()
 
+    # Close pooled LLM connections
+    from app.services.summarization_service import close_summarization_service
+    await close_summarization_service()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -205,6 +205,7 @@ class PodcastListResponse(BaseModel):
     page: int
     per_page: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page by keyset
 
 
 class SectionSummary(BaseModel):
@@ -985,7 +985,7 @@ async def fix_test_user_videos(
     IMPORTANT: Only run this once, then remove this endpoint.
     """
     from sqlalchemy import select, update, func
-    from app.services.database_service import VideoModel
+    from app.services.database_service import VideoModel, utc_now
     import uuid
 
     auth_service = get_auth_service()
@@ -1014,11 +1014,10 @@ async def fix_test_user_videos(
                 }
 
             # Update videos from test user to current authenticated user
-            from datetime import datetime
             await session.execute(
                 update(VideoModel)
                 .where(VideoModel.user_id == uuid.UUID(TEST_USER_ID))
-                .values(user_id=uuid.UUID(user_id), updated_at=datetime.utcnow())
+                .values(user_id=uuid.UUID(user_id), updated_at=utc_now())
             )
 
         return {
@@ -1276,7 +1275,6 @@ async def merge_duplicate_users(request: MergeUsersActionRequest):
     """
     import os
     from sqlalchemy import select, update as sql_update
-    from datetime import datetime
 
     expected_secret = os.getenv("ADMIN_SECRET", "tubevibe-admin-2024")
     if request.admin_secret != expected_secret:
@@ -1290,7 +1288,7 @@ async def merge_duplicate_users(request: MergeUsersActionRequest):
     try:
         async with auth_service.db.get_session() as session:
             from sqlalchemy import func, delete
-            from app.services.database_service import UserModel, VideoModel
+            from app.services.database_service import UserModel, VideoModel, utc_now
             import uuid
 
             keep_uuid = uuid.UUID(request.keep_user_id)
@@ -1322,7 +1320,7 @@ async def merge_duplicate_users(request: MergeUsersActionRequest):
             await session.execute(
                 sql_update(VideoModel)
                 .where(VideoModel.user_id == delete_uuid)
-                .values(user_id=keep_uuid, updated_at=datetime.utcnow())
+                .values(user_id=keep_uuid, updated_at=utc_now())
             )
 
             # Copy google_id if keep_user doesn't have one
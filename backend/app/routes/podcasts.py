@@ -72,6 +72,10 @@ async def list_podcasts(
     per_page: int = Query(20, ge=1, le=100),
     group_id: Optional[str] = None,
     source: Optional[str] = None,
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page; seeks instead of using page (fast for deep pages)"
+    ),
     user_id: str = Depends(get_current_user_id)
 ):
     """
@@ -83,20 +87,25 @@ async def list_podcasts(
     db = await get_database_service()
     podcast_service.set_database(db)
 
-    result = await podcast_service.list_podcasts(
-        user_id=user_id,
-        group_id=group_id,
-        source=source,
-        page=page,
-        per_page=per_page
-    )
+    try:
+        result = await podcast_service.list_podcasts(
+            user_id=user_id,
+            group_id=group_id,
+            source=source,
+            page=page,
+            per_page=per_page,
+            after_cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return PodcastListResponse(
         podcasts=[PodcastResponse(**m) for m in result["podcasts"]],
         total=result["total"],
         page=result["page"],
         per_page=result["per_page"],
-        has_more=result["has_more"]
+        has_more=result["has_more"],
+        next_cursor=result["next_cursor"]
     )
 
 
@@ -271,7 +280,8 @@ async def get_podcast_summary(
     summary_result = await summarization_service.generate_summary(
         transcript=transcript,
         video_title=podcast.get("title", "Untitled Podcast"),
-        video_id=podcast_id
+        video_id=podcast_id,
+        use_cache=not force_regenerate
     )
 
     # Map video response fields to podcast response fields
@@ -288,7 +288,8 @@ async def get_video_summary(
     summary_result = await summarization_service.generate_summary(
         transcript=transcript,
         video_title=video.get("title", "Untitled Video"),
-        video_id=video_id
+        video_id=video_id,
+        use_cache=not force_regenerate
     )
 
     if not summary_result.get("success"):
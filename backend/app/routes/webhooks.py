@@ -14,6 +14,7 @@ from fastapi.responses import JSONResponse
 from app.settings import get_settings
 from app.services.database_service import get_database_service
 from app.services.pinecone_service import get_pinecone_service
+from app.services.podcast_service import get_podcast_service
 from app.services.fireflies_service import get_fireflies_service
 from app.models.podcast import (
     FirefliesWebhookPayload,
@@ -224,25 +225,23 @@ async def fireflies_webhook(
             source_metadata=source_metadata
         )
 
-        # Upload to Pinecone for RAG
+        # Queue upload to Pinecone for RAG (debounced per user, so bulk syncs flush together)
         try:
-            pinecone_service = get_pinecone_service()
-            pinecone_file_id = await upload_podcast_to_pinecone(
-                pinecone_service=pinecone_service,
-                podcast_id=podcast["id"],
-                user_id=user["id"],
-                title=transcript_data.title,
-                subject=transcript_data.title,
-                podcast_date=transcript_data.date,
-                participants=transcript_data.participants,
-                transcript=transcript_data.transcript_text,
-                source="fireflies"
-            )
-            if pinecone_file_id:
-                await db.update_podcast_pinecone_id(podcast["id"], pinecone_file_id)
-                logger.info(f"Podcast {podcast['id']} uploaded to Pinecone: {pinecone_file_id}")
+            if get_pinecone_service().is_initialized():
+                podcast_service = get_podcast_service()
+                podcast_service.set_database(db)
+                podcast_service.queue_pinecone_upload(
+                    podcast_id=podcast["id"],
+                    user_id=user["id"],
+                    title=transcript_data.title,
+                    subject=transcript_data.title,
+                    podcast_date=transcript_data.date,
+                    participants=transcript_data.participants or [],
+                    transcript=transcript_data.transcript_text,
+                    source="fireflies"
+                )
         except Exception as e:
-            logger.error(f"Failed to upload podcast to Pinecone: {e}")
+            logger.error(f"Failed to queue podcast upload to Pinecone: {e}")
             # Podcast is still saved, just not in RAG
 
         logger.info(f"Fireflies podcast saved: {podcast['id']} - {transcript_data.title}")
@@ -431,22 +430,21 @@ async def zoom_webhook(
         # Upload to Pinecone if transcript is available
         if transcript_text:
             try:
-                pinecone_service = get_pinecone_service()
-                pinecone_file_id = await upload_podcast_to_pinecone(
-                    pinecone_service=pinecone_service,
-                    podcast_id=podcast["id"],
-                    user_id=user["id"],
-                    title=topic or f"Zoom Meeting {meeting_id}",
-                    subject=topic,
-                    podcast_date=podcast_date,
-                    participants=participants,
-                    transcript=transcript_text,
-                    source="zoom"
-                )
-                if pinecone_file_id:
-                    await db.update_podcast_pinecone_id(podcast["id"], pinecone_file_id)
+                if get_pinecone_service().is_initialized():
+                    podcast_service = get_podcast_service()
+                    podcast_service.set_database(db)
+                    podcast_service.queue_pinecone_upload(
+                        podcast_id=podcast["id"],
+                        user_id=user["id"],
+                        title=topic or f"Zoom Meeting {meeting_id}",
+                        subject=topic,
+                        podcast_date=podcast_date,
+                        participants=participants or [],
+                        transcript=transcript_text,
+                        source="zoom"
+                    )
             except Exception as e:
-                logger.error(f"Failed to upload Zoom podcast to Pinecone: {e}")
+                logger.error(f"Failed to queue Zoom podcast upload to Pinecone: {e}")
 
         logger.info(f"Zoom podcast saved: {podcast['id']}")
         return WebhookResponse(
@@ -458,66 +456,3 @@ async def zoom_webhook(
     except Exception as e:
         logger.error(f"Error processing Zoom webhook: {e}", exc_info=True)
         return WebhookResponse(success=False, message="Processing error", error=str(e))
-
-
-# =============================================================================
-# Pinecone Upload Helper
-# =============================================================================
-
-async def upload_podcast_to_pinecone(
-    pinecone_service,
-    podcast_id: str,
-    user_id: str,
-    title: str,
-    subject: Optional[str],
-    podcast_date: Optional[datetime],
-    participants: list,
-    transcript: str,
-    source: str
-) -> Optional[str]:
-    """
-    Upload podcast transcript to Pinecone Assistant for RAG.
-
-    Returns the Pinecone file ID if successful, None otherwise.
-    """
-    # Format transcript with podcast context
-    date_str = podcast_date.strftime("%Y-%m-%d %H:%M") if podcast_date else "Unknown date"
-    participants_str = ", ".join(participants) if participants else "Unknown participants"
-
-    # Create enhanced transcript with podcast metadata embedded
-    enhanced_transcript = f"""## Podcast Information
-- **Subject:** {subject or title}
-- **Date:** {date_str}
-- **Source:** {source.capitalize()}
-- **Participants:** {participants_str}
-
-## Transcript
-
-{transcript}
-"""
-
-    # Upload to Pinecone using existing method
-    # video_id parameter is used as the content identifier
-    try:
-        result = await pinecone_service.upload_transcript(
-            user_id=user_id,
-            video_id=f"podcast_{podcast_id}",  # Use podcast prefix for identification
-            title=title,
-            transcript=enhanced_transcript,
-            metadata={
-                "type": "podcast",
-                "source": source,
-                "podcast_id": podcast_id,
-                "subject": subject,
-                "podcast_date": date_str,
-                "participants": participants_str
-            }
-        )
-        if result.get("success"):
-            return result.get("file_id")
-        else:
-            logger.error(f"Pinecone upload failed: {result.get('error')}")
-            return None
-    except Exception as e:
-        logger.error(f"Pinecone upload failed for podcast {podcast_id}: {e}")
-        return None
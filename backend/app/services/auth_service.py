@@ -9,7 +9,7 @@ Handles user authentication including:
 """
 import os
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, TYPE_CHECKING
 import httpx
 from jose import jwt, JWTError
@@ -78,17 +78,18 @@ class AuthService:
         Returns:
             JWT token string
         """
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
+            expire = now + timedelta(
                 minutes=self.access_token_expire_minutes
             )
 
         payload = {
             "sub": user_id,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "access"
         }
 
@@ -4,9 +4,11 @@ Database Service - Railway PostgreSQL Integration
 Handles all database operations using asyncpg and SQLAlchemy async.
 """
 import os
+import base64
+import json
 import logging
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -18,12 +20,17 @@ load_dotenv(env_path)
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, select, update, delete, text, UniqueConstraint, func
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, select, update, delete, text, UniqueConstraint, func, and_, or_
 from sqlalchemy.dialects.postgresql import UUID
 
 logger = logging.getLogger(__name__)
 
 
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime (columns are TIMESTAMP WITHOUT TIME ZONE)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 # SQLAlchemy Base
 class Base(DeclarativeBase):
     pass
@@ -48,8 +55,8 @@ class UserModel(Base):
     plan_type = Column(String(20), default="free")
     plan_limits = Column(JSON, default={})
     pinecone_namespace = Column(String(100), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
 
 class VideoGroupModel(Base):
@@ -61,8 +68,8 @@ class VideoGroupModel(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     color = Column(String(7), default="#3B82F6")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
 
 class VideoModel(Base):
@@ -83,8 +90,8 @@ class VideoModel(Base):
     # Summary caching - stores generated summary to avoid repeated LLM calls
     summary_data = Column(JSON, nullable=True)  # Full structured summary as JSON
     summary_generated_at = Column(DateTime, nullable=True)  # When summary was generated
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
 
 class SubscriptionModel(Base):
@@ -101,8 +108,8 @@ class SubscriptionModel(Base):
     current_period_end = Column(DateTime, nullable=True)
     cancel_at_period_end = Column(Boolean, default=False)
     cancelled_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
     extra_data = Column(JSON, nullable=True)
 
 
@@ -129,8 +136,8 @@ class PodcastModel(Base):
     # Summary caching
     summary_data = Column(JSON, nullable=True)
     summary_generated_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
 
 class TranscriptModel(Base):
@@ -177,8 +184,8 @@ class TranscriptModel(Base):
     source_metadata = Column(JSON, default={})
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utc_now)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
     # Unique constraint: one transcript per (user, source_type, external_id)
     # This prevents duplicates like the same YouTube video being added twice
@@ -490,7 +497,7 @@ class DatabaseService:
                 .values(
                     authorizer_user_id=authorizer_user_id,
                     auth_provider='authorizer',
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return result.rowcount > 0
@@ -498,7 +505,7 @@ class DatabaseService:
     async def update_user(self, user_id: str, updates: Dict[str, Any]) -> bool:
         """Update user fields"""
         async with self.get_session() as session:
-            updates["updated_at"] = datetime.utcnow()
+            updates["updated_at"] = utc_now()
             await session.execute(
                 update(UserModel)
                 .where(UserModel.id == uuid.UUID(user_id))
@@ -509,7 +516,7 @@ class DatabaseService:
     async def update_user_by_email(self, email: str, updates: Dict[str, Any]) -> bool:
         """Update user fields by email address"""
         async with self.get_session() as session:
-            updates["updated_at"] = datetime.utcnow()
+            updates["updated_at"] = utc_now()
             result = await session.execute(
                 update(UserModel)
                 .where(UserModel.email == email.lower())
@@ -662,7 +669,7 @@ class DatabaseService:
                 )
                 .values(
                     group_id=uuid.UUID(group_id) if group_id else None,
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return True
@@ -675,7 +682,7 @@ class DatabaseService:
                 .where(VideoModel.id == uuid.UUID(video_id))
                 .values(
                     pinecone_file_id=pinecone_file_id,
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return True
@@ -698,6 +705,7 @@ class DatabaseService:
             True if saved successfully
         """
         async with self.get_session() as session:
+            now = utc_now()
             result = await session.execute(
                 update(VideoModel)
                 .where(
@@ -706,8 +714,8 @@ class DatabaseService:
                 )
                 .values(
                     summary_data=summary_data,
-                    summary_generated_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+                    summary_generated_at=now,
+                    updated_at=now
                 )
             )
             return result.rowcount > 0
@@ -770,7 +778,7 @@ class DatabaseService:
                 .values(
                     summary_data=None,
                     summary_generated_at=None,
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return True
@@ -797,6 +805,7 @@ class DatabaseService:
             True if saved successfully
         """
         async with self.get_session() as session:
+            now = utc_now()
             result = await session.execute(
                 update(PodcastModel)
                 .where(
@@ -805,8 +814,8 @@ class DatabaseService:
                 )
                 .values(
                     summary_data=summary_data,
-                    summary_generated_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+                    summary_generated_at=now,
+                    updated_at=now
                 )
             )
             return result.rowcount > 0
@@ -954,7 +963,7 @@ class DatabaseService:
     async def update_group(self, group_id: str, user_id: str, updates: Dict[str, Any]) -> bool:
         """Update group fields"""
         async with self.get_session() as session:
-            updates["updated_at"] = datetime.utcnow()
+            updates["updated_at"] = utc_now()
             await session.execute(
                 update(VideoGroupModel)
                 .where(
@@ -1031,7 +1040,7 @@ class DatabaseService:
                 existing.paddle_customer_id = paddle_customer_id
                 existing.current_period_start = current_period_start
                 existing.current_period_end = current_period_end
-                existing.updated_at = datetime.utcnow()
+                existing.updated_at = utc_now()
                 await session.flush()
                 return self._subscription_to_dict(existing)
             else:
@@ -1067,7 +1076,7 @@ class DatabaseService:
     ) -> bool:
         """Update subscription by Paddle subscription ID"""
         async with self.get_session() as session:
-            updates["updated_at"] = datetime.utcnow()
+            updates["updated_at"] = utc_now()
             result = await session.execute(
                 update(SubscriptionModel)
                 .where(SubscriptionModel.paddle_subscription_id == paddle_subscription_id)
@@ -1199,40 +1208,124 @@ class DatabaseService:
         group_id: Optional[str] = None,
         source: Optional[str] = None,
         offset: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        after_cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """List podcasts for a user"""
+        """List podcasts for a user.
+
+        Pages either by offset or, when `after_cursor` is given, by keyset on the
+        sort key (podcast_date, created_at, id) so deep pages cost O(limit)
+        instead of walking and discarding `offset` rows.
+
+        Raises:
+            ValueError: If after_cursor is malformed
+        """
         async with self.get_session() as session:
-            query = select(PodcastModel).where(PodcastModel.user_id == uuid.UUID(user_id))
+            filters = [PodcastModel.user_id == uuid.UUID(user_id)]
 
             if group_id:
-                query = query.where(PodcastModel.group_id == uuid.UUID(group_id))
+                filters.append(PodcastModel.group_id == uuid.UUID(group_id))
 
             if source:
-                query = query.where(PodcastModel.source == source)
+                filters.append(PodcastModel.source == source)
 
-            # Get total count
-            count_query = select(PodcastModel.id).where(PodcastModel.user_id == uuid.UUID(user_id))
-            if group_id:
-                count_query = count_query.where(PodcastModel.group_id == uuid.UUID(group_id))
-            if source:
-                count_query = count_query.where(PodcastModel.source == source)
+            order_by = (
+                PodcastModel.podcast_date.desc().nulls_last(),
+                PodcastModel.created_at.desc(),
+                PodcastModel.id.desc()
+            )
 
-            count_result = await session.execute(count_query)
-            total = len(count_result.all())
+            if after_cursor:
+                # Keyset page - total is a plain count, the page seeks past the cursor
+                count_result = await session.execute(
+                    select(func.count()).select_from(PodcastModel).where(*filters)
+                )
+                total = count_result.scalar_one()
 
-            # Get paginated results
-            query = query.order_by(PodcastModel.podcast_date.desc().nulls_last(), PodcastModel.created_at.desc()).offset(offset).limit(limit)
-            result = await session.execute(query)
-            podcasts = result.scalars().all()
+                query = (
+                    select(PodcastModel)
+                    .where(*filters, self._podcast_after_cursor(after_cursor))
+                    .order_by(*order_by)
+                    .limit(limit + 1)
+                )
+                result = await session.execute(query)
+                podcasts = list(result.scalars().all())
+                offset = 0
+            else:
+                # Get the page and the total count in one query via COUNT(*) OVER ()
+                query = (
+                    select(PodcastModel, func.count().over().label("total"))
+                    .where(*filters)
+                    .order_by(*order_by)
+                    .offset(offset)
+                    .limit(limit + 1)
+                )
+                result = await session.execute(query)
+                rows = result.all()
+                podcasts = [row.PodcastModel for row in rows]
+
+                if rows:
+                    total = rows[0].total
+                elif offset > 0:
+                    # Page past the end - the window count has no row to ride on
+                    count_result = await session.execute(
+                        select(func.count()).select_from(PodcastModel).where(*filters)
+                    )
+                    total = count_result.scalar_one()
+                else:
+                    total = 0
+
+            # The extra row only tells us whether another page exists
+            has_more = len(podcasts) > limit
+            podcasts = podcasts[:limit]
 
             return {
                 "podcasts": [self._podcast_to_dict(m) for m in podcasts],
                 "total": total,
                 "offset": offset,
-                "limit": limit
+                "limit": limit,
+                "next_cursor": self._encode_podcast_cursor(podcasts[-1]) if has_more else None
             }
 
+    @staticmethod
+    def _encode_podcast_cursor(podcast: PodcastModel) -> str:
+        """Encode a podcast's sort key as an opaque pagination cursor"""
+        key = {
+            "podcast_date": podcast.podcast_date.isoformat() if podcast.podcast_date else None,
+            "created_at": podcast.created_at.isoformat(),
+            "id": str(podcast.id)
+        }
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+    @staticmethod
+    def _podcast_after_cursor(cursor: str):
+        """Keyset condition selecting podcasts that sort after the cursor.
+
+        Mirrors ORDER BY podcast_date DESC NULLS LAST, created_at DESC, id DESC.
+        """
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            podcast_date = datetime.fromisoformat(key["podcast_date"]) if key["podcast_date"] else None
+            created_at = datetime.fromisoformat(key["created_at"])
+            podcast_id = uuid.UUID(key["id"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {e}")
+
+        tie_break = or_(
+            PodcastModel.created_at < created_at,
+            and_(PodcastModel.created_at == created_at, PodcastModel.id < podcast_id)
+        )
+
+        if podcast_date is None:
+            # Cursor is inside the trailing NULL podcast_date block
+            return and_(PodcastModel.podcast_date.is_(None), tie_break)
+
+        return or_(
+            PodcastModel.podcast_date < podcast_date,
+            and_(PodcastModel.podcast_date == podcast_date, tie_break),
+            PodcastModel.podcast_date.is_(None)
+        )
+
     async def delete_podcast(self, podcast_id: str, user_id: str) -> bool:
         """Delete a podcast"""
         async with self.get_session() as session:
@@ -1255,11 +1348,40 @@ class DatabaseService:
                 )
                 .values(
                     group_id=uuid.UUID(group_id) if group_id else None,
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return True
 
+    async def update_podcast_transcript(
+        self, podcast_id: str, user_id: str, transcript: str
+    ) -> Optional[Dict[str, Any]]:
+        """Replace a podcast's transcript (with user ownership check) and return the updated row.
+
+        Single UPDATE ... RETURNING round-trip; returns None if the podcast
+        does not exist or belongs to another user.
+        """
+        async with self.get_session() as session:
+            result = await session.execute(
+                update(PodcastModel)
+                .where(
+                    PodcastModel.id == uuid.UUID(podcast_id),
+                    PodcastModel.user_id == uuid.UUID(user_id)
+                )
+                .values(
+                    transcript=transcript,
+                    transcript_length=len(transcript),
+                    updated_at=utc_now()
+                )
+                .returning(PodcastModel)
+            )
+            podcast = result.scalar_one_or_none()
+
+            if not podcast:
+                return None
+
+            return self._podcast_to_dict(podcast)
+
     async def update_podcast_pinecone_id(self, podcast_id: str, pinecone_file_id: str) -> bool:
         """Update podcast's Pinecone file ID after upload"""
         async with self.get_session() as session:
@@ -1268,7 +1390,7 @@ class DatabaseService:
                 .where(PodcastModel.id == uuid.UUID(podcast_id))
                 .values(
                     pinecone_file_id=pinecone_file_id,
-                    updated_at=datetime.utcnow()
+                    updated_at=utc_now()
                 )
             )
             return True
@@ -1281,6 +1403,7 @@ class DatabaseService:
     ) -> bool:
         """Save generated summary to database for caching"""
         async with self.get_session() as session:
+            now = utc_now()
             result = await session.execute(
                 update(PodcastModel)
                 .where(
@@ -1289,8 +1412,8 @@ class DatabaseService:
                 )
                 .values(
                     summary_data=summary_data,
-                    summary_generated_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
+                    summary_generated_at=now,
+                    updated_at=now
                 )
             )
             return result.rowcount > 0
@@ -1,7 +1,9 @@
 """
 Podcast Service - Business logic for podcast transcript operations
 """
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -10,6 +12,15 @@ from app.services.pinecone_service import PineconeService, get_pinecone_service
 
 logger = logging.getLogger(__name__)
 
+# Background workers uploading new podcasts to Pinecone
+PINECONE_UPLOAD_WORKERS = 4
+# How long shutdown waits for queued uploads before cancelling them
+PINECONE_UPLOAD_DRAIN_TIMEOUT_SECONDS = 30
+# Quiet period before a user's pending uploads are flushed (collapses bulk-sync bursts)
+PINECONE_UPLOAD_DEBOUNCE_SECONDS = 3
+# Longest a pending upload waits, so steady uploading cannot postpone indexing indefinitely
+PINECONE_UPLOAD_MAX_DELAY_SECONDS = 30
+
 
 class PodcastService:
     """Service for podcast transcript operations"""
@@ -18,6 +29,16 @@ class PodcastService:
         self.db: Optional[DatabaseService] = None
         self.pinecone: Optional[PineconeService] = None
 
+        # Pinecone uploads run in the background so create_podcast returns immediately
+        self._upload_queue: Optional[asyncio.Queue] = None
+        self._upload_workers: List[asyncio.Task] = []
+
+        # Per-user uploads waiting out the debounce window, keyed by podcast ID
+        self._pending_uploads: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._flush_timers: Dict[str, asyncio.Task] = {}
+        # Event-loop time of each user's oldest pending upload (caps the debounce)
+        self._pending_since: Dict[str, float] = {}
+
     def set_database(self, db: DatabaseService):
         """Set database service instance"""
         self.db = db
@@ -26,6 +47,12 @@ class PodcastService:
         """Set Pinecone service instance"""
         self.pinecone = pinecone
 
+    def _get_pinecone(self) -> PineconeService:
+        """Get the Pinecone service, resolving and caching the singleton on first use"""
+        if self.pinecone is None:
+            self.pinecone = get_pinecone_service()
+        return self.pinecone
+
     async def create_podcast(
         self,
         user_id: str,
@@ -98,12 +125,12 @@ class PodcastService:
             group_id=group_id
         )
 
-        # Upload to Pinecone for RAG search
+        # Queue upload to Pinecone for RAG search (pinecone_file_id is set once it completes)
         if upload_to_pinecone and transcript:
             try:
-                pinecone = self.pinecone or get_pinecone_service()
+                pinecone = self._get_pinecone()
                 if pinecone.is_initialized():
-                    pinecone_result = await self._upload_to_pinecone(
+                    self.queue_pinecone_upload(
                         podcast_id=podcast["id"],
                         user_id=user_id,
                         title=title,
@@ -113,14 +140,8 @@ class PodcastService:
                         transcript=transcript,
                         source=source
                     )
-                    if pinecone_result:
-                        await self.db.update_podcast_pinecone_id(
-                            podcast["id"],
-                            pinecone_result
-                        )
-                        podcast["pinecone_file_id"] = pinecone_result
             except Exception as e:
-                logger.error(f"Failed to upload podcast to Pinecone: {e}")
+                logger.error(f"Failed to queue podcast upload to Pinecone: {e}")
                 # Podcast is still created, just not searchable via RAG
 
         return {
@@ -128,6 +149,89 @@ class PodcastService:
             "podcast": podcast
         }
 
+    def queue_pinecone_upload(self, **upload_kwargs):
+        """
+        Schedule a podcast upload to Pinecone in the background.
+
+        Uploads are debounced per user: they are held until the user has had no new
+        uploads for PINECONE_UPLOAD_DEBOUNCE_SECONDS, and repeated uploads of the same
+        podcast within the window collapse to the latest version. Bulk syncs
+        (e.g. Fireflies backfills) therefore flush as one burst. No upload waits longer
+        than PINECONE_UPLOAD_MAX_DELAY_SECONDS after the first one pending for the user.
+
+        Args:
+            upload_kwargs: Arguments for _upload_to_pinecone (podcast_id, user_id, title, ...)
+        """
+        user_id = upload_kwargs["user_id"]
+        self._pending_uploads.setdefault(user_id, {})[upload_kwargs["podcast_id"]] = upload_kwargs
+
+        now = asyncio.get_running_loop().time()
+        deadline = self._pending_since.setdefault(user_id, now) + PINECONE_UPLOAD_MAX_DELAY_SECONDS
+        delay = min(PINECONE_UPLOAD_DEBOUNCE_SECONDS, max(deadline - now, 0))
+
+        timer = self._flush_timers.get(user_id)
+        if timer is not None:
+            timer.cancel()
+        self._flush_timers[user_id] = asyncio.create_task(self._flush_pending_uploads(user_id, delay))
+
+    async def _flush_pending_uploads(self, user_id: str, delay: float):
+        """Move a user's pending uploads onto the worker queue after `delay` seconds"""
+        await asyncio.sleep(delay)
+        self._flush_timers.pop(user_id, None)
+        self._pending_since.pop(user_id, None)
+        for upload_kwargs in self._pending_uploads.pop(user_id, {}).values():
+            self._enqueue_pinecone_upload(**upload_kwargs)
+
+    def _enqueue_pinecone_upload(self, **upload_kwargs):
+        """Queue a Pinecone upload, starting the background workers on first use"""
+        if self._upload_queue is None:
+            self._upload_queue = asyncio.Queue()
+        if not self._upload_workers:
+            self._upload_workers = [
+                asyncio.create_task(self._pinecone_upload_worker())
+                for _ in range(PINECONE_UPLOAD_WORKERS)
+            ]
+        self._upload_queue.put_nowait(upload_kwargs)
+
+    async def _pinecone_upload_worker(self):
+        """Upload queued podcasts to Pinecone and record their file IDs"""
+        while True:
+            upload_kwargs = await self._upload_queue.get()
+            podcast_id = upload_kwargs["podcast_id"]
+            try:
+                file_id = await self._upload_to_pinecone(**upload_kwargs)
+                if file_id:
+                    await self.db.update_podcast_pinecone_id(podcast_id, file_id)
+                    logger.info(f"Podcast {podcast_id} uploaded to Pinecone: {file_id}")
+            except Exception as e:
+                logger.error(f"Failed to upload podcast {podcast_id} to Pinecone: {e}")
+            finally:
+                self._upload_queue.task_done()
+
+    async def shutdown(self):
+        """Flush debounced uploads, wait briefly for the queue to drain, then stop the workers"""
+        for timer in self._flush_timers.values():
+            timer.cancel()
+        self._flush_timers = {}
+        for pending in self._pending_uploads.values():
+            for upload_kwargs in pending.values():
+                self._enqueue_pinecone_upload(**upload_kwargs)
+        self._pending_uploads = {}
+        self._pending_since = {}
+
+        if not self._upload_workers:
+            return
+
+        try:
+            await asyncio.wait_for(self._upload_queue.join(), PINECONE_UPLOAD_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self._upload_queue.qsize()} Pinecone uploads still queued at shutdown")
+
+        for worker in self._upload_workers:
+            worker.cancel()
+        await asyncio.gather(*self._upload_workers, return_exceptions=True)
+        self._upload_workers = []
+
     async def _upload_to_pinecone(
         self,
         podcast_id: str,
@@ -140,7 +244,7 @@ class PodcastService:
         source: str
     ) -> Optional[str]:
         """Upload podcast transcript to Pinecone"""
-        pinecone = self.pinecone or get_pinecone_service()
+        pinecone = self._get_pinecone()
 
         date_str = podcast_date.strftime("%Y-%m-%d %H:%M") if podcast_date else "Unknown date"
         participants_str = ", ".join(participants) if participants else "Unknown participants"
@@ -197,9 +301,14 @@ class PodcastService:
         group_id: Optional[str] = None,
         source: Optional[str] = None,
         page: int = 1,
-        per_page: int = 20
+        per_page: int = 20,
+        after_cursor: Optional[str] = None
     ) -> Dict[str, Any]:
-        """List podcasts for a user with pagination"""
+        """List podcasts for a user with pagination.
+
+        Pass `after_cursor` (the previous page's next_cursor) for keyset paging,
+        which stays fast on deep pages; `page` is then ignored.
+        """
         if not self.db:
             raise RuntimeError("Database service not configured")
 
@@ -209,7 +318,8 @@ class PodcastService:
             group_id=group_id,
             source=source,
             offset=offset,
-            limit=per_page
+            limit=per_page,
+            after_cursor=after_cursor
         )
 
         return {
@@ -217,7 +327,8 @@ class PodcastService:
             "total": result["total"],
             "page": page,
             "per_page": per_page,
-            "has_more": offset + len(result["podcasts"]) < result["total"]
+            "has_more": result["next_cursor"] is not None,
+            "next_cursor": result["next_cursor"]
         }
 
     async def delete_podcast(
@@ -237,7 +348,7 @@ class PodcastService:
         # Delete from Pinecone if uploaded
         if podcast.get("pinecone_file_id"):
             try:
-                pinecone = self.pinecone or get_pinecone_service()
+                pinecone = self._get_pinecone()
                 await pinecone.delete_file(podcast["pinecone_file_id"])
             except Exception as e:
                 logger.warning(f"Failed to delete Pinecone file: {e}")
@@ -279,34 +390,15 @@ class PodcastService:
         if not self.db:
             raise RuntimeError("Database service not configured")
 
-        # Get existing podcast
-        podcast = await self.db.get_podcast(podcast_id, user_id, include_transcript=True)
+        # Update transcript in database (ownership checked in the same statement)
+        podcast = await self.db.update_podcast_transcript(podcast_id, user_id, transcript)
         if not podcast:
             return {"success": False, "error": "Podcast not found"}
 
-        # Update transcript in database
-        async with self.db.get_session() as session:
-            from sqlalchemy import update
-            from app.services.database_service import PodcastModel
-            import uuid
-
-            await session.execute(
-                update(PodcastModel)
-                .where(
-                    PodcastModel.id == uuid.UUID(podcast_id),
-                    PodcastModel.user_id == uuid.UUID(user_id)
-                )
-                .values(
-                    transcript=transcript,
-                    transcript_length=len(transcript),
-                    updated_at=datetime.utcnow()
-                )
-            )
-
         # Re-upload to Pinecone
         if re_upload_to_pinecone:
             try:
-                pinecone = self.pinecone or get_pinecone_service()
+                pinecone = self._get_pinecone()
 
                 # Delete old file if exists
                 if podcast.get("pinecone_file_id"):
@@ -329,25 +421,19 @@ class PodcastService:
 
                 if new_file_id:
                     await self.db.update_podcast_pinecone_id(podcast_id, new_file_id)
+                    podcast["pinecone_file_id"] = new_file_id
 
             except Exception as e:
                 logger.error(f"Failed to re-upload transcript to Pinecone: {e}")
 
-        # Get updated podcast
-        updated = await self.db.get_podcast(podcast_id, user_id)
-        return {"success": True, "podcast": updated}
+        return {"success": True, "podcast": podcast}
 
 
 # =============================================================================
 # Singleton Instance
 # =============================================================================
 
-_podcast_service: Optional[PodcastService] = None
-
-
+@lru_cache()
 def get_podcast_service() -> PodcastService:
     """Get or create podcast service singleton"""
-    global _podcast_service
-    if _podcast_service is None:
-        _podcast_service = PodcastService()
-    return _podcast_service
+    return PodcastService()
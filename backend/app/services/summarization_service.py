@@ -6,13 +6,16 @@ Implements a hybrid Map-Reduce + Refine approach for high-quality video transcri
 NEW ARCHITECTURE (v2):
 1. Fixed-Size Chunking - Split transcript into ~2000 token chunks with 15% overlap
 2. MAP Step - Summarize each chunk independently (parallelizable)
-3. REFINE Step - Sequentially assemble chunk summaries with context passing
+3. REFINE Step - Merge adjacent chunk summaries pairwise in concurrent rounds
 4. Section Grouping - Group chunks into logical sections, generate titles from content
 5. Final Consolidation - Remove redundancy using GPT-4o
+   (short videos of up to 8 chunks do steps 3-5 in one GPT-4o call)
 
 LEGACY ARCHITECTURE (v1 - preserved for backward compatibility):
 1. Topic Detection - Identifies distinct sections/topics in the transcript
 2. Chain of Density (CoD) - Iteratively refines summaries for information density
+   (transcripts under ~750 tokens skip topic detection and get one CoD call)
+3. Finalization - Executive summary and Delta Consolidation in one GPT-4o call
 
 This approach minimizes hallucinations while preserving key details and ensuring full coverage.
 """
@@ -20,63 +23,712 @@ import logging
 import json
 import re
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
-from openai import AsyncOpenAI
+import copy
+import hashlib
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Awaitable, Callable, TypeVar
+import httpx
+import orjson
+from cachetools import LRUCache
+from pydantic import BaseModel, ConfigDict, ValidationError
+from openai import AsyncOpenAI, AuthenticationError, NotFoundError, PermissionDeniedError
 
 from app.settings import get_settings
+from app.services.summary_cache import SemanticCache, SqliteResultStore, SummaryResultCache
 
 logger = logging.getLogger(__name__)
 
+
+class LLMUnrecoverableError(RuntimeError):
+    """An LLM failure that will repeat on every call (bad key, no access, unknown model)"""
+
+
+# API errors that retrying or moving to the next chunk cannot fix
+_FATAL_LLM_ERRORS = (AuthenticationError, PermissionDeniedError, NotFoundError)
+
+T = TypeVar("T")
+
+# LLM response cache hits/misses and failed LLM calls for the summary being generated in
+# this context (child tasks share the dict, so concurrent chunk and section calls all count)
+_llm_cache_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar("llm_cache_stats", default=None)
+# Set for a forced regeneration: LLM calls in this context skip cached responses (and refresh them)
+_llm_cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+
+def _note_llm_error() -> None:
+    """Count a failed LLM call against the current summary (its fallback output is not cached)"""
+    stats = _llm_cache_stats.get()
+    if stats is not None:
+        stats["llm_errors"] += 1
+
+
+# Shared default for .get() lookups that are only iterated (no empty list allocated per miss)
+_EMPTY: Tuple[()] = ()
+
 # ============================================================================
 # CONSTANTS FOR CHUNKING
 # ============================================================================
 
-# Target chunk size in characters (roughly 2000 tokens = ~8000 chars)
-CHUNK_SIZE_CHARS = 8000
+# Target chunk size in tokens
+CHUNK_SIZE_TOKENS = 2000
 # Overlap between chunks (15%)
-CHUNK_OVERLAP_CHARS = 1200
-# Minimum chunk size to avoid tiny fragments
+CHUNK_OVERLAP_TOKENS = 300
+# Minimum chunk size in characters to avoid tiny fragments
 MIN_CHUNK_SIZE = 500
+# Heuristic used when tiktoken is unavailable (~4 chars per token for English)
+CHARS_PER_TOKEN = 4
+# tiktoken encoding used by gpt-4o-mini / gpt-4o family for chunk sizing
+TOKEN_ENCODING_NAME = "o200k_base"
+# Seconds to wait before retrying a tiktoken encoding that failed to download
+TOKEN_ENCODER_RETRY_SECONDS = 60
+
+# Bump when prompts or pipeline output change, so cached summaries are not reused
+SUMMARY_PROMPT_VERSION = "17"
+
+# Entities from earlier sections listed as base facts in the context-aware prompt
+MAX_CONTEXT_ENTITIES = 10
+
+# Key points this similar (Jaccard over character 5-grams) are merged locally before the MMR LLM pass
+KEY_POINT_SHINGLE_SIZE = 5
+KEY_POINT_DUPLICATE_THRESHOLD = 0.7
+
+# ============================================================================
+# CONSTANTS FOR LLM CALLS
+# ============================================================================
+
+# Maximum concurrent LLM calls during the MAP step
+MAX_CONCURRENT_LLM_CALLS = 5
+# Characters of chunk content sent to the MAP prompt (and embedded for the semantic cache)
+MAX_CHUNK_PROMPT_CHARS = 8000
+# Tokens of section content sent to the Chain of Density prompt (and embedded for the semantic cache);
+# ~8000 characters of English, but the same budget for CJK or emoji-heavy transcripts
+MAX_SECTION_PROMPT_TOKENS = 2000
+# Tokens of transcript sent to topic detection (~16000 characters of English)
+TOPIC_DETECTION_MAX_TOKENS = 4000
+# v1 transcripts under this many tokens are summarized as one section in a single Chain of Density call
+SINGLE_SECTION_MAX_TOKENS = 750
+# Videos with at most this many chunks assemble sections, executive summary and
+# consolidation in one LLM call instead of refine + group + executive + consolidate
+SMALL_VIDEO_MAX_CHUNKS = 8
+# REFINE does a single REDUCE call when all chunk summaries fit in this many tokens
+# (well under the 128K context of gpt-4o-mini, leaving room for the response)
+REDUCE_MAX_INPUT_TOKENS = 60000
+# Chunks folded into one MAP request, and how many of those heavier requests run at once
+CHUNK_GROUP_SIZE = 4
+MAX_CONCURRENT_CHUNK_GROUPS = 3
+# Exact-match LLM response cache; only low-temperature calls are close enough to deterministic
+LLM_RESPONSE_CACHE_SIZE = 2048
+LLM_CACHE_MAX_TEMPERATURE = 0.3
+# Response cap for the single-call podcast/meeting summary (a handful of short lists)
+PODCAST_SUMMARY_MAX_TOKENS = 2000
+# Response caps for v1 calls with small, bounded outputs. OpenAI counts max_tokens against the
+# tokens-per-minute limit when a request is admitted, so the 4000 default would reserve several
+# times what these calls generate and throttle concurrent sections early.
+TOPIC_DETECTION_MAX_OUTPUT_TOKENS = 1500
+SECTION_SUMMARY_MAX_OUTPUT_TOKENS = 1500
+EXECUTIVE_SUMMARY_MAX_OUTPUT_TOKENS = 1000
+# Batch API polling (exponential backoff up to the 24h completion window)
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 300.0
+BATCH_MAX_WAIT_SECONDS = 24 * 60 * 60
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+# Per-request timeout and client-side retries (avoids default retry storms)
+LLM_REQUEST_TIMEOUT_SECONDS = 60.0
+# Fail fast on unreachable hosts so the SDK retry gets a fresh connection instead of waiting out the full timeout
+LLM_CONNECT_TIMEOUT_SECONDS = 5.0
+# Pause new OpenAI calls until the window resets when fewer than this many requests/tokens remain
+LLM_RATE_LIMIT_MIN_REMAINING_REQUESTS = 2
+LLM_RATE_LIMIT_MIN_REMAINING_TOKENS = 8000
+# Large-context OpenRouter prompts can take minutes before the first streamed token
+OPENROUTER_REQUEST_TIMEOUT_SECONDS = 300.0
+LLM_MAX_RETRIES = 3
+LLM_SYSTEM_MESSAGE = "You are a helpful assistant that outputs only valid JSON."
+# Second attempt after an unparseable response, which is usually an answer cut off by max_tokens
+LLM_COMPACT_JSON_SYSTEM_MESSAGE = (
+    "You are a helpful assistant that outputs only valid JSON. Output a single compact JSON object "
+    "with no markdown, and keep every string short enough for the whole object to fit."
+)
+# Responses longer than this (batched section summaries, large-context output) are parsed off the event loop
+LLM_JSON_THREAD_PARSE_CHARS = 32 * 1024
+# Connection pool for the shared HTTP client (keep-alive avoids a TLS handshake per chunk).
+# Sized for several videos summarizing at once on the shared service instance.
+LLM_MAX_CONNECTIONS = 200
+LLM_MAX_KEEPALIVE_CONNECTIONS = 100
+# Keep idle connections past the gap between MAP, REFINE and assembly calls (httpx default is 5s)
+LLM_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# ============================================================================
+# PRECOMPILED PATTERNS / PARSERS
+# ============================================================================
+
+# Digits accepted by the timestamp scanner in _index_timestamps ([0:00], 0:00, (0:00), 1:02:03)
+_ASCII_DIGITS = frozenset("0123456789")
+# Markdown code fence wrapping a JSON payload (```json ... ``` or ``` ... ```)
+_CODE_FENCE_RE = re.compile(r'^```[\w-]*[ \t]*\n?(.*?)\n?```$', re.DOTALL)
+# Outermost JSON object when the model adds prose around it
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+# Sentence end (. ! ?) followed by a space or newline, used to snap chunk ends
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?][ \n]')
+_LEADING_WHITESPACE_RE = re.compile(r'\s*')
+# Components of an OpenAI rate-limit reset duration ("6m0s", "1.5s", "20ms")
+_RATE_LIMIT_RESET_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+# Punctuation and whitespace runs, collapsed before shingling key points
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _parse_llm_json(content: str) -> Dict[str, Any]:
+    """Parse an LLM response into a dict, tolerating code fences and surrounding prose.
+
+    Decoding uses orjson, which parses the large nested summary payloads several
+    times faster than the stdlib decoder.
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON object can be decoded
+            (orjson.JSONDecodeError is a subclass)
+    """
+    content = content.strip()
+    fence_match = _CODE_FENCE_RE.match(content)
+    if fence_match:
+        content = fence_match.group(1).strip()
+    if not content.startswith("{"):
+        object_match = _JSON_OBJECT_RE.search(content)
+        if object_match:
+            content = object_match.group(0)
+    return orjson.loads(content)
+
+
+async def _parse_llm_json_async(content: str) -> Dict[str, Any]:
+    """_parse_llm_json, run in a worker thread for payloads large enough to stall the event loop"""
+    if len(content) > LLM_JSON_THREAD_PARSE_CHARS:
+        return await asyncio.to_thread(_parse_llm_json, content)
+    return _parse_llm_json(content)
+
+
+class _StreamedArrayItems:
+    """Pull the objects of one JSON array out of a streamed LLM response as they close.
+
+    Tracks brace depth (ignoring braces inside strings) so each item can be
+    decoded while the rest of the response is still generating.
+    """
+
+    def __init__(self, key: str):
+        self._opening = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._buffer = ""
+        self._pos = -1  # Scan position in _buffer; -1 until the array opens
+        self._item_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.done = False
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """Consume the next piece of the stream, returning the items it completed"""
+        items: List[Dict[str, Any]] = []
+        if self.done:
+            return items
+        self._buffer += delta
+        if self._pos < 0:
+            match = self._opening.search(self._buffer)
+            if not match:
+                return items
+            self._buffer = self._buffer[match.end():]
+            self._pos = 0
+
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._item_start = i
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        items.append(orjson.loads(buffer[self._item_start:i + 1]))
+                    except orjson.JSONDecodeError:
+                        pass  # The full-response parse still sees it
+            elif ch == "]" and self._depth == 0:
+                self.done = True
+                break
+            i += 1
+
+        # Keep only the unfinished item so the buffer never holds the whole response
+        keep_from = self._item_start if self._depth else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        self._item_start = 0
+        return items
+
+
+def _timestamp_to_seconds(time_str: str) -> int:
+    """Convert MM:SS or HH:MM:SS to seconds"""
+    parts = time_str.split(":")
+    if len(parts) == 2:
+        return int(parts[0]) * 60 + int(parts[1])
+    elif len(parts) == 3:
+        return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+    return 0
+
+
+def _index_timestamps(transcript: str) -> Tuple[List[int], List[int]]:
+    """
+    Scan a transcript's timestamps once for binary search by section.
+
+    Returns parallel lists of seconds and character offsets. Seconds are a
+    running maximum, so they stay sorted even if the transcript has an
+    out-of-order stamp, and bisect finds the first stamp at or after a time.
+
+    Matches `[M:SS]`, `MM:SS` and `H:MM:SS` (optional brackets) like a regex
+    would, but jumps between colons with str.find and converts the digits in
+    place, avoiding a match object and a split per stamp.
+    """
+    seconds: List[int] = []
+    offsets: List[int] = []
+    latest = 0
+    # Characters before this were consumed by the previous stamp
+    floor = 0
+    n = len(transcript)
+    find = transcript.find
+    pos = find(":")
+    while pos != -1:
+        if (
+            pos > floor and pos + 2 < n
+            and transcript[pos - 1] in _ASCII_DIGITS
+            and transcript[pos + 1] in _ASCII_DIGITS
+            and transcript[pos + 2] in _ASCII_DIGITS
+        ):
+            start = pos - 2 if pos - 1 > floor and transcript[pos - 2] in _ASCII_DIGITS else pos - 1
+            value = int(transcript[start:pos]) * 60 + int(transcript[pos + 1:pos + 3])
+            end = pos + 3
+            if (
+                end + 2 < n and transcript[end] == ":"
+                and transcript[end + 1] in _ASCII_DIGITS
+                and transcript[end + 2] in _ASCII_DIGITS
+            ):
+                value = value * 60 + int(transcript[end + 1:end + 3])
+                end += 3
+            latest = max(latest, value)
+            seconds.append(latest)
+            offsets.append(start - 1 if start > floor and transcript[start - 1] == "[" else start)
+            floor = end
+            pos = find(":", end)
+        else:
+            pos = find(":", pos + 1)
+    return seconds, offsets
+
+
+def _stripped_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Bounds of text[start:end].strip() within `text`, without copying the slice"""
+    start = _LEADING_WHITESPACE_RE.match(text, start, end).end()
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _stripped_length(text: str, start: int, end: int) -> int:
+    """len(text[start:end].strip()) without copying the slice"""
+    start, end = _stripped_bounds(text, start, end)
+    return end - start
+
+
+def _chunk_core(chunk: Dict[str, Any], limit: int = MAX_CHUNK_PROMPT_CHARS) -> str:
+    """
+    Stripped core text of a chunk, capped at `limit` characters.
+
+    Chunks from chunk_transcript carry offsets into the shared transcript and
+    are sliced here; hand-built chunks may carry their text as `content`.
+    """
+    transcript = chunk.get("transcript")
+    if transcript is None:
+        return chunk["content"][:limit]
+    start, end = _stripped_bounds(transcript, chunk["core_start"], chunk["end_pos"])
+    return transcript[start:min(end, start + limit)]
+
+
+def _chunk_prompt_content(chunk: Dict[str, Any]) -> str:
+    """
+    Chunk text for a MAP prompt, capped at MAX_CHUNK_PROMPT_CHARS.
+
+    The overlap with the previous chunk is labelled as context so its points
+    are not extracted twice; the core gets the character budget first.
+    """
+    core = _chunk_core(chunk)
+    transcript = chunk.get("transcript")
+    if transcript is None:
+        return core
+
+    context_start, context_end = _stripped_bounds(transcript, chunk["start_pos"], chunk["core_start"])
+    context_budget = MAX_CHUNK_PROMPT_CHARS - len(core)
+    if context_start == context_end or context_budget <= 0:
+        return core
+    context = transcript[max(context_start, context_end - context_budget):context_end]
+    return (
+        f"[CONTEXT - end of the previous part, for continuity only]\n{context}\n\n"
+        f"[CORE]\n{core}"
+    )
+
+
+def _shingles(text: str, size: int = KEY_POINT_SHINGLE_SIZE) -> frozenset:
+    """Character n-grams of lowercased text with punctuation collapsed to single spaces"""
+    normalized = _NON_WORD_RE.sub(" ", text.lower()).strip()
+    if len(normalized) <= size:
+        return frozenset((normalized,))
+    return frozenset(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+
+def _merge_near_duplicate_points(
+    points: List[str],
+    threshold: float = KEY_POINT_DUPLICATE_THRESHOLD
+) -> List[str]:
+    """
+    Collapse near-verbatim duplicate key points without an LLM call.
+
+    Points whose character-shingle Jaccard similarity to an earlier group reaches
+    `threshold` join that group; each group keeps its longest wording, in
+    first-seen order. Paraphrases with different wording are left to the LLM.
+    """
+    groups: List[List[Any]] = []  # [representative, its shingles]
+    for point in points:
+        shingles = _shingles(point)
+        for group in groups:
+            overlap = len(shingles & group[1])
+            if overlap and overlap / len(shingles | group[1]) >= threshold:
+                if len(point) > len(group[0]):
+                    group[0] = point
+                break
+        else:
+            groups.append([point, shingles])
+    return [group[0] for group in groups]
+
+
+def _dump_prompt_json(value: Any) -> str:
+    """Pretty-print JSON for embedding in a prompt (orjson; non-ASCII kept as-is)"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+class _OrjsonAsyncClient(httpx.AsyncClient):
+    """httpx client that encodes JSON request bodies with orjson.
+
+    The OpenAI SDK hands every request body to build_request as `json=`, so this
+    covers all chat, batch and embedding calls (the large chunk prompts included).
+    """
+
+    def build_request(self, method, url, *, json: Any = None, **kwargs) -> httpx.Request:
+        if json is not None and kwargs.get("content") is None and kwargs.get("data") is None:
+            try:
+                content = orjson.dumps(json)
+            except TypeError:
+                pass  # Something orjson rejects (e.g. non-str keys); let httpx use the stdlib encoder
+            else:
+                headers = httpx.Headers(kwargs.pop("headers", None))
+                headers.setdefault("Content-Type", "application/json")
+                return super().build_request(method, url, content=content, headers=headers, **kwargs)
+        return super().build_request(method, url, json=json, **kwargs)
+
+
+def _build_http_client(on_response: Optional[Callable[[httpx.Response], Awaitable[None]]] = None) -> httpx.AsyncClient:
+    """Create a pooled HTTP client for LLM APIs, using HTTP/2 when `h2` is installed"""
+    limits = httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS
+    )
+    timeout = httpx.Timeout(LLM_REQUEST_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS)
+    event_hooks = {"response": [on_response]} if on_response else None
+    try:
+        return _OrjsonAsyncClient(http2=True, limits=limits, timeout=timeout, event_hooks=event_hooks)
+    except ImportError:
+        logger.warning("h2 package not installed - LLM client using HTTP/1.1. Run: pip install 'httpx[http2]'")
+        return _OrjsonAsyncClient(limits=limits, timeout=timeout, event_hooks=event_hooks)
+
+
+def _parse_reset_seconds(value: Optional[str]) -> float:
+    """Parse an OpenAI x-ratelimit-reset-* duration such as '1s', '6m0s' or '250ms'"""
+    if not value:
+        return 0.0
+    total = 0.0
+    for amount, unit in _RATE_LIMIT_RESET_RE.findall(value):
+        total += float(amount) * {"h": 3600, "m": 60, "s": 1, "ms": 0.001}[unit]
+    return total
+
+
+_token_encoder = None
+_token_encoder_loaded = False
+_token_encoder_retry_at = 0.0
+_token_encoder_lock = threading.Lock()
+
+# Chunk boundaries keyed by (transcript sha256, chunk_size, overlap)
+_chunk_boundaries_cache: LRUCache = LRUCache(maxsize=64)
+
+
+def _get_token_encoder():
+    """Lazily load the tiktoken encoder, or None if tiktoken is unavailable.
+
+    tiktoken downloads encoding files on first use, so failures (missing package,
+    no network) fall back to the character heuristic instead of breaking summaries.
+    Only success or a missing package is final; a failed download is retried after
+    TOKEN_ENCODER_RETRY_SECONDS. Callers never wait on a load already in progress
+    (see warm_token_encoder) and use the heuristic meanwhile.
+    """
+    global _token_encoder, _token_encoder_loaded, _token_encoder_retry_at
+    if _token_encoder_loaded or time.monotonic() < _token_encoder_retry_at:
+        return _token_encoder
+    if not _token_encoder_lock.acquire(blocking=False):
+        return None
+    try:
+        if not _token_encoder_loaded:
+            import tiktoken
+            _token_encoder = tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+            _token_encoder_loaded = True
+    except ImportError:
+        _token_encoder_loaded = True
+        logger.warning("tiktoken package not installed - using character-based chunking. Run: pip install tiktoken")
+    except Exception as e:
+        _token_encoder_retry_at = time.monotonic() + TOKEN_ENCODER_RETRY_SECONDS
+        logger.warning(f"Failed to load tiktoken encoding, using character-based chunking: {e}")
+    finally:
+        _token_encoder_lock.release()
+    return _token_encoder
+
+
+async def warm_token_encoder():
+    """Load the tiktoken encoder in a worker thread so its download never blocks the event loop"""
+    await asyncio.to_thread(_get_token_encoder)
+
+
+def _token_offsets(text: str) -> Optional[List[int]]:
+    """Character offset at which each token of `text` starts, or None without tiktoken"""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return None
+    tokens = encoder.encode(text, disallowed_special=())
+    _, offsets = encoder.decode_with_offsets(tokens)
+    return offsets
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` to at most `max_tokens` tokens (characters via the heuristic without tiktoken)
+
+    A cut text ends at the last sentence boundary in its final 500 characters,
+    when there is one, rather than mid-sentence.
+    """
+    encoder = _get_token_encoder()
+    if encoder is None:
+        if len(text) <= max_tokens * CHARS_PER_TOKEN:
+            return text
+        truncated = text[:max_tokens * CHARS_PER_TOKEN]
+    else:
+        tokens = encoder.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoder.decode(tokens[:max_tokens])
+
+    match = None
+    for match in _SENTENCE_BOUNDARY_RE.finditer(truncated, max(len(truncated) - 500, 0)):
+        pass
+    return truncated[:match.start() + 1] if match else truncated
+
+
+def _count_tokens(text: str) -> int:
+    """Token count with the chunking encoder, or the character heuristic without tiktoken"""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+async def _gather_bounded(
+    coros: Iterable[Awaitable[T]],
+    limit: int = MAX_CONCURRENT_LLM_CALLS
+) -> List[T]:
+    """
+    Await coroutines concurrently with at most `limit` in flight, preserving input order.
+
+    Runs in a TaskGroup, so the first exception cancels every sibling still
+    running or waiting (no paying for tokens whose result will be discarded)
+    and is re-raised as-is.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            # Release coroutines that were cancelled before they started
+            if asyncio.iscoroutine(coro):
+                coro.close()
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run(coro)) for coro in coros]
+    except BaseExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+
+    return [task.result() for task in tasks]
+
+
+@dataclass(slots=True)
+class SectionSummary:
+    """One summarized v1 topic section"""
+    title: str
+    timestamp: str
+    description: str
+    summary: str
+    key_points: List[str]
+    entities: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for the API response (cheaper than dataclasses.asdict, which deep-copies)"""
+        return {
+            "title": self.title,
+            "timestamp": self.timestamp,
+            "description": self.description,
+            "summary": self.summary,
+            "key_points": self.key_points,
+            "entities": self.entities
+        }
+
+# ============================================================================
+# STRUCTURED OUTPUT SCHEMAS
+# ============================================================================
+
+class _StrictSchema(BaseModel):
+    """Base for OpenAI strict structured outputs (every field required, no extras)"""
+    model_config = ConfigDict(extra="forbid")
+
+
+class GroupedSectionSchema(_StrictSchema):
+    title: str
+    chunk_indices: List[int]
+    start_time: str
+    end_time: str
+    combined_summary: str
+
+
+class SectionGroupingSchema(_StrictSchema):
+    sections: List[GroupedSectionSchema]
+
+
+class TopicSectionSchema(_StrictSchema):
+    title: str
+    start_time: str
+    end_time: str
+    description: str
+
+
+class TopicDetectionSchema(_StrictSchema):
+    sections: List[TopicSectionSchema]
+
+
+class ChainOfDensitySchema(_StrictSchema):
+    summary: str
+    key_points: List[str]
+    entities: List[str]
+
+
+class ChainOfDensityDeltaSchema(ChainOfDensitySchema):
+    delta_notes: List[str]
+
+
+class IndexedChainOfDensitySchema(ChainOfDensitySchema):
+    index: int
+
+
+class MultiSectionChainOfDensitySchema(_StrictSchema):
+    sections: List[IndexedChainOfDensitySchema]
+
+
+class ExecutiveSummarySchema(_StrictSchema):
+    executive_summary: str
+    key_takeaways: List[str]
+    target_audience: str
+
+
+class FinalSectionSchema(_StrictSchema):
+    title: str
+    timestamp: str
+    description: str
+    summary: str
+    key_points: List[str]
+    entities: List[str]
+
+
+class FinalSummarySchema(ExecutiveSummarySchema):
+    sections: List[FinalSectionSchema]
+
+
+class PodcastSummarySchema(_StrictSchema):
+    executive_summary: str
+    key_takeaways: List[str]
+    action_items: List[str]
+    decisions_made: List[str]
+    topics_discussed: List[str]
+
+
+def _json_schema_format(name: str, schema: type[BaseModel]) -> Dict[str, Any]:
+    """response_format asking the model for output guaranteed to match `schema`"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema.model_json_schema()}
+    }
+
+
+# Built once; model_json_schema() walks the model on every call
+SECTION_GROUPING_RESPONSE_FORMAT = _json_schema_format("SectionGrouping", SectionGroupingSchema)
+PODCAST_SUMMARY_RESPONSE_FORMAT = _json_schema_format("PodcastSummary", PodcastSummarySchema)
+TOPIC_DETECTION_RESPONSE_FORMAT = _json_schema_format("TopicDetection", TopicDetectionSchema)
+CHAIN_OF_DENSITY_RESPONSE_FORMAT = _json_schema_format("ChainOfDensity", ChainOfDensitySchema)
+CHAIN_OF_DENSITY_DELTA_RESPONSE_FORMAT = _json_schema_format("ChainOfDensityDelta", ChainOfDensityDeltaSchema)
+MULTI_SECTION_CHAIN_OF_DENSITY_RESPONSE_FORMAT = _json_schema_format(
+    "MultiSectionChainOfDensity", MultiSectionChainOfDensitySchema
+)
+EXECUTIVE_SUMMARY_RESPONSE_FORMAT = _json_schema_format("ExecutiveSummary", ExecutiveSummarySchema)
+FINAL_SUMMARY_RESPONSE_FORMAT = _json_schema_format("FinalSummary", FinalSummarySchema)
+
 
 # ============================================================================
 # PROMPTS
 # ============================================================================
 
-TOPIC_DETECTION_PROMPT = """Analyze this video transcript and identify distinct topic sections.
+TOPIC_DETECTION_PROMPT = """Analyze the video transcript below and identify distinct topic sections.
 
 For each section, provide:
 1. A clear title (2-5 words)
 2. The approximate timestamp range (start-end in MM:SS format)
 3. A detailed description of what's covered (2-3 sentences)
 
-TRANSCRIPT:
-{transcript}
-
-Respond in JSON format:
-{{
-    "sections": [
-        {{
-            "title": "Section Title",
-            "start_time": "0:00",
-            "end_time": "2:30",
-            "description": "Detailed description of this section covering main points discussed"
-        }}
-    ]
-}}
-
 Important:
 - Identify 4-8 distinct sections based on topic changes
 - If timestamps are in the transcript, use them; otherwise estimate based on content
 - Keep section titles concise and descriptive
 - ONLY include information that is explicitly stated in the transcript
 - Do NOT infer or assume information not present in the text
-- Output ONLY valid JSON, no additional text"""
+- Output ONLY valid JSON, no additional text
 
-CHAIN_OF_DENSITY_PROMPT = """You are an expert summarizer. Generate a comprehensive summary of the following section using Chain of Density technique.
+TRANSCRIPT:
+{transcript}"""
 
-SECTION TITLE: {section_title}
-SECTION CONTENT:
-{section_content}
+CHAIN_OF_DENSITY_PROMPT = """You are an expert summarizer. Generate a comprehensive summary of the section below using Chain of Density technique.
 
 Your task:
 1. First, write an initial summary (5-7 sentences) covering the main points thoroughly
@@ -84,14 +736,7 @@ Your task:
 3. Rewrite the summary to include these entities while maintaining clarity
 4. Repeat step 2-3 one more time (total 3 iterations)
 
-After 3 iterations, provide your final dense summary.
-
-Respond in JSON format:
-{{
-    "summary": "Your final dense summary (5-7 sentences, comprehensive and information-rich)",
-    "key_points": ["Key point 1", "Key point 2", "Key point 3", "Key point 4", "Key point 5"],
-    "entities": ["Important entity/term 1", "Important entity/term 2", "Important entity/term 3"]
-}}
+After 3 iterations, provide your final dense summary (5-7 sentences) with its key points and entities.
 
 Critical requirements:
 - The final summary should be information-dense, comprehensive, and readable
@@ -100,15 +745,13 @@ Critical requirements:
 - ONLY include facts directly stated in the source content - no speculation or inference
 - If specific numbers, statistics, or quotes are mentioned, include them accurately
 - Do NOT add information that is not present in the section content
-- Output ONLY valid JSON"""
-
-CHAIN_OF_DENSITY_PROMPT_WITH_CONTEXT = """You are an expert summarizer using the Delta Extraction approach.
+- Output ONLY valid JSON
 
 SECTION TITLE: {section_title}
 SECTION CONTENT:
-{section_content}
+{section_content}"""
 
-{previous_context}
+CHAIN_OF_DENSITY_PROMPT_WITH_CONTEXT = """You are an expert summarizer using the Delta Extraction approach.
 
 DELTA EXTRACTION APPROACH:
 For topics/events already covered in previous sections, extract ONLY NEW DETAILS - not the base facts.
@@ -119,33 +762,56 @@ Example of what we want:
 - CORRECT: Include "recovered within a month" (NEW detail)
 - WRONG: Repeat "lost $700K shorting Tilray" (BASE FACT already covered)
 
-Your task:
+Your task (the section and what earlier sections covered are at the end):
 1. Identify what topics from this section were already covered previously
 2. For those topics, extract ONLY the new details, developments, or perspectives
 3. For genuinely new topics, provide full context
 4. Apply Chain of Density: iterate 2-3 times to increase information density
 
-Respond in JSON format:
-{{
-    "summary": "5-7 sentences focusing on NEW details. For previously covered topics, mention only what's NEW (e.g., 'The speaker later recovered the Tilray loss within a month' NOT 'The speaker lost $700K on Tilray')",
-    "key_points": ["Each point should be genuinely new information or a new perspective"],
-    "entities": ["Important entities from THIS section"],
-    "delta_notes": ["Brief note on what new info was added about previously covered topics"]
-}}
+Output fields:
+- summary: 5-7 sentences focusing on NEW details. For previously covered topics, mention only what's NEW (e.g., 'The speaker later recovered the Tilray loss within a month' NOT 'The speaker lost $700K on Tilray')
+- key_points: each point should be genuinely new information or a new perspective
+- entities: important entities from THIS section
+- delta_notes: brief notes on what new info was added about previously covered topics
 
 Critical requirements:
 - For recurring topics: extract the DELTA (new details), not the base facts
 - Base facts belong in their FIRST mention only
 - Later sections add context, outcomes, lessons, or new perspectives
 - If this section adds nothing new about a topic, don't mention that topic
-- Output ONLY valid JSON"""
+- Output ONLY valid JSON
 
-EXECUTIVE_SUMMARY_PROMPT = """Based on these section summaries, create a comprehensive executive summary of the entire video.
+{previous_context}
 
-VIDEO TITLE: {video_title}
+SECTION TITLE: {section_title}
+SECTION CONTENT:
+{section_content}"""
 
-SECTION SUMMARIES:
-{section_summaries}
+MULTI_SECTION_CHAIN_OF_DENSITY_PROMPT = """You are an expert summarizer. Summarize each of the consecutive video sections below using the Chain of Density technique.
+
+Each section is delimited by a <<<SECTION n: title>>> marker, where n is its position in the video.
+
+For EACH section:
+1. Write an initial summary (5-7 sentences) covering the section's main points
+2. Identify 3-4 key entities/facts missing from it and rewrite to include them; repeat once more
+3. Give the final dense summary, 4-6 key points and the important entities of THAT section
+
+DELTA EXTRACTION ACROSS SECTIONS:
+- A topic's base facts belong in the FIRST section that covers it
+- In later sections, include only NEW details about that topic (outcomes, lessons, new perspectives)
+- If a later section adds nothing new about a topic, leave that topic out of its summary
+
+Critical requirements:
+- Return one entry per section, with "index" set to the section's n
+- Summarize each section from its own content only - do not move facts between sections
+- ONLY include facts directly stated in the source content - no speculation or inference
+- If specific numbers, statistics, or quotes are mentioned, include them accurately
+- Output ONLY valid JSON
+
+SECTIONS ({section_count}):
+{section_contents}"""
+
+EXECUTIVE_SUMMARY_PROMPT = """Based on the section summaries below, create a comprehensive executive summary of the entire video.
 
 CRITICAL INSTRUCTIONS FOR HANDLING REPETITION:
 1. If the same point, example, or anecdote appears across multiple sections, mention it ONLY ONCE
@@ -159,24 +825,44 @@ Create:
 2. 5-8 UNIQUE key takeaways - each must provide NEW information not covered by other takeaways
 3. Who would benefit from this video (target audience with specific characteristics)
 
-Respond in JSON format:
-{{
-    "executive_summary": "4-6 sentence comprehensive overview - mention repeated themes ONCE only",
-    "key_takeaways": ["Unique takeaway 1", "Unique takeaway 2", ...],
-    "target_audience": "Detailed description of who should watch this and why"
-}}
-
 Critical requirements:
 - The executive summary should synthesize information from ALL sections coherently
 - Key takeaways must be specific, actionable, and MUTUALLY EXCLUSIVE (no overlapping points)
 - ONLY include information that appears in the section summaries - no external knowledge
 - If a topic (e.g., "risk management") appears in 5 sections, summarize it ONCE comprehensively
-- Output ONLY valid JSON"""
+- Output ONLY valid JSON
+
+VIDEO TITLE: {video_title}
+
+SECTION SUMMARIES:
+{section_summaries}"""
 
-CONSOLIDATION_PROMPT = """Apply Delta Consolidation to this video summary.
+FINALIZE_SUMMARY_PROMPT = """Finish the video summary below: write its executive summary and apply Delta Consolidation to its sections.
 
-CURRENT SUMMARY:
-{summary_json}
+PART 1 - EXECUTIVE SUMMARY:
+1. A thorough executive summary (4-6 sentences) that synthesizes ALL sections and CONSOLIDATES repeated themes into single mentions
+2. 5-8 UNIQUE key takeaways - specific, actionable and MUTUALLY EXCLUSIVE (no overlapping points)
+3. Who would benefit from this video (target audience with specific characteristics)
+The source video may intentionally repeat key messages - your job is to SYNTHESIZE, not echo.
+
+PART 2 - DELTA CONSOLIDATION OF THE SECTIONS:
+The goal is NOT to remove all repetition, but to ensure each section contributes UNIQUE VALUE.
+- FIRST MENTION of a recurring event, example or statistic keeps the base facts (who, what, when, where, how much)
+- LATER MENTIONS keep ONLY new details (outcomes, lessons, perspectives, what happened next)
+- If a section adds NO new details about a topic, remove that topic from that section
+- PRESERVE genuinely new information - don't over-consolidate
+- Return every section, in the same order, with its title, timestamp and description unchanged
+
+Critical requirements:
+- ONLY include information that appears in the section summaries - no external knowledge
+- Output ONLY valid JSON
+
+VIDEO TITLE: {video_title}
+
+SECTIONS:
+{sections_json}"""
+
+CONSOLIDATION_PROMPT = """Apply Delta Consolidation to the video summary below.
 
 DELTA CONSOLIDATION APPROACH:
 The goal is NOT to remove all repetition, but to ensure each section contributes UNIQUE VALUE.
@@ -211,13 +897,13 @@ REMOVE THESE (pure repetition):
 - Same example with no new context
 
 Return the consolidated summary in the exact same JSON structure.
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
 
-MMR_DEDUP_PROMPT = """You are a deduplication expert. Given a list of key points from a video summary,
-identify and merge semantically similar points while preserving unique insights.
+CURRENT SUMMARY:
+{summary_json}"""
 
-KEY POINTS TO DEDUPLICATE:
-{key_points_json}
+MMR_DEDUP_PROMPT = """You are a deduplication expert. Given the list of key points from a video summary below,
+identify and merge semantically similar points while preserving unique insights.
 
 YOUR TASK:
 1. Group points that convey the same or very similar information
@@ -241,18 +927,16 @@ Return JSON:
     ]
 }}
 
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
+
+KEY POINTS TO DEDUPLICATE:
+{key_points_json}"""
 
 # ============================================================================
 # LARGE CONTEXT PROMPT (for Gemini 2.0 Flash via OpenRouter)
 # ============================================================================
 
-LARGE_CONTEXT_SUMMARY_PROMPT = """You are an expert video summarizer. Analyze this COMPLETE video transcript and create a comprehensive, structured summary.
-
-VIDEO TITLE: {video_title}
-
-COMPLETE TRANSCRIPT:
-{transcript}
+LARGE_CONTEXT_SUMMARY_PROMPT = """You are an expert video summarizer. Analyze the COMPLETE video transcript below and create a comprehensive, structured summary.
 
 YOUR TASK:
 Create a thorough summary of this video with the following structure:
@@ -297,16 +981,18 @@ Respond in JSON format:
     "target_audience": "Detailed description of ideal viewer"
 }}
 
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
+
+VIDEO TITLE: {video_title}
+
+COMPLETE TRANSCRIPT:
+{transcript}"""
 
 # ============================================================================
 # NEW PROMPTS FOR HYBRID ARCHITECTURE (v2)
 # ============================================================================
 
-CHUNK_SUMMARY_PROMPT = """You are an expert summarizer. Summarize this portion of a video transcript.
-
-CHUNK CONTENT (this is part {chunk_index} of {total_chunks} from the video):
-{chunk_content}
+CHUNK_SUMMARY_PROMPT = """You are an expert summarizer. Summarize the portion of a video transcript below.
 
 Your task:
 1. Summarize the key information in this chunk (3-5 sentences)
@@ -323,27 +1009,55 @@ Respond in JSON format:
 }}
 
 Critical requirements:
+- If the content has a [CONTEXT] block, use it only to understand the [CORE]; summarize and extract points from the [CORE] only
 - Focus on UNIQUE details - avoid generic statements
 - Include specific numbers, names, or examples if mentioned
 - The summary should stand alone but also work as part of a larger document
-- Output ONLY valid JSON"""
+- Output ONLY valid JSON
 
-REFINE_ASSEMBLY_PROMPT = """You are assembling a video summary by integrating new content with an existing summary.
+CHUNK CONTENT (this is part {chunk_index} of {total_chunks} from the video):
+{chunk_content}"""
 
-CURRENT RUNNING SUMMARY:
-{running_summary}
+CHUNK_GROUP_SUMMARY_PROMPT = """You are an expert summarizer. Summarize each of the portions of a video transcript below independently.
 
-KEY POINTS ALREADY COVERED:
-{covered_points}
+Each portion is delimited by a <<<CHUNK n>>> marker, where n is its part number in the video.
 
-NEW CHUNK TO INTEGRATE (chunk {chunk_index} of {total_chunks}):
-{new_chunk_summary}
+For EACH portion:
+1. Summarize the key information in that portion (3-5 sentences)
+2. Extract 3-5 key points that are specific and actionable
+3. Suggest a short title (2-5 words) that describes that portion's main topic
+4. List any important entities (names, numbers, terms) mentioned
+
+Respond in JSON format, with one entry per portion in the same order as the portions:
+{{
+    "summaries": [
+        {{
+            "chunk": 1,
+            "summary": "3-5 sentence summary of this portion",
+            "key_points": ["Specific point 1", "Specific point 2", "..."],
+            "suggested_title": "Short descriptive title",
+            "entities": ["Entity 1", "Entity 2", "..."]
+        }}
+    ]
+}}
+
+Critical requirements:
+- Summarize each portion on its own - do not blend content across portions
+- If a portion has a [CONTEXT] block, use it only to understand that portion's [CORE]; summarize and extract points from the [CORE] only
+- Focus on UNIQUE details - avoid generic statements
+- Include specific numbers, names, or examples if mentioned
+- Output ONLY valid JSON
+
+PORTIONS ({group_count} of the video's {total_chunks} parts; return exactly {group_count} entries):
+{chunk_contents}"""
+
+REFINE_ASSEMBLY_PROMPT = """You are assembling a video summary by merging the summaries of two consecutive parts of the video.
 
 Your task:
-1. Read the new chunk summary
-2. Identify what is GENUINELY NEW vs what was already covered
-3. Add only the NEW information to the running summary
-4. Update the key points list with any NEW unique points
+1. Read both summaries in order
+2. Identify what the later part adds that is GENUINELY NEW vs what the earlier part already covered
+3. Write one merged summary that keeps the earlier content and adds only the NEW information
+4. Produce a single key points list without duplicates
 
 IMPORTANT - Avoid redundancy:
 - If a topic was already covered, only add NEW details about it
@@ -352,17 +1066,53 @@ IMPORTANT - Avoid redundancy:
 
 Respond in JSON format:
 {{
-    "updated_summary": "The running summary with new information integrated (should grow by 1-2 sentences max)",
-    "new_points_added": ["Only genuinely NEW points from this chunk"],
-    "topics_updated": ["Topics that received new details (not full repetition)"]
+    "merged_summary": "One coherent summary of both parts in chronological order",
+    "key_points": ["Every unique point from both parts, without repetition"]
 }}
 
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
 
-SECTION_TITLE_PROMPT = """Given these chunk summaries from a video, group them into logical sections and generate appropriate titles.
+EARLIER PART (chunks {left_range} of {total_chunks}):
+{left_summary}
 
-CHUNK SUMMARIES:
-{chunk_summaries_json}
+KEY POINTS FROM EARLIER PART:
+{left_points}
+
+LATER PART (chunks {right_range} of {total_chunks}):
+{right_summary}
+
+KEY POINTS FROM LATER PART:
+{right_points}"""
+
+REDUCE_ALL_PROMPT = """You are assembling a video summary from the summaries of all of its parts.
+
+Your task:
+1. Read every chunk summary in order
+2. Write one coherent summary of the whole video in chronological order
+3. Produce a single key points list covering every part without duplicates
+4. Write a comprehensive executive summary (4-6 sentences), 5-8 unique key takeaways and the target audience
+
+IMPORTANT - Avoid redundancy:
+- If a topic recurs, state its base facts once and add only NEW details from later chunks
+- Do NOT repeat the same facts, examples, or statistics
+- Each part of the summary should contribute UNIQUE value
+- Key takeaways must be MUTUALLY EXCLUSIVE - no two should cover the same idea
+
+Respond in JSON format:
+{{
+    "merged_summary": "One coherent summary of the whole video in chronological order",
+    "key_points": ["Every unique point from all chunks, without repetition"],
+    "executive_summary": "4-6 sentence comprehensive overview",
+    "key_takeaways": ["Unique takeaway 1", "Unique takeaway 2", "..."],
+    "target_audience": "Who should watch this and why"
+}}
+
+Output ONLY valid JSON.
+
+CHUNK SUMMARIES (in order, {total_chunks} chunks):
+{chunk_summaries_json}"""
+
+SECTION_TITLE_PROMPT = """Given the chunk summaries from a video below, group them into logical sections and generate appropriate titles.
 
 Your task:
 1. Identify natural topic boundaries where the content shifts
@@ -387,14 +1137,12 @@ Guidelines:
 - Aim for 4-8 sections total (merge small topics, split large ones)
 - Titles should be specific to the content, not generic
 - Each section should represent a coherent topic or theme
-- Output ONLY valid JSON"""
+- Output ONLY valid JSON
 
-FINAL_EXECUTIVE_PROMPT = """Create a final executive summary from these section summaries.
-
-VIDEO TITLE: {video_title}
+CHUNK SUMMARIES:
+{chunk_summaries_json}"""
 
-SECTION SUMMARIES:
-{section_summaries}
+FINAL_EXECUTIVE_PROMPT = """Create a final executive summary from the section summaries below.
 
 Create:
 1. A comprehensive executive summary (4-6 sentences) that captures the entire video
@@ -413,8 +1161,49 @@ Respond in JSON format:
     "target_audience": "Who should watch this and why"
 }}
 
-Output ONLY valid JSON."""
+Output ONLY valid JSON.
+
+VIDEO TITLE: {video_title}
+
+SECTION SUMMARIES:
+{section_summaries}"""
+
+
+SINGLE_PASS_ASSEMBLY_PROMPT = """Assemble the final summary of a video from its chunk summaries in one pass.
+
+Your task:
+1. Group consecutive chunks that discuss the same topic into 2-6 sections, each with a clear, specific title (2-5 words)
+2. Write a combined summary for each section
+3. Write a comprehensive executive summary (4-6 sentences) of the entire video
+4. List 5-8 unique key takeaways and describe the target audience
+
+DELTA CONSOLIDATION - each section must contribute UNIQUE value:
+- FIRST MENTION of a recurring event, example or statistic keeps the base facts (who, what, when, how much)
+- LATER MENTIONS keep ONLY new details (outcomes, lessons, perspectives, what happened next)
+- Key takeaways must be MUTUALLY EXCLUSIVE - no two should cover the same idea
+- If the same topic appears in multiple sections, mention it ONCE in the executive summary
+
+Respond in JSON format:
+{{
+    "executive_summary": "4-6 sentence comprehensive overview",
+    "key_takeaways": ["Unique takeaway 1", "Unique takeaway 2", "..."],
+    "target_audience": "Who should watch this and why",
+    "sections": [
+        {{
+            "title": "Section Title",
+            "chunk_indices": [0, 1],
+            "combined_summary": "Summary of this section with only its unique content",
+            "key_points": ["Point unique to this section", "..."]
+        }}
+    ]
+}}
 
+Output ONLY valid JSON.
+
+VIDEO TITLE: {video_title}
+
+CHUNK SUMMARIES (in order, with estimated timestamps):
+{chunk_summaries_json}"""
 
 class SummarizationService:
     """Service for generating structured video summaries"""
@@ -424,10 +1213,53 @@ class SummarizationService:
         self.settings = get_settings()
         self.client: Optional[AsyncOpenAI] = None
         self.openrouter_client: Optional[AsyncOpenAI] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+        # Semantic caches of MAP-step chunk and v1 section summaries (opt-in, one embedding call per batch)
+        self.chunk_summary_cache = SemanticCache(
+            threshold=self.settings.chunk_semantic_cache_threshold
+        )
+        self.section_summary_cache = SemanticCache(
+            threshold=self.settings.chunk_semantic_cache_threshold
+        )
+        # Final summaries keyed by transcript hash (24h TTL)
+        self.summary_result_cache = SummaryResultCache()
+        # Pipelines currently running, keyed like summary_result_cache, so concurrent duplicates share one run
+        self._inflight_summaries: Dict[str, asyncio.Task] = {}
+        # Parsed LLM responses keyed by model + prompt, so re-processing identical chunks skips the call.
+        # With llm_cache_path set, entries are also written to SQLite and survive restarts.
+        llm_cache_store = None
+        if self.settings.llm_cache_enabled and self.settings.llm_cache_path:
+            try:
+                llm_cache_store = SqliteResultStore(
+                    self.settings.llm_cache_path,
+                    ttl_seconds=self.settings.llm_cache_ttl_seconds
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open persistent LLM cache at {self.settings.llm_cache_path}, using memory only: {e}")
+        self.llm_response_cache = SummaryResultCache(
+            maxsize=LLM_RESPONSE_CACHE_SIZE,
+            ttl_seconds=self.settings.llm_cache_ttl_seconds,
+            store=llm_cache_store
+        )
+
+        # Service-wide cap on in-flight OpenAI calls, across every summary being generated
+        self._llm_semaphore = asyncio.Semaphore(self.settings.llm_max_concurrency)
+        # Monotonic time before which new calls wait, set from x-ratelimit-* response headers
+        self._rate_limit_resume_at = 0.0
+
+        # One pooled (HTTP/2) connection pool shared by the OpenAI and OpenRouter clients
+        if self.settings.openai_api_key or self.settings.openrouter_api_key:
+            self.http_client = _build_http_client(on_response=self._record_rate_limits)
 
         # Initialize OpenAI client
         if self.settings.openai_api_key:
-            self.client = AsyncOpenAI(api_key=self.settings.openai_api_key)
+            self.client = AsyncOpenAI(
+                api_key=self.settings.openai_api_key,
+                max_retries=LLM_MAX_RETRIES,
+                timeout=httpx.Timeout(LLM_REQUEST_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS),
+                http_client=self.http_client
+            )
             logger.info(f"Summarization service initialized with model: {self.settings.llm_model}")
         else:
             logger.warning("OpenAI API key not configured - summarization will not work")
@@ -436,10 +1268,53 @@ class SummarizationService:
         if self.settings.openrouter_api_key:
             self.openrouter_client = AsyncOpenAI(
                 api_key=self.settings.openrouter_api_key,
-                base_url="https://openrouter.ai/api/v1"
+                base_url="https://openrouter.ai/api/v1",
+                max_retries=LLM_MAX_RETRIES,
+                timeout=httpx.Timeout(OPENROUTER_REQUEST_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS),
+                http_client=self.http_client
             )
             logger.info(f"OpenRouter initialized with model: {self.settings.openrouter_default_model}")
 
+    async def _record_rate_limits(self, response: httpx.Response):
+        """Pause new OpenAI calls when the rate-limit headers show the window is nearly spent"""
+        if response.request.url.host != "api.openai.com":
+            return
+
+        headers = response.headers
+        try:
+            remaining_requests = int(headers.get("x-ratelimit-remaining-requests", LLM_RATE_LIMIT_MIN_REMAINING_REQUESTS + 1))
+            remaining_tokens = int(headers.get("x-ratelimit-remaining-tokens", LLM_RATE_LIMIT_MIN_REMAINING_TOKENS + 1))
+        except ValueError:
+            return
+
+        delay = 0.0
+        if remaining_requests <= LLM_RATE_LIMIT_MIN_REMAINING_REQUESTS:
+            delay = max(delay, _parse_reset_seconds(headers.get("x-ratelimit-reset-requests")))
+        if remaining_tokens <= LLM_RATE_LIMIT_MIN_REMAINING_TOKENS:
+            delay = max(delay, _parse_reset_seconds(headers.get("x-ratelimit-reset-tokens")))
+
+        if delay > 0:
+            self._rate_limit_resume_at = max(self._rate_limit_resume_at, time.monotonic() + delay)
+            logger.info(
+                f"OpenAI rate limit nearly spent ({remaining_requests} requests, {remaining_tokens} tokens left), "
+                f"pausing new calls for {delay:.1f}s"
+            )
+
+    async def _wait_for_rate_limit(self):
+        """Sleep until the rate-limit window recorded by _record_rate_limits has reset"""
+        delay = self._rate_limit_resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        """Close pooled HTTP connections and the persistent LLM cache"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+        if self.llm_response_cache.store is not None:
+            store, self.llm_response_cache.store = self.llm_response_cache.store, None
+            await asyncio.to_thread(store.close)
+
     def is_available(self) -> bool:
         """Check if summarization service is available"""
         return self.client is not None
@@ -453,7 +1328,10 @@ class SummarizationService:
         prompt: str,
         temperature: float = 0.3,
         model_override: Optional[str] = None,
-        max_tokens: int = 8000
+        max_tokens: int = 8000,
+        item_key: Optional[str] = None,
+        on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """Make an LLM call via OpenRouter and parse JSON response
 
@@ -462,65 +1340,143 @@ class SummarizationService:
             temperature: Sampling temperature
             model_override: Optional model to use instead of default
             max_tokens: Maximum tokens for response (default 8000 for detailed summaries)
+            item_key: Top-level array whose objects are handed to `on_item` as they stream in
+            on_item: Called with each completed `item_key` object before the response ends
+                (not called when the response is served from the cache)
+            bypass_cache: Skip a cached response (the new one still replaces it)
         """
         if not self.openrouter_client:
             return {"error": "OpenRouter not configured"}
 
         model = model_override or self.settings.openrouter_default_model
+        content = None
+
+        cache_key = self._llm_cache_key("openrouter", model, prompt, temperature, max_tokens)
+        cached = await self._cached_llm_response(cache_key, bypass_cache)
+        if cached is not None:
+            return cached
 
         try:
             logger.info(f"Calling OpenRouter with model: {model}")
-            response = await self.openrouter_client.chat.completions.create(
+            started = time.monotonic()
+            stream = await self.openrouter_client.chat.completions.create(
                 model=model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that outputs only valid JSON."},
+                    {"role": "system", "content": LLM_SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=temperature,
                 max_tokens=max_tokens,
+                stream=True,
                 extra_headers={
                     "HTTP-Referer": "https://tubevibe.app",
                     "X-Title": "TubeVibe Library"
                 }
             )
 
-            content = response.choices[0].message.content
+            # Accumulate deltas as they arrive so slow generations never sit idle on one read
+            parts: List[str] = []
+            usage = None
+            items = _StreamedArrayItems(item_key) if item_key and on_item else None
+            async for event in stream:
+                if event.choices:
+                    delta = event.choices[0].delta.content
+                    if delta:
+                        if not parts:
+                            logger.info(f"OpenRouter first token after {time.monotonic() - started:.1f}s")
+                        parts.append(delta)
+                        if items is not None:
+                            for item in items.feed(delta):
+                                on_item(item)
+                if getattr(event, "usage", None):
+                    usage = event.usage
+
+            content = "".join(parts)
+            logger.info(f"OpenRouter stream finished after {time.monotonic() - started:.1f}s ({len(content)} chars)")
 
             # Log token usage for cost tracking
-            if hasattr(response, 'usage') and response.usage:
-                logger.info(f"OpenRouter usage - Input: {response.usage.prompt_tokens}, Output: {response.usage.completion_tokens}")
+            if usage:
+                logger.info(f"OpenRouter usage - Input: {usage.prompt_tokens}, Output: {usage.completion_tokens}")
 
             # Debug: log raw content if parsing fails
             if not content:
                 logger.error("OpenRouter returned empty content")
+                _note_llm_error()
                 return {"error": "OpenRouter returned empty response"}
 
-            # Strip markdown code blocks if present (Gemini often wraps JSON in ```json ... ```)
-            content = content.strip()
-            if content.startswith("```"):
-                # Find the end of the first line (```json or ```)
-                first_newline = content.find("\n")
-                if first_newline > 0:
-                    content = content[first_newline + 1:]
-                # Remove trailing ```
-                if content.endswith("```"):
-                    content = content[:-3].strip()
-
-            return json.loads(content)
+            # Gemini often wraps JSON in ```json ... ``` - the parser strips the fence
+            result = await _parse_llm_json_async(content)
+            if cache_key:
+                await self.llm_response_cache.set_async(cache_key, result)
+            return result
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error from OpenRouter: {e}")
             logger.error(f"Raw response content: {content[:500] if content else 'None'}...")
+            _note_llm_error()
             return {"error": f"Failed to parse OpenRouter response: {e}"}
         except Exception as e:
             logger.error(f"OpenRouter call error: {e}")
+            _note_llm_error()
             return {"error": str(e)}
 
+    def _llm_cache_key(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Optional[str]:
+        """Key for the LLM response cache, or None when caching is off or the call is too random to reuse"""
+        if not self.settings.llm_cache_enabled or temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        return SummaryResultCache.make_key(provider, model, temperature, max_tokens, prompt)
+
+    async def _cached_llm_response(self, cache_key: Optional[str], bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Look up a cached LLM response, counting the hit or miss for the current summary
+
+        Returns None without a lookup when `bypass_cache` is set or the current summary
+        is being force-regenerated (_llm_cache_bypass).
+        """
+        if not cache_key:
+            return None
+        cached = None
+        if not (bypass_cache or _llm_cache_bypass.get()):
+            cached = await self.llm_response_cache.get_async(cache_key)
+        stats = _llm_cache_stats.get()
+        if stats is not None:
+            stats["llm_cache_hits" if cached is not None else "llm_cache_misses"] += 1
+        return cached
+
+    def _chat_request_body(
+        self,
+        prompt: str,
+        temperature: float,
+        model: str,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters shared by real-time and batch calls"""
+        return {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": LLM_SYSTEM_MESSAGE},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens or self.settings.llm_max_tokens,
+            "response_format": response_format or {"type": "json_object"}
+        }
+
     async def _call_llm(
         self,
         prompt: str,
         temperature: float = 0.3,
-        model_override: Optional[str] = None
+        model_override: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """Make an LLM call and parse JSON response
 
@@ -528,86 +1484,135 @@ class SummarizationService:
             prompt: The prompt to send
             temperature: Sampling temperature
             model_override: Optional model to use instead of default (e.g., 'gpt-4o' for complex tasks)
+            response_format: Structured output format (e.g. SECTION_GROUPING_RESPONSE_FORMAT);
+                defaults to JSON mode
+            max_tokens: Response cap instead of settings.llm_max_tokens
+            bypass_cache: Skip a cached response (the new one still replaces it)
+
+        Returns:
+            The parsed JSON object, or a dict with "error" ("fatal": True for errors
+            that will repeat, "malformed": True when the response was not valid JSON)
         """
         if not self.client:
             return {"error": "LLM not configured"}
 
         model = model_override or self.settings.llm_model
 
-        try:
-            response = await self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that outputs only valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=self.settings.llm_max_tokens,
-                response_format={"type": "json_object"}
-            )
+        max_tokens = max_tokens or self.settings.llm_max_tokens
+        cache_key = self._llm_cache_key("openai", model, prompt, temperature, max_tokens)
+        cached = await self._cached_llm_response(cache_key, bypass_cache)
+        if cached is not None:
+            return cached
 
-            content = response.choices[0].message.content
-            return json.loads(content)
+        # Rate limits, timeouts and server errors are retried with backoff by the client
+        # (LLM_MAX_RETRIES); a malformed response gets one more attempt here
+        request = self._chat_request_body(prompt, temperature, model, response_format, max_tokens)
+        try:
+            try:
+                result = await self._complete_json(request)
+            except json.JSONDecodeError as e:
+                logger.warning(f"JSON parse error ({e}), retrying once with a compact-output instruction")
+                request["messages"][0] = {"role": "system", "content": LLM_COMPACT_JSON_SYSTEM_MESSAGE}
+                result = await self._complete_json(request)
+            if cache_key:
+                await self.llm_response_cache.set_async(cache_key, result)
+            return result
 
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
-            return {"error": f"Failed to parse LLM response: {e}"}
+            _note_llm_error()
+            return {"error": f"Failed to parse LLM response: {e}", "malformed": True}
+        except _FATAL_LLM_ERRORS as e:
+            logger.error(f"LLM call failed permanently: {e}")
+            _note_llm_error()
+            return {"error": str(e), "fatal": True}
         except Exception as e:
             logger.error(f"LLM call error: {e}")
+            _note_llm_error()
             return {"error": str(e)}
 
-    def _extract_section_content(self, transcript: str, start_time: str, end_time: str) -> str:
-        """Extract content between timestamps from transcript"""
-        # Try to find content between timestamps
-        # This handles various timestamp formats: [0:00], 0:00, (0:00)
-
-        def time_to_seconds(time_str: str) -> int:
-            """Convert MM:SS or HH:MM:SS to seconds"""
-            parts = time_str.split(":")
-            if len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            return 0
-
-        start_seconds = time_to_seconds(start_time)
-        end_seconds = time_to_seconds(end_time)
-
-        # Find timestamp patterns in transcript
-        timestamp_pattern = r'\[?(\d{1,2}:\d{2}(?::\d{2})?)\]?'
-        matches = list(re.finditer(timestamp_pattern, transcript))
-
-        if not matches:
-            # No timestamps found - estimate based on position
-            total_length = len(transcript)
-            # Assuming transcript corresponds linearly to video duration
-            # This is a rough approximation
-            start_pos = int(total_length * (start_seconds / max(end_seconds, 1)))
-            end_pos = int(total_length * (end_seconds / max(end_seconds, 1)))
-            return transcript[start_pos:end_pos] if end_pos > start_pos else transcript
-
-        # Find content between timestamp ranges
-        content_start = 0
-        content_end = len(transcript)
-
-        for i, match in enumerate(matches):
-            match_time = time_to_seconds(match.group(1))
-            if match_time >= start_seconds and content_start == 0:
-                content_start = match.start()
-            if match_time >= end_seconds:
-                content_end = match.start()
-                break
+    async def _complete_json(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one chat completion request and parse its JSON content (raises json.JSONDecodeError)"""
+        async with self._llm_semaphore:
+            await self._wait_for_rate_limit()
+            response = await self.client.chat.completions.create(**request)
+        return await _parse_llm_json_async(response.choices[0].message.content)
+
+    async def _embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Embed texts in a single API call; returns None if embedding fails"""
+        if not self.client or not texts:
+            return None
 
-        return transcript[content_start:content_end].strip()
+        try:
+            response = await self.client.embeddings.create(
+                model=self.settings.embedding_model,
+                input=texts
+            )
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            logger.warning(f"Embedding call failed, skipping semantic cache: {e}")
+            return None
+
+    def _extract_section_content(
+        self,
+        transcript: str,
+        start_time: str,
+        end_time: str,
+        timestamp_index: Optional[Tuple[List[int], List[int]]] = None,
+        total_seconds: int = 0
+    ) -> str:
+        """Extract content between timestamps from transcript
+
+        Args:
+            transcript: Full transcript
+            start_time: Section start (MM:SS or HH:MM:SS)
+            end_time: Section end (MM:SS or HH:MM:SS)
+            timestamp_index: Result of _index_timestamps(transcript), to reuse across sections
+            total_seconds: Video duration; when the transcript has no timestamps the section
+                is sliced proportionally to it ("" without a duration)
+        """
+        # Handles various timestamp formats: [0:00], 0:00, (0:00)
+        start_seconds = _timestamp_to_seconds(start_time)
+        end_seconds = _timestamp_to_seconds(end_time)
+
+        seconds, offsets = timestamp_index if timestamp_index is not None else _index_timestamps(transcript)
+
+        if not seconds:
+            # No timestamps to locate the section by: assume the text runs linearly with the video
+            # (without a duration the caller divides the transcript evenly instead)
+            if total_seconds <= 0:
+                return ""
+            total_length = len(transcript)
+            start_pos = total_length * min(start_seconds, total_seconds) // total_seconds
+            end_pos = total_length * min(end_seconds, total_seconds) // total_seconds
+            if end_pos <= start_pos:
+                return ""
+            start_pos, end_pos = _stripped_bounds(transcript, start_pos, end_pos)
+            return transcript[start_pos:end_pos]
+
+        # First timestamp at or after each bound
+        i = bisect_left(seconds, start_seconds)
+        j = bisect_left(seconds, end_seconds)
+        content_start = offsets[i] if i < len(offsets) else 0
+        content_end = offsets[j] if j < len(offsets) else len(transcript)
+
+        # Trim before slicing so the section text is copied once, not sliced and then stripped
+        content_start, content_end = _stripped_bounds(transcript, content_start, content_end)
+        return transcript[content_start:content_end]
 
     async def detect_topics(self, transcript: str) -> Dict[str, Any]:
         """Detect topic sections in transcript"""
-        # Truncate transcript if too long (keep first ~16000 chars for topic detection)
-        # Increased from 8000 to capture more context for better section identification
-        truncated = transcript[:16000] if len(transcript) > 16000 else transcript
+        # Truncate transcript if too long (keep the first TOPIC_DETECTION_MAX_TOKENS tokens)
+        truncated = _truncate_to_tokens(transcript, TOPIC_DETECTION_MAX_TOKENS)
 
         prompt = TOPIC_DETECTION_PROMPT.format(transcript=truncated)
-        result = await self._call_llm(prompt, temperature=0.2)
+        result = await self._call_llm(
+            prompt,
+            temperature=0.2,
+            model_override=self.settings.llm_topic_model,
+            response_format=TOPIC_DETECTION_RESPONSE_FORMAT,
+            max_tokens=TOPIC_DETECTION_MAX_OUTPUT_TOKENS
+        )
 
         if "error" in result:
             # Fallback: create single section
@@ -636,28 +1641,36 @@ class SummarizationService:
             section_content: Content to summarize
             previous_summaries: List of summaries from previous sections (for context)
         """
-        # Truncate section if too long (increased from 4000 to 8000 for richer summaries)
-        # This allows more context per section while staying within model limits
-        truncated = section_content[:8000] if len(section_content) > 8000 else section_content
+        # Truncate section by tokens so every language gets the same budget within model limits
+        truncated = _truncate_to_tokens(section_content, MAX_SECTION_PROMPT_TOKENS)
 
         # Build context from previous sections with base facts tracking
         previous_context = ""
         if previous_summaries:
             context_parts = ["BASE FACTS ALREADY COVERED (extract only NEW details about these):"]
-            all_entities = set()
+            # Each section's line carries the entities it introduced, so the block for
+            # section N+1 is the block for section N plus one line and the shared prompt
+            # prefix keeps growing. Entities are first-seen and capped across sections.
+            entities_seen: Dict[str, None] = {}
             for ps in previous_summaries:
                 title = ps.get('title', 'Previous Section')
                 key_points = ps.get('key_points', [])
-                entities = ps.get('entities', [])
-                all_entities.update(entities)
-                if key_points:
-                    points_str = "; ".join(key_points[:3])  # Top 3 points
-                    context_parts.append(f"- {title}: {points_str}")
-
-            # Add entities as explicit base facts
-            if all_entities:
-                context_parts.append(f"\nKEY ENTITIES ALREADY INTRODUCED: {', '.join(list(all_entities)[:10])}")
-                context_parts.append("If these appear again, only include NEW information about them.")
+                introduced: List[str] = []
+                for entity in ps.get('entities', _EMPTY):
+                    if len(entities_seen) >= MAX_CONTEXT_ENTITIES:
+                        break
+                    if entity not in entities_seen:
+                        entities_seen[entity] = None
+                        introduced.append(entity)
+                if key_points or introduced:
+                    points_str = "; ".join(islice(key_points, 3))  # Top 3 points
+                    line = f"- {title}: {points_str}"
+                    if introduced:
+                        line += f" (introduces: {', '.join(introduced)})"
+                    context_parts.append(line)
+
+            if entities_seen:
+                context_parts.append("If an introduced entity appears again, only include NEW information about it.")
 
             previous_context = "\n".join(context_parts)
 
@@ -668,14 +1681,21 @@ class SummarizationService:
                 section_content=truncated,
                 previous_context=previous_context
             )
+            response_format = CHAIN_OF_DENSITY_DELTA_RESPONSE_FORMAT
         else:
             # First section - use original prompt
             prompt = CHAIN_OF_DENSITY_PROMPT.format(
                 section_title=section_title,
                 section_content=truncated
             )
+            response_format = CHAIN_OF_DENSITY_RESPONSE_FORMAT
 
-        result = await self._call_llm(prompt, temperature=0.3)
+        result = await self._call_llm(
+            prompt,
+            temperature=0.3,
+            response_format=response_format,
+            max_tokens=SECTION_SUMMARY_MAX_OUTPUT_TOKENS
+        )
 
         if "error" in result:
             return {
@@ -686,23 +1706,76 @@ class SummarizationService:
 
         return result
 
+    async def summarize_all_sections(
+        self,
+        section_titles: List[str],
+        section_contents: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Apply Chain of Density to several sections in a single LLM request.
+
+        The model sees every section at once, so delta extraction across sections
+        needs no separate context block.
+
+        Args:
+            section_titles: Title of each section, in video order
+            section_contents: Content of each section, in the same order
+
+        Returns:
+            Summary dict per section, or None where the response had no usable entry
+            (callers fall back to summarize_section for those)
+        """
+        prompt = MULTI_SECTION_CHAIN_OF_DENSITY_PROMPT.format(
+            section_count=len(section_titles),
+            section_contents="\n\n".join(
+                f"<<<SECTION {n}: {title}>>>\n{_truncate_to_tokens(content, MAX_SECTION_PROMPT_TOKENS)}"
+                for n, (title, content) in enumerate(zip(section_titles, section_contents), start=1)
+            )
+        )
+
+        result = await self._call_llm(
+            prompt, temperature=0.3, response_format=MULTI_SECTION_CHAIN_OF_DENSITY_RESPONSE_FORMAT
+        )
+        summaries: List[Optional[Dict[str, Any]]] = [None] * len(section_titles)
+        if "error" in result:
+            logger.warning(f"Batched Chain of Density failed for {len(section_titles)} sections: {result['error']}")
+            return summaries
+
+        for item in result.get("sections", []):
+            position = item.get("index", 0) - 1
+            if 0 <= position < len(summaries) and item.get("summary"):
+                summaries[position] = {
+                    "summary": item["summary"],
+                    "key_points": item.get("key_points", []),
+                    "entities": item.get("entities", [])
+                }
+        return summaries
+
     async def generate_executive_summary(
         self,
         video_title: str,
-        section_summaries: List[Dict[str, Any]]
+        section_summaries: List[Dict[str, Any]],
+        summaries_text: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Generate executive summary from section summaries"""
-        summaries_text = "\n\n".join([
-            f"**{s.get('title', 'Section')}** ({s.get('timestamp', 'N/A')})\n{s.get('summary', '')}"
-            for s in section_summaries
-        ])
+        """Generate executive summary from section summaries (or their pre-formatted `summaries_text`)"""
+        if summaries_text is None:
+            summaries_text = "\n\n".join(
+                f"**{s.get('title', 'Section')}** ({s.get('timestamp', 'N/A')})\n{s.get('summary', '')}"
+                for s in section_summaries
+            )
 
         prompt = EXECUTIVE_SUMMARY_PROMPT.format(
             video_title=video_title,
             section_summaries=summaries_text
         )
 
-        result = await self._call_llm(prompt, temperature=0.3)
+        result = await self._call_llm(
+            prompt,
+            temperature=0.3,
+            model_override=self.settings.llm_exec_model,
+            response_format=EXECUTIVE_SUMMARY_RESPONSE_FORMAT,
+            max_tokens=EXECUTIVE_SUMMARY_MAX_OUTPUT_TOKENS
+        )
 
         if "error" in result:
             return {
@@ -735,7 +1808,7 @@ class SummarizationService:
             }
 
             prompt = CONSOLIDATION_PROMPT.format(
-                summary_json=json.dumps(summary_for_consolidation, indent=2)
+                summary_json=_dump_prompt_json(summary_for_consolidation)
             )
 
             # Use gpt-4o for consolidation - it follows complex delta instructions better
@@ -767,6 +1840,45 @@ class SummarizationService:
             logger.error(f"Error consolidating summary: {e}")
             return raw_summary
 
+    async def finalize_summary(self, video_title: str, raw_summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Write the executive summary and consolidate the sections in one gpt-4o call.
+
+        Fuses generate_executive_summary and consolidate_summary, which would
+        otherwise read the same section summaries in two sequential round trips.
+
+        Returns:
+            `raw_summary` with the executive fields and consolidated sections filled
+            in, or None when the call fails (callers fall back to the separate steps)
+        """
+        sections = raw_summary.get("sections", [])
+        prompt = FINALIZE_SUMMARY_PROMPT.format(
+            video_title=video_title,
+            sections_json=_dump_prompt_json(sections)
+        )
+        result = await self._call_llm(
+            prompt,
+            temperature=0.2,
+            model_override="gpt-4o",
+            response_format=FINAL_SUMMARY_RESPONSE_FORMAT
+        )
+        if "error" in result or len(result.get("sections", _EMPTY)) != len(sections):
+            logger.warning(f"Fused finalization failed, using separate steps: {result.get('error', 'section count changed')}")
+            return None
+
+        return {
+            **raw_summary,
+            "executive_summary": result["executive_summary"],
+            "key_takeaways": result["key_takeaways"],
+            "target_audience": result["target_audience"],
+            "sections": result["sections"],
+            "metadata": {
+                **raw_summary.get("metadata", {}),
+                "consolidated": True,
+                "consolidation_model": "gpt-4o"
+            }
+        }
+
     async def deduplicate_key_points(
         self,
         all_points: List[str],
@@ -775,8 +1887,8 @@ class SummarizationService:
         """
         Apply MMR-inspired deduplication to key points.
 
-        Uses LLM to identify semantically similar points and merge them,
-        while preserving unique insights.
+        Near-verbatim duplicates are merged locally first; the LLM is only asked
+        to merge semantically similar points if more than `max_points` remain.
 
         Args:
             all_points: List of all key points from all sections
@@ -792,16 +1904,23 @@ class SummarizationService:
         if len(all_points) <= max_points:
             return all_points
 
+        all_points = _merge_near_duplicate_points(all_points)
+        if len(all_points) <= max_points:
+            logger.info(f"Local deduplication reduced key points to {len(all_points)}, skipping LLM pass")
+            return all_points
+
         if not self.is_available():
             # Fallback: simple truncation
             return all_points[:max_points]
 
         try:
             prompt = MMR_DEDUP_PROMPT.format(
-                key_points_json=json.dumps(all_points, indent=2)
+                key_points_json=_dump_prompt_json(all_points)
             )
 
-            result = await self._call_llm(prompt, temperature=0.2)
+            result = await self._call_llm(
+                prompt, temperature=0.2, model_override=self.settings.llm_dedup_model
+            )
 
             if "error" in result:
                 logger.warning(f"Deduplication failed: {result['error']}")
@@ -827,220 +1946,642 @@ class SummarizationService:
     def chunk_transcript(
         self,
         transcript: str,
-        chunk_size: int = CHUNK_SIZE_CHARS,
-        overlap: int = CHUNK_OVERLAP_CHARS
+        chunk_size: int = CHUNK_SIZE_TOKENS,
+        overlap: int = CHUNK_OVERLAP_TOKENS
     ) -> List[Dict[str, Any]]:
         """
         Split transcript into fixed-size chunks with overlap.
 
+        Sizes are measured in tokens using tiktoken, so dense text (code, CJK) and
+        sparse text both produce chunks of the same LLM cost. Without tiktoken the
+        sizes are approximated as CHARS_PER_TOKEN characters per token.
+
+        Chunk boundaries are memoized per transcript, so retries and fallbacks
+        (e.g. large-context -> v2) only re-slice the transcript instead of re-tokenizing it.
+
         Args:
             transcript: Full video transcript
-            chunk_size: Target size of each chunk in characters
-            overlap: Number of overlapping characters between chunks
+            chunk_size: Target size of each chunk in tokens
+            overlap: Number of overlapping tokens between chunks
 
         Returns:
-            List of chunk dicts with content, start_pos, end_pos
+            List of chunk dicts with start_pos, core_start, end_pos offsets into
+            `transcript` (a reference, not a copy). transcript[start_pos:core_start]
+            overlaps the previous chunk and is context only; the rest is the core.
         """
+        cache_key = (hashlib.sha256(transcript.encode("utf-8")).hexdigest(), chunk_size, overlap)
+        boundaries = _chunk_boundaries_cache.get(cache_key)
+        if boundaries is None:
+            boundaries = self._compute_chunk_boundaries(transcript, chunk_size, overlap)
+            _chunk_boundaries_cache[cache_key] = boundaries
+
+        transcript_length = max(len(transcript), 1)
         chunks = []
+        previous_end = 0
+        for index, (start_pos, end_pos) in enumerate(boundaries):
+            # The overlap with the previous chunk is context only; the rest is this chunk's core
+            core_start = min(max(previous_end, start_pos), end_pos)
+            chunks.append({
+                "index": index,
+                "transcript": transcript,
+                "start_pos": start_pos,
+                "core_start": core_start,
+                "end_pos": end_pos,
+                "start_pct": start_pos / transcript_length,
+                "end_pct": end_pos / transcript_length
+            })
+            previous_end = end_pos
+        return chunks
+
+    def _compute_chunk_boundaries(
+        self,
+        transcript: str,
+        chunk_size: int,
+        overlap: int
+    ) -> List[Tuple[int, int]]:
+        """Compute (start_pos, end_pos) character ranges for each chunk"""
+        boundaries = []
         transcript_length = len(transcript)
 
-        if transcript_length <= chunk_size:
+        # Tokenize once; chunk boundaries are then looked up as character offsets
+        offsets = _token_offsets(transcript)
+        total_tokens = len(offsets) if offsets is not None else transcript_length // CHARS_PER_TOKEN
+
+        if total_tokens <= chunk_size:
             # Short transcript - single chunk
-            return [{
-                "index": 0,
-                "content": transcript,
-                "start_pos": 0,
-                "end_pos": transcript_length,
-                "start_pct": 0.0,
-                "end_pct": 1.0
-            }]
+            return [(0, transcript_length)]
+
+        def shift(char_pos: int, n_tokens: int) -> int:
+            """Character position n_tokens after (or before, if negative) char_pos"""
+            if offsets is None:
+                return min(max(char_pos + n_tokens * CHARS_PER_TOKEN, 0), transcript_length)
+            token_index = bisect_left(offsets, char_pos) + n_tokens
+            if token_index >= len(offsets):
+                return transcript_length
+            return offsets[max(token_index, 0)]
 
         pos = 0
-        chunk_index = 0
 
         while pos < transcript_length:
             # Calculate end position
-            end_pos = min(pos + chunk_size, transcript_length)
+            end_pos = shift(pos, chunk_size)
 
-            # Try to break at a sentence boundary (. ! ? followed by space)
+            # Try to break at the last sentence boundary in the final 500 chars
             if end_pos < transcript_length:
-                # Look for sentence boundary in last 500 chars
                 search_start = max(end_pos - 500, pos)
-                chunk_text = transcript[search_start:end_pos]
-
-                # Find last sentence boundary
-                for boundary in ['. ', '! ', '? ', '.\n', '!\n', '?\n']:
-                    last_boundary = chunk_text.rfind(boundary)
-                    if last_boundary > 0:
-                        end_pos = search_start + last_boundary + len(boundary)
-                        break
-
-            # Extract chunk
-            chunk_content = transcript[pos:end_pos].strip()
-
-            if len(chunk_content) >= MIN_CHUNK_SIZE:
-                chunks.append({
-                    "index": chunk_index,
-                    "content": chunk_content,
-                    "start_pos": pos,
-                    "end_pos": end_pos,
-                    "start_pct": pos / transcript_length,
-                    "end_pct": end_pos / transcript_length
-                })
-                chunk_index += 1
-
-            # Move position with overlap
-            pos = end_pos - overlap
+                match = None
+                for match in _SENTENCE_BOUNDARY_RE.finditer(transcript, search_start + 1, end_pos):
+                    pass
+                if match:
+                    end_pos = match.end()
+
+            # Keep the chunk unless it is a tiny fragment
+            if _stripped_length(transcript, pos, end_pos) >= MIN_CHUNK_SIZE:
+                boundaries.append((pos, end_pos))
+
+            # Move position with overlap (always make forward progress)
+            next_pos = shift(end_pos, -overlap)
+            pos = next_pos if next_pos > pos else end_pos
             if pos >= transcript_length - MIN_CHUNK_SIZE:
                 break
 
-        logger.info(f"Chunked transcript into {len(chunks)} chunks (avg {transcript_length // max(len(chunks), 1)} chars each)")
-        return chunks
+        logger.info(f"Chunked transcript into {len(boundaries)} chunks (avg {total_tokens // max(len(boundaries), 1)} tokens each)")
+        return boundaries
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
     def _estimate_timestamp(
-        self,
         position_pct: float,
         estimated_duration_minutes: int = 60
     ) -> str:
         """
         Estimate timestamp from position percentage.
 
-        Args:
-            position_pct: Position as percentage (0.0 to 1.0)
-            estimated_duration_minutes: Estimated video duration in minutes
+        Memoized: the same chunk boundaries are formatted by section grouping,
+        single-pass assembly and the fallback sections.
+
+        Args:
+            position_pct: Position as percentage (0.0 to 1.0)
+            estimated_duration_minutes: Estimated video duration in minutes
+
+        Returns:
+            Timestamp string in MM:SS format
+        """
+        total_seconds = int(position_pct * estimated_duration_minutes * 60)
+        minutes = total_seconds // 60
+        seconds = total_seconds % 60
+        return f"{minutes}:{seconds:02d}"
+
+    async def summarize_chunk(
+        self,
+        chunk: Dict[str, Any],
+        total_chunks: int
+    ) -> Dict[str, Any]:
+        """
+        Summarize a single chunk (MAP step).
+
+        Args:
+            chunk: Chunk dict with content and metadata
+            total_chunks: Total number of chunks for context
+
+        Returns:
+            Summary dict with summary, key_points, suggested_title, entities
+        """
+        result = await self._call_llm(self._chunk_summary_prompt(chunk, total_chunks), temperature=0.3)
+        if result.get("fatal"):
+            raise LLMUnrecoverableError(result["error"])
+        return self._chunk_summary_from_result(chunk, result)
+
+    def _chunk_summary_prompt(self, chunk: Dict[str, Any], total_chunks: int) -> str:
+        """Build the MAP prompt for a single chunk"""
+        return CHUNK_SUMMARY_PROMPT.format(
+            chunk_index=chunk["index"] + 1,
+            total_chunks=total_chunks,
+            chunk_content=_chunk_prompt_content(chunk)
+        )
+
+    def _chunk_summary_from_result(self, chunk: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a parsed MAP response (or error) into a chunk summary dict"""
+        if "error" in result:
+            return {
+                "summary": f"Chunk {chunk['index'] + 1} summary unavailable.",
+                "key_points": [],
+                "suggested_title": f"Part {chunk['index'] + 1}",
+                "entities": []
+            }
+
+        return {
+            "index": chunk["index"],
+            "summary": result.get("summary", ""),
+            "key_points": result.get("key_points", []),
+            "suggested_title": result.get("suggested_title", f"Part {chunk['index'] + 1}"),
+            "entities": result.get("entities", []),
+            "start_pct": chunk["start_pct"],
+            "end_pct": chunk["end_pct"]
+        }
+
+    async def _summarize_chunk_group(
+        self,
+        chunks: List[Dict[str, Any]],
+        total_chunks: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize several chunks in a single LLM request (batched MAP step).
+
+        Chunks whose entry is missing from the response are summarized individually.
+
+        Args:
+            chunks: Chunk dicts to summarize together
+            total_chunks: Total number of chunks for context
+
+        Returns:
+            Summary dicts in the same order as `chunks`
+        """
+        if len(chunks) == 1:
+            return [await self.summarize_chunk(chunks[0], total_chunks)]
+
+        prompt = CHUNK_GROUP_SUMMARY_PROMPT.format(
+            group_count=len(chunks),
+            total_chunks=total_chunks,
+            chunk_contents="\n\n".join(
+                f"<<<CHUNK {chunk['index'] + 1}>>>\n{_chunk_prompt_content(chunk)}"
+                for chunk in chunks
+            )
+        )
+
+        result = await self._call_llm(prompt, temperature=0.3)
+        if result.get("fatal"):
+            raise LLMUnrecoverableError(result["error"])
+        summaries = result.get("summaries") if "error" not in result else None
+        if not isinstance(summaries, list) or len(summaries) != len(chunks):
+            logger.warning(f"Grouped chunk summary unusable for {len(chunks)} chunks, summarizing individually")
+            summaries = [None] * len(chunks)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        missing = []
+        for position, (chunk, item) in enumerate(zip(chunks, summaries)):
+            if not isinstance(item, dict) or not item.get("summary"):
+                results.append(None)
+                missing.append(position)
+                continue
+            results.append({
+                "index": chunk["index"],
+                "summary": item.get("summary", ""),
+                "key_points": item.get("key_points", []),
+                "suggested_title": item.get("suggested_title", f"Part {chunk['index'] + 1}"),
+                "entities": item.get("entities", []),
+                "start_pct": chunk["start_pct"],
+                "end_pct": chunk["end_pct"]
+            })
+
+        # Missing entries are summarized individually, concurrently
+        retried = await _gather_bounded(
+            [self.summarize_chunk(chunks[position], total_chunks) for position in missing]
+        )
+        for position, result in zip(missing, retried):
+            results[position] = result
+        return results
+
+    async def _lookup_cached_chunk_summaries(
+        self,
+        chunks: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[Optional[List[float]]]]:
+        """
+        Resolve chunks against the semantic cache.
+
+        All chunks are embedded in one call, using the same truncated text the
+        MAP prompt sees, so near-identical segments (intros, ad reads) across
+        videos map to the same cached summary.
+
+        Returns:
+            (summaries with None for misses, embedding per chunk or None)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
+        vectors: List[Optional[List[float]]] = [None] * len(chunks)
+        if not chunks or not self.settings.chunk_semantic_cache_enabled:
+            return results, vectors
+
+        embeddings = await self._embed_texts([
+            _chunk_core(chunk) for chunk in chunks
+        ])
+        if not embeddings:
+            return results, vectors
+
+        vectors = embeddings
+        cached_summaries = self.chunk_summary_cache.lookup_many(vectors)
+        for position, (chunk, cached) in enumerate(zip(chunks, cached_summaries)):
+            if cached is not None:
+                results[position] = {
+                    **cached,
+                    "index": chunk["index"],
+                    "start_pct": chunk["start_pct"],
+                    "end_pct": chunk["end_pct"]
+                }
+
+        hits = sum(result is not None for result in results)
+        if hits:
+            logger.info(f"MAP step: {hits}/{len(chunks)} chunk summaries served from semantic cache")
+        return results, vectors
+
+    def _remember_chunk_summary(self, vector: Optional[List[float]], result: Dict[str, Any]):
+        """Add a fresh chunk summary to the semantic cache"""
+        # Only cache successful summaries (fallbacks carry no key points)
+        if vector is None or not result.get("key_points"):
+            return
+        self.chunk_summary_cache.add(vector, {
+            "summary": result.get("summary", ""),
+            "key_points": result.get("key_points", []),
+            "suggested_title": result.get("suggested_title", ""),
+            "entities": result.get("entities", [])
+        })
+
+    async def _lookup_cached_section_summaries(
+        self,
+        section_contents: List[str]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[Optional[List[float]]]]:
+        """
+        Resolve v1 section contents against the section semantic cache.
+
+        Embeds the text the Chain of Density prompt sees, in one call. Hits are
+        matched on content alone: the earlier-section context only steers which
+        details count as new, and consolidation removes overlap afterwards.
 
         Returns:
-            Timestamp string in MM:SS format
+            (summaries with None for misses, embedding per section or None)
         """
-        total_seconds = int(position_pct * estimated_duration_minutes * 60)
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        return f"{minutes}:{seconds:02d}"
+        results: List[Optional[Dict[str, Any]]] = [None] * len(section_contents)
+        vectors: List[Optional[List[float]]] = [None] * len(section_contents)
+        if not section_contents or not self.settings.chunk_semantic_cache_enabled:
+            return results, vectors
 
-    async def summarize_chunk(
+        embeddings = await self._embed_texts([
+            _truncate_to_tokens(content, MAX_SECTION_PROMPT_TOKENS) for content in section_contents
+        ])
+        if not embeddings:
+            return results, vectors
+
+        vectors = embeddings
+        results = self.section_summary_cache.lookup_many(vectors)
+        hits = sum(result is not None for result in results)
+        if hits:
+            logger.info(f"{hits}/{len(section_contents)} section summaries served from semantic cache")
+        return results, vectors
+
+    async def _summarize_chunks_realtime(
         self,
-        chunk: Dict[str, Any],
+        chunks: List[Dict[str, Any]],
+        total_chunks: int,
+        max_concurrent: int = MAX_CONCURRENT_LLM_CALLS,
+        group_size: int = CHUNK_GROUP_SIZE
+    ) -> List[Dict[str, Any]]:
+        """Summarize chunks through grouped chat completions, preserving order"""
+        groups = [chunks[i:i + group_size] for i in range(0, len(chunks), group_size)]
+
+        # Run groups in parallel, bounded to avoid hammering the API
+        group_results = await _gather_bounded(
+            (self._summarize_chunk_group(group, total_chunks) for group in groups),
+            limit=max(1, min(max_concurrent, MAX_CONCURRENT_CHUNK_GROUPS))
+        )
+        return [result for summaries in group_results for result in summaries]
+
+    async def _summarize_chunks_via_batch_api(
+        self,
+        chunks: List[Dict[str, Any]],
         total_chunks: int
-    ) -> Dict[str, Any]:
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Submit chunks as one Batch API job; entries are None where the batch gave no usable answer"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
+
+        batches = getattr(self.client, "batches", None)
+        if batches is None:
+            logger.warning("OpenAI SDK has no Batch API support, summarizing in real time. Run: pip install -U openai")
+            return results
+
+        lines = [
+            orjson.dumps({
+                "custom_id": f"chunk-{position}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_request_body(
+                    self._chunk_summary_prompt(chunk, total_chunks), 0.3, self.settings.llm_model
+                )
+            })
+            for position, chunk in enumerate(chunks)
+        ]
+
+        try:
+            input_file = await self.client.files.create(
+                file=("chunk_summaries.jsonl", b"\n".join(lines), "application/jsonl"),
+                purpose="batch"
+            )
+            batch = await batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"MAP step: Submitted batch {batch.id} with {len(chunks)} chunks")
+
+            delay = BATCH_POLL_INITIAL_SECONDS
+            waited = 0.0
+            while batch.status not in BATCH_TERMINAL_STATUSES and waited < BATCH_MAX_WAIT_SECONDS:
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+                batch = await batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.warning(f"Batch {batch.id} ended with status {batch.status}")
+                return results
+
+            output = await self.client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                body = ((record.get("response") or {}).get("body") or {})
+                choices = body.get("choices") or []
+                if record.get("error") or not choices:
+                    continue
+                try:
+                    position = int(record["custom_id"].rsplit("-", 1)[1])
+                    parsed = _parse_llm_json(choices[0]["message"]["content"])
+                except (KeyError, ValueError, IndexError, json.JSONDecodeError) as e:
+                    logger.warning(f"Skipping unusable batch line {record.get('custom_id')}: {e}")
+                    continue
+                if 0 <= position < len(chunks):
+                    results[position] = self._chunk_summary_from_result(chunks[position], parsed)
+        except Exception as e:
+            logger.error(f"Batch summarization error: {e}")
+
+        return results
+
+    async def summarize_chunks_batch(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Summarize a single chunk (MAP step).
+        Summarize chunks through the OpenAI Batch API (offline MAP step).
+
+        Batch jobs cost half as much and draw on a separate rate-limit pool, but
+        may take up to the 24h completion window, so this is only for background
+        ingestion. Chunks without a usable batch response are summarized in real time.
 
         Args:
-            chunk: Chunk dict with content and metadata
-            total_chunks: Total number of chunks for context
+            chunks: List of chunk dicts
 
         Returns:
-            Summary dict with summary, key_points, suggested_title, entities
+            List of chunk summaries in the same order as `chunks`
         """
-        prompt = CHUNK_SUMMARY_PROMPT.format(
-            chunk_index=chunk["index"] + 1,
-            total_chunks=total_chunks,
-            chunk_content=chunk["content"][:8000]  # Limit content size
-        )
+        total_chunks = len(chunks)
+        results, vectors = await self._lookup_cached_chunk_summaries(chunks)
 
-        result = await self._call_llm(prompt, temperature=0.3)
+        pending = [position for position, result in enumerate(results) if result is None]
+        if pending:
+            batched = await self._summarize_chunks_via_batch_api([chunks[p] for p in pending], total_chunks)
+            for position, result in zip(pending, batched):
+                results[position] = result
 
-        if "error" in result:
-            return {
-                "summary": f"Chunk {chunk['index'] + 1} summary unavailable.",
-                "key_points": [],
-                "suggested_title": f"Part {chunk['index'] + 1}",
-                "entities": []
-            }
+        missing = [position for position, result in enumerate(results) if result is None]
+        if missing:
+            logger.info(f"MAP step: {len(missing)} chunks missing from batch, summarizing in real time")
+            fallback = await self._summarize_chunks_realtime([chunks[p] for p in missing], total_chunks)
+            for position, result in zip(missing, fallback):
+                results[position] = result
 
-        return {
-            "index": chunk["index"],
-            "summary": result.get("summary", ""),
-            "key_points": result.get("key_points", []),
-            "suggested_title": result.get("suggested_title", f"Part {chunk['index'] + 1}"),
-            "entities": result.get("entities", []),
-            "start_pct": chunk["start_pct"],
-            "end_pct": chunk["end_pct"]
-        }
+        for position in pending:
+            self._remember_chunk_summary(vectors[position], results[position])
+
+        logger.info(f"MAP step complete: {total_chunks} chunk summaries generated via batch")
+        return results
 
     async def summarize_chunks_parallel(
         self,
         chunks: List[Dict[str, Any]],
-        max_concurrent: int = 5
+        max_concurrent: int = MAX_CONCURRENT_LLM_CALLS,
+        group_size: int = CHUNK_GROUP_SIZE,
+        batch_mode: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
         """
         Summarize all chunks in parallel (MAP step).
 
+        Chunks are folded `group_size` at a time into a single request to save
+        round-trips and repeated prompt tokens.
+
         Args:
             chunks: List of chunk dicts
             max_concurrent: Maximum concurrent API calls
+            group_size: Number of chunks summarized per request
+            batch_mode: Use the Batch API; defaults to the SUMMARIZATION_MODE setting
 
         Returns:
             List of chunk summaries
+
+        Raises:
+            LLMUnrecoverableError: A chunk hit an error every other chunk would also hit;
+                in-flight requests are cancelled
         """
+        if batch_mode is None:
+            batch_mode = self.settings.summarization_mode == "batch"
+        if batch_mode:
+            return await self.summarize_chunks_batch(chunks)
+
         total_chunks = len(chunks)
         logger.info(f"MAP step: Summarizing {total_chunks} chunks in parallel (max {max_concurrent} concurrent)...")
 
-        # Create semaphore to limit concurrent calls
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def summarize_with_semaphore(chunk):
-            async with semaphore:
-                return await self.summarize_chunk(chunk, total_chunks)
-
-        # Run all summaries in parallel
-        tasks = [summarize_with_semaphore(chunk) for chunk in chunks]
-        results = await asyncio.gather(*tasks)
+        # Reuse cached summaries; everything else is summarized in groups
+        results, vectors = await self._lookup_cached_chunk_summaries(chunks)
+        pending = [position for position, result in enumerate(results) if result is None]
 
-        # Sort by index to maintain order
-        results = sorted(results, key=lambda x: x.get("index", 0))
+        summaries = await self._summarize_chunks_realtime(
+            [chunks[p] for p in pending], total_chunks, max_concurrent, group_size
+        )
+        for position, result in zip(pending, summaries):
+            results[position] = result
+            self._remember_chunk_summary(vectors[position], result)
 
         logger.info(f"MAP step complete: {len(results)} chunk summaries generated")
         return results
 
+    async def _merge_pair(
+        self,
+        left: Dict[str, Any],
+        right: Dict[str, Any],
+        total_chunks: int
+    ) -> Dict[str, Any]:
+        """
+        Merge two adjacent partial summaries into one (a single REFINE hop).
+
+        Args:
+            left: Earlier node with summary, key_points and first/last chunk numbers
+            right: Later node in the same shape
+            total_chunks: Total number of chunks for context
+
+        Returns:
+            Merged node covering both chunk ranges
+        """
+        def chunk_range(node: Dict[str, Any]) -> str:
+            if node["first"] == node["last"]:
+                return str(node["first"])
+            return f"{node['first']}-{node['last']}"
+
+        prompt = REFINE_ASSEMBLY_PROMPT.format(
+            left_range=chunk_range(left),
+            right_range=chunk_range(right),
+            total_chunks=total_chunks,
+            left_summary=left["summary"],
+            left_points=_dump_prompt_json(left["key_points"][-10:]),  # Last 10 points
+            right_summary=right["summary"],
+            right_points=_dump_prompt_json(right["key_points"][:10])
+        )
+
+        result = await self._call_llm(prompt, temperature=0.3)
+
+        if "error" in result:
+            # Keep both halves so no content is lost
+            summary = " ".join(part for part in (left["summary"], right["summary"]) if part)
+            key_points = None
+        else:
+            summary = result.get("merged_summary") or left["summary"]
+            key_points = result.get("key_points")
+
+        if not key_points:
+            # Nodes are private to the reduce, so grow the left list in place instead of copying both
+            key_points = left["key_points"]
+            key_points.extend(right["key_points"])
+
+        return {
+            "summary": summary,
+            "key_points": key_points,
+            "first": left["first"],
+            "last": right["last"]
+        }
+
     async def refine_chunk_summaries(
         self,
-        chunk_summaries: List[Dict[str, Any]]
+        chunk_summaries: List[Dict[str, Any]],
+        max_concurrent: int = MAX_CONCURRENT_LLM_CALLS,
+        max_reduce_tokens: int = REDUCE_MAX_INPUT_TOKENS
     ) -> Dict[str, Any]:
         """
-        Sequentially refine chunk summaries into a coherent whole (REFINE step).
+        Refine chunk summaries into a coherent whole (REFINE step).
+
+        When all summaries fit in `max_reduce_tokens`, a single REDUCE call sees
+        every chunk at once. Otherwise adjacent summaries are merged pairwise in
+        rounds, with each round's merges running concurrently, so N chunks take
+        ~log2(N) sequential LLM hops instead of N-1.
 
         Args:
             chunk_summaries: List of chunk summary dicts from MAP step
+            max_concurrent: Maximum concurrent API calls per round
+            max_reduce_tokens: Input budget for the single-call REDUCE
 
         Returns:
-            Refined summary with running_summary and all_key_points
+            Refined summary with running_summary and all_key_points, plus an
+            `executive` draft (executive_summary, key_takeaways, target_audience)
+            when the single-call REDUCE produced one
         """
         if not chunk_summaries:
             return {"running_summary": "", "all_key_points": []}
 
-        logger.info(f"REFINE step: Assembling {len(chunk_summaries)} chunk summaries sequentially...")
-
-        # Start with first chunk
-        running_summary = chunk_summaries[0].get("summary", "")
-        all_key_points = chunk_summaries[0].get("key_points", [])[:]
-
-        # Refine with each subsequent chunk
-        for i, chunk_summary in enumerate(chunk_summaries[1:], start=2):
-            logger.info(f"  Refining with chunk {i}/{len(chunk_summaries)}...")
-
-            prompt = REFINE_ASSEMBLY_PROMPT.format(
-                running_summary=running_summary,
-                covered_points=json.dumps(all_key_points[:10], indent=2),  # Last 10 points
-                chunk_index=i,
-                total_chunks=len(chunk_summaries),
-                new_chunk_summary=json.dumps({
-                    "summary": chunk_summary.get("summary", ""),
-                    "key_points": chunk_summary.get("key_points", []),
-                    "suggested_title": chunk_summary.get("suggested_title", "")
-                }, indent=2)
-            )
-
-            result = await self._call_llm(prompt, temperature=0.3)
+        total_chunks = len(chunk_summaries)
 
-            if "error" not in result:
-                running_summary = result.get("updated_summary", running_summary)
-                new_points = result.get("new_points_added", [])
-                all_key_points.extend(new_points)
+        if total_chunks > 1:
+            chunk_summaries_json = _dump_prompt_json([
+                {"summary": cs.get("summary", ""), "key_points": cs.get("key_points", [])}
+                for cs in chunk_summaries
+            ])
+            if _count_tokens(chunk_summaries_json) <= max_reduce_tokens:
+                logger.info(f"REFINE step: Reducing {total_chunks} chunk summaries in one call...")
+                result = await self._call_llm(
+                    REDUCE_ALL_PROMPT.format(total_chunks=total_chunks, chunk_summaries_json=chunk_summaries_json),
+                    temperature=0.3
+                )
+                if "error" not in result and result.get("merged_summary"):
+                    all_key_points = result.get("key_points") or [
+                        point for cs in chunk_summaries for point in cs.get("key_points", _EMPTY)
+                    ]
+                    logger.info(f"REFINE step complete: Summary assembled with {len(all_key_points)} key points in 1 call")
+                    refined = {
+                        "running_summary": result["merged_summary"],
+                        "all_key_points": all_key_points
+                    }
+                    if result.get("executive_summary"):
+                        refined["executive"] = {
+                            "executive_summary": result["executive_summary"],
+                            "key_takeaways": result.get("key_takeaways", []),
+                            "target_audience": result.get("target_audience", "")
+                        }
+                    return refined
+                logger.warning("Single-call REDUCE failed, falling back to pairwise merges")
+
+        logger.info(f"REFINE step: Merging {total_chunks} chunk summaries pairwise...")
+
+        level = [
+            {
+                "summary": cs.get("summary", ""),
+                "key_points": list(cs.get("key_points", [])),
+                "first": i,
+                "last": i
+            }
+            for i, cs in enumerate(chunk_summaries, start=1)
+        ]
+
+        rounds = 0
+        while len(level) > 1:
+            rounds += 1
+            logger.info(f"  Refine round {rounds}: merging {len(level)} summaries...")
+            merged = await _gather_bounded(
+                (
+                    self._merge_pair(level[i], level[i + 1], total_chunks)
+                    for i in range(0, len(level) - 1, 2)
+                ),
+                limit=max_concurrent
+            )
+            if len(level) % 2:
+                merged.append(level[-1])
+            level = merged
 
-        logger.info(f"REFINE step complete: Summary assembled with {len(all_key_points)} key points")
+        all_key_points = level[0]["key_points"]
+        logger.info(f"REFINE step complete: Summary assembled with {len(all_key_points)} key points in {rounds} rounds")
         return {
-            "running_summary": running_summary,
+            "running_summary": level[0]["summary"],
             "all_key_points": all_key_points
         }
 
@@ -1077,10 +2618,10 @@ class SummarizationService:
             })
 
         prompt = SECTION_TITLE_PROMPT.format(
-            chunk_summaries_json=json.dumps(chunk_data, indent=2)
+            chunk_summaries_json=_dump_prompt_json(chunk_data)
         )
 
-        result = await self._call_llm(prompt, temperature=0.3)
+        result = await self._call_llm(prompt, temperature=0.3, response_format=SECTION_GROUPING_RESPONSE_FORMAT)
 
         if "error" in result:
             # Fallback: each chunk becomes a section
@@ -1099,39 +2640,110 @@ class SummarizationService:
             return sections
 
         # Process LLM result
-        sections = []
-        for section_data in result.get("sections", []):
-            chunk_indices = section_data.get("chunk_indices", [])
-
-            # Calculate timestamp from chunk positions
-            if chunk_indices:
-                first_chunk = chunk_summaries[chunk_indices[0]] if chunk_indices[0] < len(chunk_summaries) else {}
-                last_chunk = chunk_summaries[chunk_indices[-1]] if chunk_indices[-1] < len(chunk_summaries) else {}
-                start_time = self._estimate_timestamp(first_chunk.get("start_pct", 0), estimated_duration_minutes)
-                end_time = self._estimate_timestamp(last_chunk.get("end_pct", 0), estimated_duration_minutes)
-            else:
-                start_time = section_data.get("start_time", "0:00")
-                end_time = section_data.get("end_time", "0:00")
-
-            # Collect key points and entities from grouped chunks
-            section_key_points = []
-            section_entities = []
-            for idx in chunk_indices:
-                if idx < len(chunk_summaries):
-                    section_key_points.extend(chunk_summaries[idx].get("key_points", []))
-                    section_entities.extend(chunk_summaries[idx].get("entities", []))
-
-            sections.append({
-                "title": section_data.get("title", "Section"),
-                "timestamp": f"{start_time} - {end_time}",
-                "summary": section_data.get("combined_summary", ""),
-                "key_points": section_key_points[:5],  # Limit points per section
-                "entities": list(set(section_entities))[:5]
-            })
+        sections = [
+            self._build_section(section_data, chunk_summaries, estimated_duration_minutes)
+            for section_data in result.get("sections", [])
+        ]
 
         logger.info(f"Created {len(sections)} sections from {len(chunk_summaries)} chunks")
         return sections
 
+    def _build_section(
+        self,
+        section_data: Dict[str, Any],
+        chunk_summaries: List[Dict[str, Any]],
+        estimated_duration_minutes: int
+    ) -> Dict[str, Any]:
+        """Turn an LLM section grouping into a section dict with timestamps, points and entities"""
+        chunk_count = len(chunk_summaries)
+        # Drop out-of-range indices once instead of bounds-checking on every access
+        valid = [idx for idx in section_data.get("chunk_indices", []) if 0 <= idx < chunk_count]
+
+        # Calculate timestamp from chunk positions
+        if valid:
+            start_time = self._estimate_timestamp(chunk_summaries[valid[0]].get("start_pct", 0), estimated_duration_minutes)
+            end_time = self._estimate_timestamp(chunk_summaries[valid[-1]].get("end_pct", 0), estimated_duration_minutes)
+        else:
+            start_time = section_data.get("start_time", "0:00")
+            end_time = section_data.get("end_time", "0:00")
+
+        # Collect key points (stopping at the 5 kept per section) and entities from grouped chunks
+        grouped = [chunk_summaries[idx] for idx in valid]
+        section_key_points = list(islice(chain.from_iterable(cs.get("key_points", _EMPTY) for cs in grouped), 5))
+        # First-seen entity order, stopping once the 5 kept per section are found
+        section_entities: Dict[str, None] = {}
+        for entity in chain.from_iterable(cs.get("entities", _EMPTY) for cs in grouped):
+            section_entities.setdefault(entity, None)
+            if len(section_entities) >= 5:
+                break
+
+        return {
+            "title": section_data.get("title", "Section"),
+            "timestamp": f"{start_time} - {end_time}",
+            "summary": section_data.get("combined_summary", ""),
+            "key_points": section_key_points,
+            "entities": list(section_entities)
+        }
+
+    async def assemble_summary_single_pass(
+        self,
+        chunk_summaries: List[Dict[str, Any]],
+        video_title: str,
+        estimated_duration_minutes: int = 60
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build sections, executive summary and consolidation in one LLM call (short videos).
+
+        Args:
+            chunk_summaries: List of chunk summary dicts from MAP step
+            video_title: Title of the video
+            estimated_duration_minutes: Estimated video duration for timestamps
+
+        Returns:
+            Dict with executive_summary, key_takeaways, target_audience and sections,
+            or None if the call failed and the multi-step pipeline should run instead
+        """
+        chunk_data = [
+            {
+                "index": i,
+                "suggested_title": cs.get("suggested_title", ""),
+                "timestamp": (
+                    f"{self._estimate_timestamp(cs.get('start_pct', 0), estimated_duration_minutes)} - "
+                    f"{self._estimate_timestamp(cs.get('end_pct', 0), estimated_duration_minutes)}"
+                ),
+                "summary": cs.get("summary", ""),
+                "key_points": cs.get("key_points", [])
+            }
+            for i, cs in enumerate(chunk_summaries)
+        ]
+
+        prompt = SINGLE_PASS_ASSEMBLY_PROMPT.format(
+            video_title=video_title,
+            chunk_summaries_json=_dump_prompt_json(chunk_data)
+        )
+
+        # Same model as the consolidation step this call replaces
+        result = await self._call_llm(prompt, temperature=0.2, model_override="gpt-4o")
+
+        if "error" in result or not result.get("sections") or not result.get("executive_summary"):
+            logger.warning("Single-pass assembly failed, falling back to multi-step pipeline")
+            return None
+
+        sections = []
+        for section_data in result["sections"]:
+            section = self._build_section(section_data, chunk_summaries, estimated_duration_minutes)
+            # Prefer the consolidated points the model kept for this section
+            if section_data.get("key_points"):
+                section["key_points"] = section_data["key_points"][:5]
+            sections.append(section)
+
+        return {
+            "executive_summary": result.get("executive_summary", ""),
+            "key_takeaways": result.get("key_takeaways", []),
+            "target_audience": result.get("target_audience", ""),
+            "sections": sections
+        }
+
     async def generate_summary_v2(
         self,
         transcript: str,
@@ -1168,38 +2780,74 @@ class SummarizationService:
             chunks = self.chunk_transcript(transcript)
             logger.info(f"Created {len(chunks)} chunks")
 
-            # Step 2: MAP - Summarize chunks in parallel
+            # Step 2: MAP - Summarize chunks in parallel. Summaries are requested interactively, so
+            # never wait on a Batch API job here (SUMMARIZATION_MODE=batch is for background callers
+            # of summarize_chunks_parallel)
             logger.info("Step 2: MAP - Parallel chunk summarization...")
-            chunk_summaries = await self.summarize_chunks_parallel(chunks)
+            chunk_summaries = await self.summarize_chunks_parallel(chunks, batch_mode=False)
+
+            metadata = {
+                "model": self.settings.llm_model,
+                "method": "hybrid_map_reduce_refine_v2",
+                "transcript_length": len(transcript),
+                "chunks_processed": len(chunks),
+                "coverage": "100%"
+            }
 
-            # Step 3: REFINE - Sequential assembly
-            logger.info("Step 3: REFINE - Sequential assembly...")
-            refined = await self.refine_chunk_summaries(chunk_summaries)
+            # Short videos: steps 3-6 fit in a single call
+            assembled = None
+            if len(chunk_summaries) <= SMALL_VIDEO_MAX_CHUNKS:
+                logger.info("Steps 3-6: Single-pass assembly for short video...")
+                assembled = await self.assemble_summary_single_pass(
+                    chunk_summaries, video_title, estimated_duration_minutes
+                )
 
-            # Step 4: Group into sections with generated titles
-            logger.info("Step 4: Grouping into sections...")
-            sections = await self.group_into_sections(chunk_summaries, estimated_duration_minutes)
+            if assembled is not None:
+                result = {
+                    "success": True,
+                    "video_id": video_id,
+                    "video_title": video_title,
+                    **assembled,
+                    "total_sections": len(assembled["sections"]),
+                    "metadata": {
+                        **metadata,
+                        "method": "hybrid_map_reduce_single_pass_v2",
+                        "consolidated": True,
+                        "consolidation_model": "gpt-4o"
+                    }
+                }
+                logger.info(f"Summary (v2) generated successfully for: {video_title}")
+                return result
+
+            # Steps 3-4: REFINE and section grouping only read chunk summaries, so they overlap
+            logger.info("Steps 3-4: REFINE assembly and section grouping...")
+            refined, sections = await asyncio.gather(
+                self.refine_chunk_summaries(chunk_summaries),
+                self.group_into_sections(chunk_summaries, estimated_duration_minutes)
+            )
 
-            # Step 5: Generate executive summary
-            logger.info("Step 5: Generating executive summary...")
-            section_text = "\n\n".join([
-                f"**{s.get('title', 'Section')}** ({s.get('timestamp', 'N/A')})\n{s.get('summary', '')}"
-                for s in sections
-            ])
+            # Step 5: Executive summary (already drafted by a single-call REDUCE)
+            executive = refined.get("executive")
+            if executive is None:
+                logger.info("Step 5: Generating executive summary...")
+                section_text = "\n\n".join(
+                    f"**{s.get('title', 'Section')}** ({s.get('timestamp', 'N/A')})\n{s.get('summary', '')}"
+                    for s in sections
+                )
 
-            prompt = FINAL_EXECUTIVE_PROMPT.format(
-                video_title=video_title,
-                section_summaries=section_text
-            )
+                prompt = FINAL_EXECUTIVE_PROMPT.format(
+                    video_title=video_title,
+                    section_summaries=section_text
+                )
 
-            executive = await self._call_llm(prompt, temperature=0.3)
+                executive = await self._call_llm(prompt, temperature=0.3)
 
-            if "error" in executive:
-                executive = {
-                    "executive_summary": refined.get("running_summary", ""),
-                    "key_takeaways": refined.get("all_key_points", [])[:8],
-                    "target_audience": "General viewers"
-                }
+                if "error" in executive:
+                    executive = {
+                        "executive_summary": refined.get("running_summary", ""),
+                        "key_takeaways": refined.get("all_key_points", [])[:8],
+                        "target_audience": "General viewers"
+                    }
 
             # Compile result
             result = {
@@ -1211,13 +2859,7 @@ class SummarizationService:
                 "target_audience": executive.get("target_audience", ""),
                 "sections": sections,
                 "total_sections": len(sections),
-                "metadata": {
-                    "model": self.settings.llm_model,
-                    "method": "hybrid_map_reduce_refine_v2",
-                    "transcript_length": len(transcript),
-                    "chunks_processed": len(chunks),
-                    "coverage": "100%"
-                }
+                "metadata": metadata
             }
 
             # Step 6: Final consolidation with GPT-4o
@@ -1234,6 +2876,20 @@ class SummarizationService:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _format_large_context_section(section: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape one large-context section for the SectionSummary model"""
+        # Note: SectionSummary model requires both 'description' and 'summary' fields
+        summary_text = section.get("summary", "")
+        return {
+            "title": section.get("title", "Section"),
+            "timestamp": section.get("timestamp", "0:00 - 0:00"),
+            "description": summary_text,
+            "summary": summary_text,
+            "key_points": section.get("key_points", []),
+            "entities": section.get("entities", [])
+        }
+
     async def generate_summary_large_context(
         self,
         transcript: str,
@@ -1280,10 +2936,14 @@ class SummarizationService:
                 transcript=transcript
             )
 
+            # Sections are formatted as they stream in, overlapping with the rest of generation
+            sections: List[Dict[str, Any]] = []
             result = await self._call_openrouter(
                 prompt=prompt,
                 temperature=0.3,
-                max_tokens=8000  # Allow detailed output
+                max_tokens=8000,  # Allow detailed output
+                item_key="sections",
+                on_item=lambda section: sections.append(self._format_large_context_section(section))
             )
 
             if "error" in result:
@@ -1295,19 +2955,10 @@ class SummarizationService:
                     estimated_duration_minutes=estimated_duration_minutes
                 )
 
-            # Format sections with proper structure
-            # Note: SectionSummary model requires both 'description' and 'summary' fields
-            sections = []
-            for section in result.get("sections", []):
-                summary_text = section.get("summary", "")
-                sections.append({
-                    "title": section.get("title", "Section"),
-                    "timestamp": section.get("timestamp", "0:00 - 0:00"),
-                    "description": summary_text,  # Required by SectionSummary model
-                    "summary": summary_text,
-                    "key_points": section.get("key_points", []),
-                    "entities": section.get("entities", [])
-                })
+            # Cached or partially streamed responses are formatted from the full parse
+            raw_sections = result.get("sections", [])
+            if len(sections) != len(raw_sections):
+                sections = [self._format_large_context_section(section) for section in raw_sections]
 
             # Compile final result
             final_result = {
@@ -1344,6 +2995,94 @@ class SummarizationService:
             )
 
     async def generate_summary(
+        self,
+        transcript: str,
+        video_title: str,
+        video_id: Optional[str] = None,
+        estimated_duration_minutes: int = 60,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Generate a complete structured summary, reusing a cached result for an identical transcript.
+
+        Args:
+            transcript: Full video transcript
+            video_title: Title of the video
+            video_id: Optional video ID for reference
+            estimated_duration_minutes: Estimated video duration (used for timestamps)
+            use_cache: Set False to force regeneration (e.g. force_regenerate=true)
+
+        Returns:
+            Structured summary with sections, key points, and executive summary
+        """
+        cache_key = SummaryResultCache.make_key(
+            "video", SUMMARY_PROMPT_VERSION, self.settings.llm_model,
+            self.settings.llm_topic_model, self.settings.llm_exec_model, self.settings.llm_dedup_model,
+            self.settings.openrouter_default_model, estimated_duration_minutes, video_title, transcript
+        )
+        if use_cache:
+            cached = self.summary_result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached summary for identical transcript: {video_title}")
+                cached["video_id"] = video_id
+                return cached
+
+        # Single-flight: a concurrent request for the same transcript awaits the run already in progress
+        # (a forced regeneration only joins another forced run, never one reusing cached responses)
+        inflight_key = cache_key if use_cache else f"{cache_key}:regenerate"
+        task = self._inflight_summaries.get(inflight_key)
+        if task is None:
+            task = asyncio.create_task(self._generate_and_cache_summary(
+                cache_key,
+                bypass_llm_cache=not use_cache,
+                transcript=transcript,
+                video_title=video_title,
+                video_id=video_id,
+                estimated_duration_minutes=estimated_duration_minutes
+            ))
+            self._inflight_summaries[inflight_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight_summary(inflight_key, done))
+        else:
+            logger.info(f"Joining in-flight summary for identical transcript: {video_title}")
+
+        # Shielded so one caller disconnecting does not cancel the run the others are waiting on.
+        # Every awaiter gets its own deep copy, since callers mutate the result they are handed
+        result = copy.deepcopy(await asyncio.shield(task))
+        result["video_id"] = video_id
+        return result
+
+    def _forget_inflight_summary(self, cache_key: str, task: asyncio.Task) -> None:
+        """Drop a finished pipeline from the single-flight map (unless a newer run replaced it)"""
+        if self._inflight_summaries.get(cache_key) is task:
+            del self._inflight_summaries[cache_key]
+
+    async def _generate_and_cache_summary(
+        self,
+        cache_key: str,
+        bypass_llm_cache: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Run the summary pipeline and cache a successful result under `cache_key`
+
+        Runs in its own task, so the LLM cache counters set here cover exactly this
+        pipeline run and are reported in the result metadata. A result built while
+        any LLM call failed (so some step fell back) is returned but not cached, and
+        the next request retries. With `bypass_llm_cache` every LLM call in the run
+        reaches the model (force_regenerate).
+        """
+        stats = {"llm_cache_hits": 0, "llm_cache_misses": 0, "llm_errors": 0}
+        _llm_cache_stats.set(stats)
+        _llm_cache_bypass.set(bypass_llm_cache)
+        result = await self._generate_summary_uncached(**kwargs)
+        if isinstance(result.get("metadata"), dict):
+            result["metadata"].update(stats)
+        if result.get("success") and not stats["llm_errors"]:
+            self.summary_result_cache.set(cache_key, result)
+        elif result.get("success"):
+            logger.info(f"Not caching summary built with {stats['llm_errors']} failed LLM calls")
+        return result
+
+    async def _generate_summary_uncached(
         self,
         transcript: str,
         video_title: str,
@@ -1412,11 +3151,17 @@ class SummarizationService:
             }
 
         try:
+            if _count_tokens(transcript) < SINGLE_SECTION_MAX_TOKENS:
+                return await self._generate_single_section_summary(transcript, video_title, video_id)
+
             logger.info(f"Generating summary (v1) for: {video_title}")
 
-            # Step 1: Detect topic sections
+            # Step 1: Detect topic sections, indexing timestamps in a worker thread meanwhile
             logger.info("Step 1: Detecting topic sections...")
-            topics = await self.detect_topics(transcript)
+            topics, timestamp_index = await asyncio.gather(
+                self.detect_topics(transcript),
+                asyncio.to_thread(_index_timestamps, transcript)
+            )
             sections = topics.get("sections", [])
 
             if not sections:
@@ -1430,68 +3175,57 @@ class SummarizationService:
             logger.info(f"Detected {len(sections)} sections")
 
             # Step 2: Summarize each section with Chain of Density
-            logger.info("Step 2: Applying Chain of Density to each section...")
-            section_summaries = []
+            logger.info(f"Step 2: Applying Chain of Density to {len(sections)} sections...")
+            # Fallback share of the transcript for sections whose timestamps match no content
+            fallback_size = len(transcript) // len(sections)
+            titles = [section.get("title", f"Section {i+1}") for i, section in enumerate(sections)]
 
-            for i, section in enumerate(sections):
-                logger.info(f"  Processing section {i+1}/{len(sections)}: {section.get('title')}")
+            # Untimed transcripts are sliced in proportion to the detected sections' times
+            total_seconds = 0
+            if not timestamp_index[0]:
+                total_seconds = max(_timestamp_to_seconds(section.get("end_time", "0:00")) for section in sections)
 
+            section_contents = []
+            for i, section in enumerate(sections):
                 # Extract content for this section
                 section_content = self._extract_section_content(
                     transcript,
                     section.get("start_time", "0:00"),
-                    section.get("end_time", "99:99")
+                    section.get("end_time", "99:99"),
+                    timestamp_index,
+                    total_seconds
                 )
 
                 # If no content extracted, use a portion of the transcript
                 if not section_content or len(section_content) < 100:
                     # Divide transcript roughly among sections
-                    chunk_size = len(transcript) // len(sections)
-                    start = i * chunk_size
-                    end = (i + 1) * chunk_size
-                    section_content = transcript[start:end]
-
-                # Apply Chain of Density with context from previous sections
-                section_summary = await self.summarize_section(
-                    section.get("title", f"Section {i+1}"),
-                    section_content,
-                    previous_summaries=section_summaries if i > 0 else None
+                    section_content = transcript[i * fallback_size:(i + 1) * fallback_size]
+                section_contents.append(section_content)
+
+            results = await self._summarize_topic_sections(titles, sections, section_contents)
+
+            section_summaries = [
+                SectionSummary(
+                    title=title,
+                    timestamp=f"{section.get('start_time', '0:00')} - {section.get('end_time', '')}",
+                    description=section.get("description", ""),
+                    summary=section_summary.get("summary", ""),
+                    key_points=section_summary.get("key_points", []),
+                    entities=section_summary.get("entities", [])
                 )
+                for title, section, section_summary in zip(titles, sections, results)
+            ]
 
-                section_summaries.append({
-                    "title": section.get("title", f"Section {i+1}"),
-                    "timestamp": f"{section.get('start_time', '0:00')} - {section.get('end_time', '')}",
-                    "description": section.get("description", ""),
-                    "summary": section_summary.get("summary", ""),
-                    "key_points": section_summary.get("key_points", []),
-                    "entities": section_summary.get("entities", [])
-                })
-
-            # Step 3: Generate executive summary
-            logger.info("Step 3: Generating executive summary...")
-            executive = await self.generate_executive_summary(video_title, section_summaries)
-
-            # Compile all key points
-            all_key_points = []
-            for s in section_summaries:
-                all_key_points.extend(s.get("key_points", []))
-
-            # Apply MMR-based deduplication to key points
-            if len(all_key_points) > 8:
-                logger.info(f"Deduplicating {len(all_key_points)} key points...")
-                all_key_points = await self.deduplicate_key_points(all_key_points)
-                logger.info(f"Reduced to {len(all_key_points)} unique points")
-
-            # Compile final result
+            sections_out = [s.to_dict() for s in section_summaries]
             result = {
                 "success": True,
                 "video_id": video_id,
                 "video_title": video_title,
-                "executive_summary": executive.get("executive_summary", ""),
-                "key_takeaways": executive.get("key_takeaways", []),
-                "target_audience": executive.get("target_audience", ""),
-                "sections": section_summaries,
-                "total_sections": len(section_summaries),
+                "executive_summary": "",
+                "key_takeaways": [],
+                "target_audience": "",
+                "sections": sections_out,
+                "total_sections": len(sections_out),
                 "metadata": {
                     "model": self.settings.llm_model,
                     "method": "topic_detection_chain_of_density",
@@ -1499,8 +3233,32 @@ class SummarizationService:
                 }
             }
 
+            # Step 3: Executive summary and cross-section consolidation in one call
+            logger.info("Step 3: Writing executive summary and consolidating sections...")
+            finalized = await self.finalize_summary(video_title, result)
+            if finalized is not None:
+                logger.info(f"Summary generated successfully for: {video_title}")
+                return finalized
+
+            # Fallback: the separate executive summary and consolidation steps
+            logger.info("Step 3 (fallback): Generating executive summary...")
+            executive = await self.generate_executive_summary(
+                video_title,
+                sections_out,
+                summaries_text="\n\n".join(f"**{s.title}** ({s.timestamp})\n{s.summary}" for s in section_summaries)
+            )
+            result["executive_summary"] = executive.get("executive_summary", "")
+            result["key_takeaways"] = executive.get("key_takeaways", [])
+            result["target_audience"] = executive.get("target_audience", "")
+
+            # Without takeaways from the executive summary, use the sections' key points (MMR-deduplicated)
+            if not result["key_takeaways"]:
+                all_key_points = [point for s in section_summaries for point in s.key_points]
+                logger.info(f"No executive takeaways, deduplicating {len(all_key_points)} section key points instead...")
+                result["key_takeaways"] = await self.deduplicate_key_points(all_key_points)
+
             # Apply post-processing consolidation to remove cross-section redundancy
-            logger.info("Step 4: Consolidating summary to remove redundancy...")
+            logger.info("Step 4 (fallback): Consolidating summary to remove redundancy...")
             result = await self.consolidate_summary(result)
 
             logger.info(f"Summary generated successfully for: {video_title}")
@@ -1513,6 +3271,130 @@ class SummarizationService:
                 "error": str(e)
             }
 
+    async def _generate_single_section_summary(
+        self,
+        transcript: str,
+        video_title: str,
+        video_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        v1 summary of a very short transcript from one Chain of Density call.
+
+        Topic detection, the executive summary and consolidation add nothing
+        for a single section, so the section's summary and key points double
+        as the executive summary and key takeaways.
+        """
+        logger.info(f"Generating single-section summary (v1) for short transcript: {video_title}")
+        section_summary = await self.summarize_section(video_title, transcript)
+
+        # The section spans the whole transcript: end it at the last timestamp, if there is one
+        seconds, _ = _index_timestamps(transcript)
+        timestamp = "0:00"
+        if seconds:
+            minutes, remainder = divmod(seconds[-1], 60)
+            timestamp = f"0:00 - {minutes}:{remainder:02d}"
+
+        return {
+            "success": True,
+            "video_id": video_id,
+            "video_title": video_title,
+            "executive_summary": section_summary.get("summary", ""),
+            "key_takeaways": section_summary.get("key_points", []),
+            "target_audience": "",
+            "sections": [SectionSummary(
+                title=video_title,
+                timestamp=timestamp,
+                description="Complete video content",
+                summary=section_summary.get("summary", ""),
+                key_points=section_summary.get("key_points", []),
+                entities=section_summary.get("entities", [])
+            ).to_dict()],
+            "total_sections": 1,
+            "metadata": {
+                "model": self.settings.llm_model,
+                "method": "single_section_chain_of_density",
+                "transcript_length": len(transcript)
+            }
+        }
+
+    async def _summarize_topic_sections(
+        self,
+        titles: List[str],
+        sections: List[Dict[str, Any]],
+        section_contents: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Chain of Density summaries for the v1 topic sections, in section order.
+
+        Sections whose content is identical (up to case and whitespace), as when
+        several detected ranges map onto the same transcript span, are summarized
+        once; later copies keep the key points and point back to the first.
+        Sections are resolved against the semantic cache first. The remaining
+        sections go out as one batched request, and any section it could not
+        produce is summarized individually (concurrently).
+        """
+        first_with_content: Dict[str, int] = {}
+        source = [
+            first_with_content.setdefault(
+                hashlib.sha256(" ".join(content.lower().split()).encode("utf-8")).hexdigest(), i
+            )
+            for i, content in enumerate(section_contents)
+        ]
+        if len(first_with_content) < len(section_contents):
+            kept = list(first_with_content.values())
+            logger.info(f"{len(section_contents) - len(kept)} sections repeat earlier content, summarizing {len(kept)}")
+            kept_results = dict(zip(kept, await self._summarize_topic_sections(
+                [titles[i] for i in kept], [sections[i] for i in kept], [section_contents[i] for i in kept]
+            )))
+            return [
+                kept_results[i] if first == i
+                else {**kept_results[first], "summary": f'Covers the same content as "{titles[first]}".'}
+                for i, first in enumerate(source)
+            ]
+
+        # Individually summarized sections get the earlier sections' detected outlines as
+        # base-fact context instead of their summaries, so they can run concurrently
+        # (consolidation still removes any overlap)
+        contexts: List[Optional[List[Dict[str, Any]]]] = []
+        covered: List[Dict[str, Any]] = []
+        for title, section in zip(titles, sections):
+            contexts.append(covered[:] or None)
+            if section.get("description"):
+                covered.append({"title": title, "key_points": [section["description"]]})
+
+        results, vectors = await self._lookup_cached_section_summaries(section_contents)
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        # Several sections go out as one Chain of Density request; only entries it
+        # could not produce fall back to individual calls
+        fresh: List[Optional[Dict[str, Any]]] = [None] * len(misses)
+        if len(misses) > 1:
+            fresh = await self.summarize_all_sections(
+                [titles[i] for i in misses],
+                [section_contents[i] for i in misses]
+            )
+        retry = [position for position, summary in enumerate(fresh) if summary is None]
+        if len(misses) > 1 and retry:
+            logger.info(f"Summarizing {len(retry)}/{len(misses)} sections individually")
+        retried = await _gather_bounded(
+            self.summarize_section(
+                titles[misses[position]],
+                section_contents[misses[position]],
+                previous_summaries=contexts[misses[position]]
+            )
+            for position in retry
+        )
+        for position, section_summary in zip(retry, retried):
+            fresh[position] = section_summary
+
+        for i, section_summary in zip(misses, fresh):
+            results[i] = section_summary
+            # Fallbacks carry no key points and are not worth reusing
+            if vectors[i] is not None and section_summary.get("key_points"):
+                self.section_summary_cache.add(vectors[i], section_summary)
+
+        return results
+
     async def generate_podcast_summary(
         self,
         transcript: str,
@@ -1520,7 +3402,8 @@ class SummarizationService:
         podcast_id: Optional[str] = None,
         podcast_subject: Optional[str] = None,
         podcast_date: Optional[str] = None,
-        participants: Optional[List[str]] = None
+        participants: Optional[List[str]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate a structured summary optimized for podcast/meeting transcripts.
@@ -1539,6 +3422,7 @@ class SummarizationService:
             podcast_subject: Optional subject/topic
             podcast_date: Optional date of the podcast
             participants: Optional list of participants
+            use_cache: Set False to force regeneration
 
         Returns:
             Structured summary with meeting-specific sections
@@ -1549,6 +3433,18 @@ class SummarizationService:
                 "error": "Summarization service not available - OpenAI API key not configured"
             }
 
+        cache_key = SummaryResultCache.make_key(
+            "podcast", SUMMARY_PROMPT_VERSION, self.settings.llm_model,
+            podcast_title, podcast_subject, podcast_date,
+            ", ".join(participants or []), transcript
+        )
+        if use_cache:
+            cached = self.summary_result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached podcast summary for identical transcript: {podcast_title}")
+                cached["podcast_id"] = podcast_id
+                return cached
+
         try:
             logger.info(f"Generating podcast summary for: {podcast_title}")
 
@@ -1562,14 +3458,14 @@ class SummarizationService:
                 context_parts.append(f"Participants: {', '.join(participants)}")
             context = "\n".join(context_parts)
 
-            # Generate structured summary using a single LLM call
-            prompt = f"""You are an expert meeting summarizer. Analyze the following podcast/meeting transcript and provide a comprehensive summary.
-
-Meeting Context:
-{context}
+            # Trim by tokens, not characters, so dense English and CJK text get the same budget
+            transcript_excerpt = _truncate_to_tokens(transcript, self.settings.podcast_max_input_tokens)
+            if len(transcript_excerpt) < len(transcript):
+                logger.info(f"Podcast transcript truncated to {self.settings.podcast_max_input_tokens} tokens")
 
-Transcript:
-{transcript[:15000]}  # Limit to avoid token limits
+            # Generate structured summary using a single LLM call
+            # Fixed instructions first so provider prompt caching can reuse them across meetings
+            prompt = f"""You are an expert meeting summarizer. Analyze the podcast/meeting transcript below and provide a comprehensive summary.
 
 Please provide the following in JSON format:
 {{
@@ -1580,47 +3476,32 @@ Please provide the following in JSON format:
     "topics_discussed": ["List of main topics/themes covered"]
 }}
 
-Return ONLY valid JSON, no additional text."""
+Return ONLY valid JSON, no additional text.
 
-            response = await self.client.chat.completions.create(
-                model=self.settings.llm_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional meeting summarizer. Always respond with valid JSON only."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+Meeting Context:
+{context}
+
+Transcript:
+{transcript_excerpt}"""
+
+            summary_data = await self._call_llm(
+                prompt,
                 temperature=0.3,
-                max_tokens=2000
+                response_format=PODCAST_SUMMARY_RESPONSE_FORMAT,
+                max_tokens=PODCAST_SUMMARY_MAX_TOKENS,
+                bypass_cache=not use_cache
             )
+            if "error" in summary_data and not summary_data.get("malformed"):
+                return {"success": False, "error": summary_data["error"]}
 
-            # Parse response
-            response_text = response.choices[0].message.content.strip()
-
-            # Try to extract JSON from response
-            import json
+            # Structured outputs match the schema; only a refusal or a max_tokens cut-off fails validation
+            degraded = False
             try:
-                # Handle potential markdown code blocks
-                if response_text.startswith("```"):
-                    lines = response_text.split("\n")
-                    json_lines = []
-                    in_json = False
-                    for line in lines:
-                        if line.startswith("```json"):
-                            in_json = True
-                            continue
-                        elif line.startswith("```"):
-                            in_json = False
-                            continue
-                        if in_json:
-                            json_lines.append(line)
-                    response_text = "\n".join(json_lines)
-
-                summary_data = json.loads(response_text)
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse JSON from LLM response: {response_text[:200]}")
-                # Fallback to basic summary
+                summary_data = PodcastSummarySchema.model_validate(summary_data).model_dump()
+            except ValidationError:
+                logger.warning(f"Podcast summary did not match the schema: {str(summary_data)[:200]}")
+                degraded = True
+                # Fallback to basic summary (not cached, so the next request retries)
                 summary_data = {
                     "executive_summary": f"Summary of {podcast_title}",
                     "key_takeaways": [],
@@ -1649,6 +3530,8 @@ Return ONLY valid JSON, no additional text."""
                 }
             }
 
+            if not degraded:
+                self.summary_result_cache.set(cache_key, result)
             logger.info(f"Podcast summary generated successfully for: {podcast_title}")
             return result
 
@@ -1661,12 +3544,13 @@ Return ONLY valid JSON, no additional text."""
 
 
 # Singleton instance
-_summarization_service: Optional[SummarizationService] = None
-
-
+@lru_cache()
 def get_summarization_service() -> SummarizationService:
     """Get or create summarization service singleton"""
-    global _summarization_service
-    if _summarization_service is None:
-        _summarization_service = SummarizationService()
-    return _summarization_service
+    return SummarizationService()
+
+
+async def close_summarization_service():
+    """Close the summarization service singleton's connections, if it was created"""
+    if get_summarization_service.cache_info().currsize:
+        await get_summarization_service().close()
@@ -17,6 +17,7 @@ from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from datetime import datetime
 from enum import Enum
 
+from .database_service import utc_now
 from .pinecone_service import get_pinecone_service, PineconeService
 from .summarization_service import get_summarization_service, SummarizationService
 
@@ -453,14 +454,16 @@ class TranscriptService:
                     podcast_id=transcript_id,
                     podcast_subject=transcript.get("metadata", {}).get("subject"),
                     podcast_date=transcript.get("metadata", {}).get("meeting_date"),
-                    participants=transcript.get("metadata", {}).get("participants")
+                    participants=transcript.get("metadata", {}).get("participants"),
+                    use_cache=not force_regenerate
                 )
             else:
                 # Use video summary for other types
                 summary_result = await self.summarization.generate_summary(
                     transcript=transcript_text,
                     video_title=transcript.get("title", "Untitled"),
-                    video_id=transcript_id
+                    video_id=transcript_id,
+                    use_cache=not force_regenerate
                 )
 
             if not summary_result.get("success"):
@@ -481,7 +484,7 @@ class TranscriptService:
             return {
                 "success": True,
                 "summary": summary_result,
-                "generated_at": datetime.utcnow(),
+                "generated_at": utc_now(),
                 "from_cache": False
             }
 
@@ -92,13 +92,27 @@ class Settings(BaseSettings):
     # LLM Settings (for summarization)
     openai_api_key: Optional[str] = None
     llm_model: str = "gpt-4o-mini"  # Cost-effective model for summarization
+    llm_topic_model: str = "gpt-4o-mini"  # Topic detection (coarse segmentation) in the v1 path
+    llm_exec_model: str = "gpt-4o-mini"  # Executive summary over the v1 section summaries
+    llm_dedup_model: str = "gpt-4o-mini"  # Merging near-duplicate key points across sections
     llm_max_tokens: int = 4000
+    podcast_max_input_tokens: int = 32000  # Transcript budget for the single-call podcast summary
+    llm_max_concurrency: int = 10  # In-flight OpenAI calls across all summaries on this instance
+    summarization_mode: str = "realtime"  # Default for summarize_chunks_parallel callers: "realtime" or "batch" (OpenAI Batch API, background use only)
 
     # OpenRouter Settings (for large context models)
     openrouter_api_key: Optional[str] = None
     openrouter_default_model: str = "google/gemini-2.0-flash-001"  # 1M context window
     openrouter_large_context_threshold: int = 50000  # Use OpenRouter for transcripts > 50K chars
 
+    # Summary Caching
+    llm_cache_enabled: bool = True  # Reuse parsed LLM responses for identical low-temperature prompts
+    llm_cache_ttl_seconds: int = 604800  # 7 days
+    llm_cache_path: Optional[str] = None  # SQLite file persisting the LLM response cache across restarts
+    embedding_model: str = "text-embedding-3-small"
+    chunk_semantic_cache_enabled: bool = False  # Reuse summaries of near-identical chunks and v1 sections (intros, ad reads)
+    chunk_semantic_cache_threshold: float = 0.93  # Minimum cosine similarity for a cache hit
+
     # Development
     use_mock_pinecone: bool = False
     use_mock_paddle: bool = False
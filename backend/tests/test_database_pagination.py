@@ -0,0 +1,49 @@
+"""
+Test suite for podcast list pagination helpers.
+
+Tests the following features:
+1. Keyset cursors round-trip the (podcast_date, created_at, id) sort key
+2. Malformed cursors are rejected with ValueError
+"""
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.database_service import DatabaseService
+
+
+class TestPodcastCursor:
+    """Tests for keyset pagination cursors."""
+
+    def _compile(self, clause) -> str:
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    def test_cursor_with_podcast_date_includes_null_tail(self):
+        """Rows with NULL podcast_date sort last, so they follow any dated cursor."""
+        podcast = SimpleNamespace(
+            podcast_date=datetime(2026, 1, 2, 10, 0),
+            created_at=datetime(2026, 1, 3, 9, 30),
+            id=uuid.uuid4()
+        )
+        cursor = DatabaseService._encode_podcast_cursor(podcast)
+        sql = self._compile(DatabaseService._podcast_after_cursor(cursor))
+
+        assert "podcasts.podcast_date <" in sql
+        assert "podcasts.podcast_date IS NULL" in sql
+
+    def test_cursor_without_podcast_date_stays_in_null_block(self):
+        """Undated cursors only seek within the trailing NULL block."""
+        podcast = SimpleNamespace(podcast_date=None, created_at=datetime(2026, 1, 3), id=uuid.uuid4())
+        cursor = DatabaseService._encode_podcast_cursor(podcast)
+        sql = self._compile(DatabaseService._podcast_after_cursor(cursor))
+
+        assert "podcasts.podcast_date IS NULL AND" in sql
+        assert "podcasts.podcast_date <" not in sql
+
+    def test_malformed_cursor_raises_value_error(self):
+        """Garbage cursors raise ValueError (mapped to HTTP 400 by the route)."""
+        with pytest.raises(ValueError):
+            DatabaseService._podcast_after_cursor("not-a-cursor")
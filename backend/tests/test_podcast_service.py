@@ -0,0 +1,139 @@
+"""
+Test suite for podcast service.
+
+Tests the following features:
+1. Pinecone uploads run in background workers after create_podcast returns
+2. Uploads are debounced per user and coalesced per podcast
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.podcast_service import PodcastService
+
+
+class TestBackgroundPineconeUpload:
+    """Tests for the fire-and-forget Pinecone upload queue."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr('app.services.podcast_service.PINECONE_UPLOAD_DEBOUNCE_SECONDS', 0)
+        svc = PodcastService()
+        svc.db = MagicMock()
+        svc.db.create_podcast = AsyncMock(return_value={"id": "pod-1", "pinecone_file_id": None})
+        svc.db.update_podcast_pinecone_id = AsyncMock(return_value=True)
+        svc.pinecone = MagicMock()
+        svc.pinecone.is_initialized.return_value = True
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_create_returns_before_upload_completes(self, service):
+        """create_podcast does not wait for the Pinecone upload."""
+        upload_started = asyncio.Event()
+        release_upload = asyncio.Event()
+
+        async def slow_upload(**kwargs):
+            upload_started.set()
+            await release_upload.wait()
+            return {"success": True, "file_id": "file-1"}
+
+        service.pinecone.upload_transcript = slow_upload
+
+        result = await service.create_podcast(user_id="user-1", title="Standup", transcript="Hello team")
+
+        assert result["success"] is True
+        assert result["podcast"]["pinecone_file_id"] is None
+
+        await asyncio.wait_for(upload_started.wait(), 1)
+        release_upload.set()
+        await service.shutdown()
+
+        service.db.update_podcast_pinecone_id.assert_awaited_once_with("pod-1", "file-1")
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_does_not_stop_worker(self, service):
+        """An upload error is logged and the worker keeps serving the queue."""
+        service.pinecone.upload_transcript = AsyncMock(side_effect=[
+            Exception("Pinecone down"),
+            {"success": True, "file_id": "file-2"}
+        ])
+
+        await service.create_podcast(user_id="user-1", title="A", transcript="First")
+        await asyncio.sleep(0.05)
+        await service.create_podcast(user_id="user-1", title="B", transcript="Second")
+        await service.shutdown()
+
+        service.db.update_podcast_pinecone_id.assert_awaited_once_with("pod-1", "file-2")
+
+    @pytest.mark.asyncio
+    async def test_burst_for_same_podcast_uploads_latest_only(self, service, monkeypatch):
+        """Repeated uploads of one podcast inside the debounce window collapse to the last."""
+        monkeypatch.setattr('app.services.podcast_service.PINECONE_UPLOAD_DEBOUNCE_SECONDS', 60)
+        service.pinecone.upload_transcript = AsyncMock(return_value={"success": True, "file_id": "file-3"})
+
+        for text in ("draft", "revised", "final"):
+            service.queue_pinecone_upload(
+                podcast_id="pod-9", user_id="user-1", title="Sync", subject=None,
+                podcast_date=None, participants=[], transcript=text, source="fireflies"
+            )
+        await service.shutdown()
+
+        service.pinecone.upload_transcript.assert_awaited_once()
+        assert service.pinecone.upload_transcript.call_args.kwargs["transcript"].rstrip().endswith("final")
+
+    @pytest.mark.asyncio
+    async def test_steady_uploads_flush_after_max_delay(self, service, monkeypatch):
+        """Uploads arriving faster than the quiet period still flush once the max delay passes."""
+        monkeypatch.setattr('app.services.podcast_service.PINECONE_UPLOAD_DEBOUNCE_SECONDS', 0.05)
+        monkeypatch.setattr('app.services.podcast_service.PINECONE_UPLOAD_MAX_DELAY_SECONDS', 0.1)
+        service.pinecone.upload_transcript = AsyncMock(return_value={"success": True, "file_id": "file-4"})
+
+        for i in range(15):
+            service.queue_pinecone_upload(
+                podcast_id=f"pod-{i}", user_id="user-1", title="Sync", subject=None,
+                podcast_date=None, participants=[], transcript="text", source="fireflies"
+            )
+            await asyncio.sleep(0.02)
+
+        # Still uploading steadily, but the first batch has already gone out
+        assert service.pinecone.upload_transcript.await_count > 0
+        await service.shutdown()
+        assert service.pinecone.upload_transcript.await_count == 15
+
+
+class TestShutdownOrder:
+    """Tests for the application shutdown sequence."""
+
+    @pytest.mark.asyncio
+    async def test_upload_queue_drains_before_database_closes(self, monkeypatch):
+        """Draining uploads still write to the database, so it is closed after them."""
+        from unittest.mock import patch
+        from app.settings import get_settings
+
+        for name, value in (("JWT_SECRET_KEY", "test"), ("DATABASE_URL", "sqlite://"), ("PINECONE_API_KEY", "test")):
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+        try:
+            from app.main import app, lifespan
+
+            order = []
+            db = MagicMock()
+            db.close = AsyncMock(side_effect=lambda: order.append("db.close"))
+            podcast_service = MagicMock()
+            podcast_service.shutdown = AsyncMock(side_effect=lambda: order.append("podcast.shutdown"))
+
+            with patch('app.services.database_service.get_database_service', AsyncMock(return_value=db)), \
+                    patch('app.services.auth_service.get_auth_service'), \
+                    patch('app.services.video_service.get_video_service'), \
+                    patch('app.services.transcript_service.get_transcript_service'), \
+                    patch('app.services.authorizer_service.get_authorizer_service'), \
+                    patch('app.services.pinecone_service.get_pinecone_service'), \
+                    patch('app.services.podcast_service.get_podcast_service', return_value=podcast_service), \
+                    patch('app.services.summarization_service.close_summarization_service', AsyncMock()):
+                async with lifespan(app):
+                    pass
+        finally:
+            get_settings.cache_clear()
+
+        assert order == ["podcast.shutdown", "db.close"]
@@ -152,6 +152,23 @@ class TestSummarizationDeduplication:
         assert result == small_list
         mock_service._call_llm.assert_not_called()
 
+    # Test 7b: Near-verbatim duplicates are merged locally
+    @pytest.mark.asyncio
+    async def test_deduplicate_merges_near_verbatim_points_without_llm(self, mock_service):
+        """Points that differ only in punctuation or a word skip the LLM pass."""
+        points = []
+        for topic in ["position sizing", "stop losses", "moving averages", "risk limits", "patience"]:
+            points.append(f"Always review your {topic} before each trade")
+            points.append(f"Always review your {topic} before each trade.")
+
+        mock_service._call_llm = AsyncMock()
+
+        result = await mock_service.deduplicate_key_points(points, max_points=8)
+
+        assert result == [f"Always review your {topic} before each trade." for topic in
+                          ["position sizing", "stop losses", "moving averages", "risk limits", "patience"]]
+        mock_service._call_llm.assert_not_called()
+
     # Test 8: Consolidation step exists and is called
     @pytest.mark.asyncio
     async def test_consolidate_summary_method_exists(self, mock_service):
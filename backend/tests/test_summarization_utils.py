@@ -0,0 +1,1569 @@
+"""
+Test suite for summarization service helpers.
+
+Tests the following features:
+1. LLM JSON response parsing (code fences, surrounding prose)
+2. Bounded concurrency for parallel LLM calls
+3. Token-based transcript chunking
+"""
+import asyncio
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+
+class TestParseLLMJson:
+    """Tests for the shared LLM JSON response parser."""
+
+    def test_parses_plain_json(self):
+        """Plain JSON objects are decoded as-is."""
+        from app.services.summarization_service import _parse_llm_json
+
+        assert _parse_llm_json('{"summary": "ok"}') == {"summary": "ok"}
+
+    def test_strips_json_code_fence(self):
+        """```json fenced responses (common with Gemini) are unwrapped."""
+        from app.services.summarization_service import _parse_llm_json
+
+        content = '```json\n{"summary": "ok", "key_points": ["a"]}\n```'
+        assert _parse_llm_json(content) == {"summary": "ok", "key_points": ["a"]}
+
+    def test_strips_bare_code_fence(self):
+        """Fences without a language tag are unwrapped too."""
+        from app.services.summarization_service import _parse_llm_json
+
+        assert _parse_llm_json('```\n{"a": 1}\n```') == {"a": 1}
+
+    def test_extracts_object_from_surrounding_prose(self):
+        """Leading/trailing prose around the JSON object is ignored."""
+        from app.services.summarization_service import _parse_llm_json
+
+        content = 'Here is the summary:\n{"a": {"b": 2}}\nHope this helps!'
+        assert _parse_llm_json(content) == {"a": {"b": 2}}
+
+    def test_invalid_json_raises_decode_error(self):
+        """Unparseable content raises JSONDecodeError for callers to handle."""
+        from app.services.summarization_service import _parse_llm_json
+
+        with pytest.raises(json.JSONDecodeError):
+            _parse_llm_json("not json at all")
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_parse_in_worker_thread(self):
+        """Responses over LLM_JSON_THREAD_PARSE_CHARS are decoded via asyncio.to_thread."""
+        from app.services.summarization_service import _parse_llm_json_async, LLM_JSON_THREAD_PARSE_CHARS
+
+        small = '{"a": 1}'
+        large = orjson.dumps({"points": ["x" * 100] * (LLM_JSON_THREAD_PARSE_CHARS // 100)}).decode()
+        with patch('app.services.summarization_service.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+            assert await _parse_llm_json_async(small) == {"a": 1}
+            to_thread.assert_not_called()
+            assert len((await _parse_llm_json_async(large))["points"]) == LLM_JSON_THREAD_PARSE_CHARS // 100
+            to_thread.assert_called_once()
+
+
+class TestDumpPromptJson:
+    """Tests for prompt JSON serialization."""
+
+    def test_matches_stdlib_structure_and_keeps_unicode(self):
+        """Output round-trips like json.dumps(indent=2) without escaping non-ASCII."""
+        from app.services.summarization_service import _dump_prompt_json
+
+        value = {"points": ["Café prices rose 5%", "naïve"], "count": 2}
+        dumped = _dump_prompt_json(value)
+
+        assert json.loads(dumped) == value
+        assert "Café" in dumped
+        assert dumped.startswith('{\n  "points"')
+
+
+class TestGatherBounded:
+    """Tests for bounded concurrent gathering of LLM calls."""
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_limit(self):
+        """No more than `limit` coroutines run at the same time."""
+        from app.services.summarization_service import _gather_bounded
+
+        in_flight = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return i
+
+        results = await _gather_bounded((work(i) for i in range(10)), limit=3)
+
+        assert peak <= 3
+        assert results == list(range(10))
+
+
+    @pytest.mark.asyncio
+    async def test_first_failure_cancels_peers(self):
+        """An exception is re-raised unwrapped and unfinished siblings are cancelled."""
+        from app.services.summarization_service import _gather_bounded
+
+        finished = []
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("bad key")
+
+        async def slow(i):
+            await asyncio.sleep(0.5)
+            finished.append(i)
+
+        with pytest.raises(ValueError, match="bad key"):
+            await _gather_bounded([fail()] + [slow(i) for i in range(4)], limit=2)
+
+        await asyncio.sleep(0.6)
+        assert finished == []
+
+
+class TestStrippedLength:
+    """Tests for the copy-free stripped length used by the chunker."""
+
+    @pytest.mark.parametrize("text,start,end", [
+        ("  abc  ", 0, 7), ("   ", 0, 3), ("x  y ", 1, 5), ("", 0, 0), (" a\n\tb\n", 0, 6),
+    ])
+    def test_matches_slice_strip(self, text, start, end):
+        """Result equals len(text[start:end].strip())."""
+        from app.services.summarization_service import _stripped_length
+
+        assert _stripped_length(text, start, end) == len(text[start:end].strip())
+
+
+class _WordEncoder:
+    """Minimal stand-in for a tiktoken encoding: one token per word."""
+
+    def encode(self, text, disallowed_special=()):
+        return [m.start() for m in re.finditer(r"\S+\s*", text)]
+
+    def decode_with_offsets(self, tokens):
+        return "", list(tokens)
+
+
+class TestChunkTranscript:
+    """Tests for token-based chunking with overlap."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService, _chunk_boundaries_cache
+
+        _chunk_boundaries_cache.clear()
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            return svc
+
+    @pytest.fixture
+    def transcript(self):
+        return " ".join(f"Sentence number {i} talks about topic {i % 7}." for i in range(2000))
+
+    def test_short_transcript_single_chunk(self, service):
+        """Transcripts under the token budget are returned as one chunk."""
+        with patch('app.services.summarization_service._get_token_encoder', return_value=_WordEncoder()):
+            chunks = service.chunk_transcript("A short transcript. " * 10)
+
+        assert len(chunks) == 1
+        assert chunks[0]["start_pct"] == 0.0 and chunks[0]["end_pct"] == 1.0
+
+    def test_chunks_respect_token_budget(self, service, transcript):
+        """Each chunk holds at most chunk_size tokens and chunks overlap."""
+        encoder = _WordEncoder()
+        with patch('app.services.summarization_service._get_token_encoder', return_value=encoder):
+            chunks = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(encoder.encode(transcript[chunk["start_pos"]:chunk["end_pos"]])) <= 500
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert nxt["start_pos"] < prev["end_pos"]
+        assert chunks[-1]["end_pos"] >= len(transcript) - 500
+
+    def test_chunks_end_at_sentence_boundaries(self, service):
+        """Chunk ends snap back to the last . ! or ? followed by whitespace."""
+        transcript = " ".join(
+            f"Point {i} matters{'!' if i % 3 == 0 else '?' if i % 3 == 1 else '.'}" for i in range(3000)
+        )
+        with patch('app.services.summarization_service._get_token_encoder', return_value=_WordEncoder()):
+            chunks = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+
+        assert len(chunks) > 1
+        for chunk in chunks[:-1]:
+            assert transcript[chunk["end_pos"] - 2] in ".!?"
+
+    def test_overlap_split_into_context_and_core(self, service, transcript):
+        """Each chunk's overlap with its predecessor is context; core regions do not overlap."""
+        from app.services.summarization_service import _chunk_prompt_content
+
+        with patch('app.services.summarization_service._get_token_encoder', return_value=_WordEncoder()):
+            chunks = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+
+        assert chunks[0]["core_start"] == chunks[0]["start_pos"]
+        assert all(chunk["transcript"] is transcript for chunk in chunks)
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert nxt["start_pos"] < nxt["core_start"] == prev["end_pos"]
+
+        core = transcript[chunks[1]["core_start"]:chunks[1]["end_pos"]].strip()
+        context = transcript[chunks[1]["start_pos"]:chunks[1]["core_start"]].strip()
+        prompt_content = _chunk_prompt_content(chunks[1])
+        assert prompt_content.startswith(f"[CONTEXT - end of the previous part, for continuity only]\n{context}")
+        assert prompt_content.endswith(f"[CORE]\n{core}")
+        assert _chunk_prompt_content(chunks[0]) == transcript[:chunks[0]["end_pos"]].strip()
+
+    def test_character_fallback_without_tiktoken(self, service, transcript):
+        """Without an encoder, sizes fall back to CHARS_PER_TOKEN characters per token."""
+        from app.services.summarization_service import CHARS_PER_TOKEN
+
+        with patch('app.services.summarization_service._get_token_encoder', return_value=None):
+            chunks = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk["end_pos"] - chunk["start_pos"] <= 500 * CHARS_PER_TOKEN
+
+    def test_failed_encoder_download_is_retried(self, monkeypatch):
+        """A transient tiktoken download failure falls back for a while instead of for good."""
+        import sys
+        import types
+        import app.services.summarization_service as module
+
+        encoder = _WordEncoder()
+        attempts = []
+
+        def get_encoding(name):
+            attempts.append(name)
+            if len(attempts) == 1:
+                raise OSError("network unreachable")
+            return encoder
+
+        monkeypatch.setitem(sys.modules, "tiktoken", types.SimpleNamespace(get_encoding=get_encoding))
+        monkeypatch.setattr(module, "_token_encoder", None)
+        monkeypatch.setattr(module, "_token_encoder_loaded", False)
+        monkeypatch.setattr(module, "_token_encoder_retry_at", 0.0)
+
+        assert module._get_token_encoder() is None
+        assert module._get_token_encoder() is None
+        assert len(attempts) == 1
+
+        monkeypatch.setattr(module, "_token_encoder_retry_at", 0.0)
+        asyncio.run(module.warm_token_encoder())
+        assert module._get_token_encoder() is encoder
+        assert len(attempts) == 2
+
+    def test_boundaries_memoized_per_transcript(self, service, transcript):
+        """Re-chunking the same transcript reuses boundaries without re-tokenizing."""
+        with patch('app.services.summarization_service._token_offsets', return_value=None) as offsets:
+            first = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+            second = service.chunk_transcript(transcript, chunk_size=500, overlap=75)
+
+        assert offsets.call_count == 1
+        assert first == second
+
+
+class TestRefineChunkSummaries:
+    """Tests for the pairwise tree-reduce REFINE step."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            return svc
+
+    @pytest.mark.asyncio
+    async def test_merges_in_log_rounds_preserving_order(self, service):
+        """Eight chunks merge in three rounds and keep chronological order."""
+        calls = []
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            left = re.search(r"EARLIER PART.*?:\n(.*?)\n\nKEY POINTS", prompt, re.DOTALL).group(1)
+            right = re.search(r"LATER PART.*?:\n(.*?)\n\nKEY POINTS", prompt, re.DOTALL).group(1)
+            calls.append(prompt)
+            return {"merged_summary": f"{left}+{right}", "key_points": [f"{left}+{right}"]}
+
+        service._call_llm = fake_llm
+        chunk_summaries = [{"summary": str(i), "key_points": [str(i)]} for i in range(8)]
+
+        result = await service.refine_chunk_summaries(chunk_summaries, max_reduce_tokens=0)
+
+        assert result["running_summary"] == "0+1+2+3+4+5+6+7"
+        assert len(calls) == 7
+
+    @pytest.mark.asyncio
+    async def test_odd_count_and_failed_merge_keep_content(self, service):
+        """An unpaired tail carries over and failed merges concatenate both halves."""
+        async def failing_llm(prompt, temperature=0.3, model_override=None):
+            return {"error": "boom"}
+
+        service._call_llm = failing_llm
+        chunk_summaries = [{"summary": s, "key_points": [s]} for s in ("a", "b", "c")]
+
+        result = await service.refine_chunk_summaries(chunk_summaries, max_reduce_tokens=0)
+
+        assert result["running_summary"] == "a b c"
+        assert result["all_key_points"] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_single_reduce_call_when_summaries_fit(self, service):
+        """Summaries under the token budget are reduced in one call."""
+        from unittest.mock import AsyncMock
+
+        service._call_llm = AsyncMock(return_value={"merged_summary": "whole", "key_points": ["k"]})
+        chunk_summaries = [{"summary": str(i), "key_points": [str(i)]} for i in range(8)]
+
+        result = await service.refine_chunk_summaries(chunk_summaries)
+
+        assert service._call_llm.await_count == 1
+        assert "8 chunks" in service._call_llm.call_args[0][0]
+        assert result == {"running_summary": "whole", "all_key_points": ["k"]}
+
+    @pytest.mark.asyncio
+    async def test_single_reduce_call_drafts_executive_summary(self, service):
+        """The single-call REDUCE also returns the executive fields for Step 5."""
+        from unittest.mock import AsyncMock
+
+        service._call_llm = AsyncMock(return_value={
+            "merged_summary": "whole",
+            "key_points": ["k"],
+            "executive_summary": "overview",
+            "key_takeaways": ["t"],
+            "target_audience": "everyone"
+        })
+
+        chunk_summaries = [{"summary": str(i), "key_points": [str(i)]} for i in range(2)]
+
+        result = await service.refine_chunk_summaries(chunk_summaries)
+
+        assert result["executive"] == {
+            "executive_summary": "overview",
+            "key_takeaways": ["t"],
+            "target_audience": "everyone"
+        }
+
+
+class TestSummarizeChunksGrouped:
+    """Tests for folding several chunks into one MAP request."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            svc.settings.chunk_semantic_cache_enabled = False
+            return svc
+
+    @pytest.fixture
+    def chunks(self):
+        return [
+            {"index": i, "content": f"content {i}", "start_pct": i / 10, "end_pct": (i + 1) / 10}
+            for i in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_groups_chunks_into_fewer_requests(self, service, chunks):
+        """Ten chunks in groups of four take three requests and keep their order."""
+        calls = []
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            numbers = re.findall(r"<<<CHUNK (\d+)>>>", prompt)
+            calls.append(numbers)
+            return {"summaries": [{"summary": f"s{n}", "key_points": [n]} for n in numbers]}
+
+        service._call_llm = fake_llm
+        service.summarize_chunk = MagicMock(side_effect=AssertionError("unexpected single call"))
+
+        results = await service.summarize_chunks_parallel(chunks, group_size=4)
+
+        assert [len(c) for c in calls] == [4, 4, 2]
+        assert [r["summary"] for r in results] == [f"s{i + 1}" for i in range(10)]
+        assert [r["index"] for r in results] == list(range(10))
+        assert results[3]["start_pct"] == 0.3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_chunks_on_bad_response(self, service, chunks):
+        """A response with the wrong number of summaries is retried per chunk, concurrently."""
+        in_flight, peak = 0, 0
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            nonlocal in_flight, peak
+            if "<<<CHUNK" in prompt:
+                return {"summaries": [{"summary": "only one"}]}
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"summary": "single", "key_points": ["p"]}
+
+        service._call_llm = fake_llm
+
+        results = await service.summarize_chunks_parallel(chunks[:3], group_size=3)
+
+        assert [r["summary"] for r in results] == ["single"] * 3
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_fatal_error_aborts_map_step(self, service, chunks):
+        """An unrecoverable API error stops the whole MAP step instead of yielding empty chunks."""
+        from app.services.summarization_service import LLMUnrecoverableError
+
+        calls = []
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            calls.append(prompt)
+            await asyncio.sleep(0)
+            return {"error": "invalid api key", "fatal": True}
+
+        service._call_llm = fake_llm
+
+        with pytest.raises(LLMUnrecoverableError, match="invalid api key"):
+            await service.summarize_chunks_parallel(chunks, group_size=1, max_concurrent=1)
+
+        # Queued chunks are cancelled rather than sent
+        assert len(calls) <= 2
+
+
+class TestSummarizeChunksBatch:
+    """Tests for the OpenAI Batch API MAP path."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            svc.settings.llm_model = "gpt-4o-mini"
+            svc.settings.llm_max_tokens = 1000
+            svc.settings.chunk_semantic_cache_enabled = False
+            return svc
+
+    @pytest.mark.asyncio
+    async def test_maps_custom_ids_back_and_fills_gaps(self, service):
+        """Batch output lines map to chunks by custom_id; missing ones run in real time."""
+        import json as jsonlib
+        from unittest.mock import AsyncMock
+
+        chunks = [
+            {"index": i, "content": f"content {i}", "start_pct": i / 3, "end_pct": (i + 1) / 3}
+            for i in range(3)
+        ]
+        output_lines = [
+            {"custom_id": "chunk-2", "response": {"body": {"choices": [
+                {"message": {"content": jsonlib.dumps({"summary": "two", "key_points": ["b"]})}}
+            ]}}},
+            {"custom_id": "chunk-0", "response": {"body": {"choices": [
+                {"message": {"content": jsonlib.dumps({"summary": "zero", "key_points": ["a"]})}}
+            ]}}},
+        ]
+
+        client = MagicMock()
+        client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+        client.files.content = AsyncMock(return_value=MagicMock(text="\n".join(jsonlib.dumps(l) for l in output_lines)))
+        client.batches.create = AsyncMock(return_value=MagicMock(id="batch-1", status="in_progress"))
+        client.batches.retrieve = AsyncMock(return_value=MagicMock(id="batch-1", status="completed", output_file_id="file-out"))
+        service.client = client
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            return {"summary": "realtime", "key_points": ["c"]}
+
+        service._call_llm = fake_llm
+
+        with patch('app.services.summarization_service.asyncio.sleep', new=AsyncMock()):
+            results = await service.summarize_chunks_parallel(chunks, batch_mode=True)
+
+        assert [r["summary"] for r in results] == ["zero", "realtime", "two"]
+        upload = client.files.create.call_args.kwargs
+        assert upload["purpose"] == "batch"
+        assert upload["file"][1].count(b"\n") == 2
+
+
+class TestLLMResponseCache:
+    """Tests for the exact-match LLM response cache."""
+
+    @pytest.fixture
+    def service(self):
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SummaryResultCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            svc.settings.llm_model = "gpt-4o-mini"
+            svc.settings.llm_max_tokens = 1000
+            svc.llm_response_cache = SummaryResultCache()
+            svc._llm_semaphore = asyncio.Semaphore(5)
+            svc._rate_limit_resume_at = 0.0
+            svc.client = MagicMock()
+            response = MagicMock()
+            response.choices[0].message.content = '{"summary": "cached"}'
+            svc.client.chat.completions.create = AsyncMock(return_value=response)
+            return svc
+
+    @pytest.mark.asyncio
+    async def test_identical_prompt_skips_second_call(self, service):
+        """A repeated low-temperature prompt is served from the cache."""
+        first = await service._call_llm("same prompt", temperature=0.3)
+        second = await service._call_llm("same prompt", temperature=0.3)
+
+        assert first == second == {"summary": "cached"}
+        assert service.client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_reported_in_summary_metadata(self, service):
+        """A pipeline run records its LLM cache hits and misses in the result metadata."""
+        from app.services.summary_cache import SummaryResultCache
+
+        async def pipeline(**kwargs):
+            await asyncio.gather(*(service._call_llm(prompt, temperature=0.3) for prompt in ("a", "b")))
+            await service._call_llm("a", temperature=0.3)
+            await service._call_llm("creative", temperature=0.7)
+            return {"success": True, "metadata": {"method": "test"}}
+
+        service.summary_result_cache = SummaryResultCache()
+        service._generate_summary_uncached = pipeline
+        result = await service._generate_and_cache_summary("key")
+
+        assert result["metadata"] == {"method": "test", "llm_cache_hits": 1, "llm_cache_misses": 2, "llm_errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_summary_cache_key_includes_dedup_model(self, service):
+        """Changing llm_dedup_model regenerates instead of serving the old summary."""
+        from app.services.summary_cache import SummaryResultCache
+
+        runs = []
+
+        async def pipeline(**kwargs):
+            runs.append(service.settings.llm_dedup_model)
+            return {"success": True, "metadata": {}}
+
+        service.summary_result_cache = SummaryResultCache()
+        service._inflight_summaries = {}
+        service._generate_summary_uncached = pipeline
+
+        service.settings.llm_dedup_model = "gpt-4o-mini"
+        await service.generate_summary("transcript", "Title")
+        await service.generate_summary("transcript", "Title")
+        service.settings.llm_dedup_model = "gpt-4o"
+        await service.generate_summary("transcript", "Title")
+
+        assert runs == ["gpt-4o-mini", "gpt-4o"]
+
+    @pytest.mark.asyncio
+    async def test_summary_with_failed_llm_call_is_not_cached(self, service):
+        """A successful result built on a fallback is returned, but the next request re-runs."""
+        from unittest.mock import AsyncMock
+        from app.services.summary_cache import SummaryResultCache
+
+        service.settings.llm_cache_enabled = False
+        service.client.chat.completions.create = AsyncMock(side_effect=RuntimeError("429"))
+
+        async def pipeline(**kwargs):
+            section = await service._call_llm("section prompt")
+            return {"success": True, "fallback": "error" in section, "metadata": {}}
+
+        service.summary_result_cache = SummaryResultCache()
+        service._inflight_summaries = {}
+        service._generate_summary_uncached = pipeline
+
+        first = await service.generate_summary("transcript", "Title")
+        assert first["fallback"] is True
+        assert first["metadata"]["llm_errors"] == 1
+        assert len(service.summary_result_cache._cache) == 0
+
+        response = MagicMock()
+        response.choices[0].message.content = '{"summary": "ok"}'
+        service.client.chat.completions.create = AsyncMock(return_value=response)
+        second = await service.generate_summary("transcript", "Title")
+        assert second["fallback"] is False
+        assert len(service.summary_result_cache._cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_and_new_prompts_bypass_cache(self, service):
+        """Creative calls and different prompts always reach the model."""
+        await service._call_llm("prompt a", temperature=0.7)
+        await service._call_llm("prompt a", temperature=0.7)
+        await service._call_llm("prompt b", temperature=0.3)
+
+        assert service.client.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, service):
+        """LLM_CACHE_ENABLED=false sends every call to the model."""
+        service.settings.llm_cache_enabled = False
+
+        await service._call_llm("same prompt", temperature=0.0)
+        await service._call_llm("same prompt", temperature=0.0)
+
+        assert service.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass_skips_cached_response_and_refreshes_it(self, service):
+        """bypass_cache (force_regenerate) reaches the model and replaces the stored response."""
+        from unittest.mock import AsyncMock
+
+        await service._call_llm("same prompt", temperature=0.3)
+        fresh = MagicMock()
+        fresh.choices[0].message.content = '{"summary": "regenerated"}'
+        service.client.chat.completions.create = AsyncMock(return_value=fresh)
+
+        assert await service._call_llm("same prompt", temperature=0.3, bypass_cache=True) == {"summary": "regenerated"}
+        assert await service._call_llm("same prompt", temperature=0.3) == {"summary": "regenerated"}
+        assert service.client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_without_cache_reaches_the_model(self, service):
+        """generate_summary(use_cache=False) re-asks the model even for prompts already cached."""
+        from app.services.summary_cache import SummaryResultCache
+
+        async def pipeline(**kwargs):
+            section = await service._call_llm("section prompt", temperature=0.3)
+            return {"success": True, "summary": section["summary"], "metadata": {}}
+
+        service.summary_result_cache = SummaryResultCache()
+        service._inflight_summaries = {}
+        service._generate_summary_uncached = pipeline
+
+        await service.generate_summary("transcript", "Title")
+        assert service.client.chat.completions.create.await_count == 1
+
+        result = await service.generate_summary("transcript", "Title", use_cache=False)
+        assert service.client.chat.completions.create.await_count == 2
+        assert result["metadata"]["llm_cache_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_retried_once_with_compact_instruction(self, service):
+        """A cut-off response is re-requested once; only a parsed result is cached."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import LLM_COMPACT_JSON_SYSTEM_MESSAGE
+
+        cut_off, complete = MagicMock(), MagicMock()
+        cut_off.choices[0].message.content = '{"summary": "cut'
+        complete.choices[0].message.content = '{"summary": "short"}'
+        create = service.client.chat.completions.create = AsyncMock(side_effect=[cut_off, complete])
+
+        assert await service._call_llm("prompt", temperature=0.3) == {"summary": "short"}
+        assert await service._call_llm("prompt", temperature=0.3) == {"summary": "short"}
+        assert create.await_count == 2
+        assert create.call_args.kwargs["messages"][0]["content"] == LLM_COMPACT_JSON_SYSTEM_MESSAGE
+
+        create.side_effect = [cut_off, cut_off]
+        result = await service._call_llm("other prompt", temperature=0.3)
+        assert result["malformed"] is True
+        assert create.await_count == 4
+
+
+class TestChunkSemanticCache:
+    """Tests for cross-video reuse of chunk summaries."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_chunk_reuses_summary(self):
+        """A chunk whose embedding is close to a cached one skips the LLM."""
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SemanticCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = True
+        svc.chunk_summary_cache = SemanticCache(threshold=0.93)
+
+        embeddings = iter([[[1.0, 0.0]], [[0.99, 0.05]]])
+        embedded = []
+
+        async def fake_embed(texts):
+            embedded.append(texts)
+            return next(embeddings)
+
+        calls = []
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            calls.append(prompt)
+            return {"summary": "ad read", "key_points": ["sponsor"]}
+
+        svc._embed_texts = fake_embed
+        svc._call_llm = fake_llm
+        chunk = {"index": 0, "content": "x" * 9000, "start_pct": 0.0, "end_pct": 1.0}
+
+        first = await svc.summarize_chunks_parallel([chunk], batch_mode=False)
+        second = await svc.summarize_chunks_parallel([chunk], batch_mode=False)
+
+        assert len(calls) == 1
+        assert second[0]["summary"] == first[0]["summary"] == "ad read"
+        assert len(embedded[0][0]) == 8000
+
+
+class TestExtractSectionContent:
+    """Tests for timestamp-indexed section extraction."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            return SummarizationService()
+
+    @pytest.fixture
+    def transcript(self):
+        return "[0:00] Intro talk. [1:30] Setup steps. [5:00] Main demo. [1:05:00] Wrap up."
+
+    def test_extracts_range_between_timestamps(self, service, transcript):
+        """Content runs from the first stamp at/after start to the first at/after end."""
+        content = service._extract_section_content(transcript, "1:00", "5:00")
+
+        assert content == "[1:30] Setup steps."
+
+    def test_transcript_without_timestamps_is_sliced_by_duration(self, service):
+        """Untimed transcripts are cut in proportion to the video duration, or "" without one."""
+        transcript = "".join(f"{i:02d}" for i in range(100))
+
+        assert service._extract_section_content(transcript, "1:00", "5:00") == ""
+        assert service._extract_section_content(transcript, "1:00", "3:00", total_seconds=600) == transcript[20:60]
+        assert service._extract_section_content(transcript, "8:00", "99:99", total_seconds=600) == transcript[160:]
+
+    def test_reuses_precomputed_index(self, service, transcript):
+        """A shared index gives the same result, including HH:MM:SS stamps."""
+        from app.services.summarization_service import _index_timestamps
+
+        index = _index_timestamps(transcript)
+        with patch('app.services.summarization_service._index_timestamps') as reindex:
+            content = service._extract_section_content(transcript, "5:00", "2:00:00", index)
+
+        reindex.assert_not_called()
+        assert content == "[5:00] Main demo. [1:05:00] Wrap up."
+
+    def test_index_matches_timestamp_pattern_edge_cases(self):
+        """The scanner agrees with the [M:SS] / H:MM:SS regex it replaced on awkward input."""
+        from app.services.summarization_service import _index_timestamps
+
+        pattern = re.compile(r'\[?(\d{1,2}:\d{2}(?::\d{2})?)\]?')
+        for text in [
+            "a1:234 [123:45] 1:23:45 x12:34:5 [[1:00]] 9:99 :12 1: 12:3 00:00:00",
+            "93[0:229:03:0:9:191]]a [9:192",
+            "no stamps here: none",
+        ]:
+            expected_seconds, latest = [], 0
+            for match in pattern.finditer(text):
+                parts = [int(part) for part in match.group(1).split(":")]
+                value = parts[0] * 60 + parts[1] if len(parts) == 2 else parts[0] * 3600 + parts[1] * 60 + parts[2]
+                latest = max(latest, value)
+                expected_seconds.append(latest)
+            expected_offsets = [match.start() for match in pattern.finditer(text)]
+
+            assert _index_timestamps(text) == (expected_seconds, expected_offsets), text
+
+
+class TestOpenRouterStreaming:
+    """Tests for streamed OpenRouter responses."""
+
+    @pytest.mark.asyncio
+    async def test_accumulates_stream_deltas_into_json(self):
+        """Streamed deltas (including a code fence) are joined and parsed."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SummaryResultCache
+
+        def event(content, usage=None):
+            choice = MagicMock()
+            choice.delta.content = content
+            return MagicMock(choices=[choice], usage=usage)
+
+        async def fake_stream():
+            for piece in ['```json\n{"sec', 'tions": ', '[1, 2]}', '\n```']:
+                yield event(piece)
+            yield MagicMock(choices=[], usage=MagicMock(prompt_tokens=10, completion_tokens=5))
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.llm_response_cache = SummaryResultCache()
+        svc.openrouter_client = MagicMock()
+        svc.openrouter_client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+        result = await svc._call_openrouter("prompt", model_override="google/gemini-2.0-flash-001")
+
+        assert result == {"sections": [1, 2]}
+        assert svc.openrouter_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_streamed_array_items_close_across_deltas(self):
+        """Section objects are emitted as they close, ignoring braces inside strings."""
+        from app.services.summarization_service import _StreamedArrayItems
+
+        text = '{"executive_summary": "x", "sections": [{"title": "a}{\\"", "key_points": ["]"]}, {"title": "b"}], "key_takeaways": []}'
+        items = _StreamedArrayItems("sections")
+        emitted = [item for i in range(0, len(text), 3) for item in items.feed(text[i:i + 3])]
+
+        assert emitted == [{"title": 'a}{"', "key_points": ["]"]}, {"title": "b"}]
+        assert items.done
+
+
+class TestSummarizeSectionContext:
+    """Tests for the previous-section context in summarize_section."""
+
+    @pytest.mark.asyncio
+    async def test_entities_keep_first_seen_order_and_cap(self):
+        """Entities are listed once, in first-seen order, capped at MAX_CONTEXT_ENTITIES."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService, MAX_CONTEXT_ENTITIES
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc._call_llm = AsyncMock(return_value={"summary": "s", "key_points": [], "entities": []})
+
+        previous = [
+            {"title": f"S{i}", "key_points": [f"p{i}"], "entities": [f"e{i}", "shared", f"f{i}"]}
+            for i in range(8)
+        ]
+        await svc.summarize_section("Next", "content", previous)
+
+        prompt = svc._call_llm.call_args[0][0]
+        entities = [
+            entity
+            for group in re.findall(r"\(introduces: (.*)\)", prompt)
+            for entity in group.split(", ")
+        ]
+        assert entities[:4] == ["e0", "shared", "f0", "e1"]
+        assert len(entities) == MAX_CONTEXT_ENTITIES == len(set(entities))
+
+    @pytest.mark.asyncio
+    async def test_context_grows_by_appending(self):
+        """The prompt for section N+1 extends the context block of section N byte for byte."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc._call_llm = AsyncMock(return_value={"summary": "s", "key_points": [], "entities": []})
+
+        previous = [
+            {"title": f"S{i}", "key_points": [f"p{i}"], "entities": [f"e{i}", "shared"]}
+            for i in range(3)
+        ]
+        await svc.summarize_section("Next", "content", previous[:2])
+        await svc.summarize_section("Next", "content", previous)
+
+        shorter, longer = (call[0][0] for call in svc._call_llm.call_args_list)
+        shared_prefix = shorter.split("\nIf an introduced entity")[0]
+        assert longer.startswith(shared_prefix + "\n- S2: p2 (introduces: e2)\n")
+
+    @pytest.mark.asyncio
+    async def test_section_content_is_truncated_by_tokens(self):
+        """Non-Latin sections are cut to MAX_SECTION_PROMPT_TOKENS tokens, not a fixed character count."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import (
+            SummarizationService, MAX_SECTION_PROMPT_TOKENS, _get_token_encoder,
+        )
+
+        encoder = _get_token_encoder()
+        if encoder is None:
+            pytest.skip("tiktoken not installed")
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc._call_llm = AsyncMock(return_value={"summary": "s", "key_points": [], "entities": []})
+
+        content = "東京の天気は晴れです。" * 2000
+        await svc.summarize_section("Weather", content, [])
+
+        prompt = svc._call_llm.call_args[0][0]
+        sent = next(line for line in prompt.splitlines() if line.startswith("東京"))
+        assert sent == encoder.decode(encoder.encode(content)[:MAX_SECTION_PROMPT_TOKENS])
+        assert len(sent) < len(content)
+
+
+class TestPromptTemplates:
+    """Tests that prompt templates stay valid str.format templates."""
+
+    def test_all_prompts_parse_with_named_fields_only(self):
+        """Every *_PROMPT parses, uses only named fields, and escapes literal JSON braces."""
+        import string
+        from app.services import summarization_service
+
+        prompts = {
+            name: value for name, value in vars(summarization_service).items()
+            if name.endswith("_PROMPT") and isinstance(value, str)
+        }
+        assert prompts
+
+        for name, template in prompts.items():
+            fields = [field for _, field, _, _ in string.Formatter().parse(template) if field is not None]
+            assert fields, name
+            assert all(field.isidentifier() for field in fields), name
+
+    def test_prompts_put_variable_content_last(self):
+        """Static instructions form the prompt prefix so provider prompt caching can reuse it."""
+        from app.services import summarization_service
+
+        templates = {
+            name: value for name, value in vars(summarization_service).items()
+            if name.endswith(("_PROMPT", "_PROMPT_WITH_CONTEXT")) and isinstance(value, str)
+        }
+        assert len(templates) >= 14
+        for name, template in templates.items():
+            first_field = re.search(r"(?<!\{)\{[a-z_]+\}", template).start()
+            assert template.rindex("Output ONLY valid JSON") < first_field, name
+
+    def test_structured_output_schemas_are_strict(self):
+        """Every *_RESPONSE_FORMAT requires all properties and forbids extras, as strict mode demands."""
+        from app.services import summarization_service
+
+        formats = {
+            name: value for name, value in vars(summarization_service).items()
+            if name.endswith("_RESPONSE_FORMAT")
+        }
+        assert formats
+
+        def objects(schema):
+            if isinstance(schema, dict):
+                if schema.get("type") == "object":
+                    yield schema
+                for value in schema.values():
+                    yield from objects(value)
+            elif isinstance(schema, list):
+                for value in schema:
+                    yield from objects(value)
+
+        for name, response_format in formats.items():
+            assert response_format["json_schema"]["strict"] is True, name
+            for obj in objects(response_format["json_schema"]["schema"]):
+                assert obj["additionalProperties"] is False, name
+                assert set(obj["required"]) == set(obj["properties"]), name
+
+
+class TestSharedHttpClient:
+    """Tests for the connection pool shared by both LLM clients."""
+
+    @pytest.mark.asyncio
+    async def test_openai_and_openrouter_share_one_pool(self):
+        """Both AsyncOpenAI clients use the service's single httpx client, with a short connect timeout."""
+        from app.services.summarization_service import SummarizationService, LLM_CONNECT_TIMEOUT_SECONDS
+
+        settings = MagicMock(openai_api_key="sk-test", openrouter_api_key="or-test")
+        settings.chunk_semantic_cache_threshold = 0.93
+        settings.llm_max_concurrency = 10
+        settings.llm_cache_path = None
+        with patch('app.services.summarization_service.get_settings', return_value=settings):
+            svc = SummarizationService()
+
+        assert svc.client._client is svc.http_client
+        assert svc.openrouter_client._client is svc.http_client
+        assert svc.client.timeout.connect == LLM_CONNECT_TIMEOUT_SECONDS
+        assert svc.http_client.timeout.connect == LLM_CONNECT_TIMEOUT_SECONDS
+
+        await svc.close()
+        assert svc.http_client is None
+
+    @pytest.mark.asyncio
+    async def test_request_bodies_are_encoded_with_orjson(self):
+        """JSON bodies are serialized by orjson; unsupported payloads fall back to httpx."""
+        from app.services.summarization_service import _build_http_client
+
+        client = _build_http_client()
+        try:
+            body = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "héllo"}]}
+            request = client.build_request("POST", "https://api.openai.com/v1/chat/completions", json=body)
+            assert request.content == orjson.dumps(body)
+            assert request.headers["content-type"] == "application/json"
+
+            request = client.build_request("POST", "https://api.openai.com/v1/x", json={1: "a"})
+            assert json.loads(request.content) == {"1": "a"}
+        finally:
+            await client.aclose()
+
+
+class TestSinglePassAssembly:
+    """Tests for the fused assembly path on short videos."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc.settings = MagicMock()
+            svc.settings.llm_model = "gpt-4o-mini"
+            svc.settings.chunk_semantic_cache_enabled = False
+            svc.client = MagicMock()
+            return svc
+
+    @pytest.fixture
+    def transcript(self):
+        return " ".join(f"Sentence number {i} talks about topic {i % 7}." for i in range(1500))
+
+    @pytest.mark.asyncio
+    async def test_short_video_uses_one_assembly_call(self, service, transcript):
+        """Short videos skip refine, grouping, executive and consolidation calls."""
+        prompts = []
+
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            prompts.append(prompt)
+            if "<<<CHUNK" in prompt:
+                count = len(re.findall(r"<<<CHUNK \d+>>>", prompt))
+                return {"summaries": [{"summary": "s", "key_points": ["k"], "entities": ["E"]}] * count}
+            if prompt.startswith("Assemble the final summary"):
+                return {
+                    "executive_summary": "Overview.",
+                    "key_takeaways": ["t1"],
+                    "target_audience": "Everyone",
+                    "sections": [{"title": "Only", "chunk_indices": [0], "combined_summary": "c", "key_points": ["kp"]}]
+                }
+            return {"summary": "s", "key_points": ["k"]}
+
+        service._call_llm = fake_llm
+        with patch('app.services.summarization_service._get_token_encoder', return_value=_WordEncoder()):
+            result = await service.generate_summary_v2(transcript, "Title")
+
+        assert result["success"] is True
+        assert result["metadata"]["method"] == "hybrid_map_reduce_single_pass_v2"
+        assert result["sections"][0]["key_points"] == ["kp"]
+        assert result["executive_summary"] == "Overview."
+        assert sum(p.startswith("Assemble the final summary") for p in prompts) == 1
+        assert not any("Apply Delta Consolidation" in p or "REFINE" in p for p in prompts)
+
+    @pytest.mark.asyncio
+    async def test_summaries_never_wait_on_the_batch_api(self, service):
+        """Even with SUMMARIZATION_MODE=batch, the v2 MAP step runs in real time."""
+        from unittest.mock import AsyncMock
+
+        service.settings.summarization_mode = "batch"
+        service.chunk_transcript = MagicMock(return_value=[{"index": i} for i in range(100)])
+        service.summarize_chunks_parallel = AsyncMock(side_effect=RuntimeError("stop"))
+
+        await service.generate_summary_v2("text", "Title")
+        assert service.summarize_chunks_parallel.call_args.kwargs["batch_mode"] is False
+
+    @pytest.mark.asyncio
+    async def test_refine_and_grouping_run_concurrently(self, service):
+        """Long videos overlap the REFINE step with section grouping."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SMALL_VIDEO_MAX_CHUNKS
+
+        refine_started, group_started = asyncio.Event(), asyncio.Event()
+
+        async def fake_refine(chunk_summaries):
+            refine_started.set()
+            await asyncio.wait_for(group_started.wait(), timeout=1)
+            return {"running_summary": "r", "all_key_points": [], "executive": {"executive_summary": "e"}}
+
+        async def fake_group(chunk_summaries, duration):
+            group_started.set()
+            await asyncio.wait_for(refine_started.wait(), timeout=1)
+            return [{"title": "T"}]
+
+        chunks = [{"index": i} for i in range(SMALL_VIDEO_MAX_CHUNKS + 1)]
+        service.chunk_transcript = MagicMock(return_value=chunks)
+        service.summarize_chunks_parallel = AsyncMock(return_value=[{"summary": "s"}] * len(chunks))
+        service.refine_chunk_summaries = fake_refine
+        service.group_into_sections = fake_group
+        service.consolidate_summary = AsyncMock(side_effect=lambda result: result)
+
+        result = await service.generate_summary_v2("text", "Title")
+
+        assert result["success"] is True
+        assert result["sections"] == [{"title": "T"}]
+        assert result["executive_summary"] == "e"
+
+    @pytest.mark.asyncio
+    async def test_failed_assembly_falls_back_to_pipeline(self, service):
+        """An unusable single-pass response returns None so the multi-step path runs."""
+        async def fake_llm(prompt, temperature=0.3, model_override=None):
+            return {"error": "timeout"}
+
+        service._call_llm = fake_llm
+        assert await service.assemble_summary_single_pass([{"summary": "s"}], "Title") is None
+
+
+class TestRateLimitHeaders:
+    """Tests for pausing OpenAI calls from x-ratelimit-* headers."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+            svc._rate_limit_resume_at = 0.0
+            return svc
+
+    @staticmethod
+    def _response(host, **headers):
+        import httpx
+
+        request = httpx.Request("POST", f"https://{host}/v1/chat/completions")
+        return httpx.Response(200, request=request, headers={k.replace("_", "-"): v for k, v in headers.items()})
+
+    def test_parse_reset_durations(self):
+        """OpenAI reset strings combine h/m/s/ms components."""
+        from app.services.summarization_service import _parse_reset_seconds
+
+        assert _parse_reset_seconds("6m0s") == 360
+        assert _parse_reset_seconds("1.5s") == 1.5
+        assert _parse_reset_seconds("250ms") == 0.25
+        assert _parse_reset_seconds(None) == 0
+
+    @pytest.mark.asyncio
+    async def test_low_remaining_requests_pause_new_calls(self, service):
+        """Nearly exhausted request budget sets a resume time from the reset header."""
+        import time
+
+        await service._record_rate_limits(self._response(
+            "api.openai.com",
+            x_ratelimit_remaining_requests="1", x_ratelimit_reset_requests="2s",
+            x_ratelimit_remaining_tokens="90000", x_ratelimit_reset_tokens="1s"
+        ))
+
+        assert 1.5 < service._rate_limit_resume_at - time.monotonic() <= 2
+
+    @pytest.mark.asyncio
+    async def test_healthy_or_foreign_responses_do_not_pause(self, service):
+        """Plenty of budget, or responses from other hosts, leave calls unthrottled."""
+        await service._record_rate_limits(self._response(
+            "api.openai.com", x_ratelimit_remaining_requests="500", x_ratelimit_remaining_tokens="90000"
+        ))
+        await service._record_rate_limits(self._response(
+            "openrouter.ai", x_ratelimit_remaining_requests="0", x_ratelimit_reset_requests="60s"
+        ))
+
+        assert service._rate_limit_resume_at == 0.0
+
+
+class TestBuildSection:
+    """Tests for turning an LLM section grouping into a section dict."""
+
+    @pytest.fixture
+    def service(self):
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            return SummarizationService()
+
+    def test_ignores_out_of_range_indices_and_caps_points(self, service):
+        """Invalid indices are skipped; timestamps use the first and last valid chunk."""
+        chunk_summaries = [
+            {"start_pct": i / 4, "end_pct": (i + 1) / 4, "key_points": [f"p{i}a", f"p{i}b", f"p{i}c"], "entities": [f"e{i}"]}
+            for i in range(4)
+        ]
+
+        section = service._build_section(
+            {"title": "T", "chunk_indices": [1, 2, 9], "combined_summary": "S"}, chunk_summaries, 60
+        )
+
+        assert section["timestamp"] == "15:00 - 45:00"
+        assert section["key_points"] == ["p1a", "p1b", "p1c", "p2a", "p2b"]
+        assert section["entities"] == ["e1", "e2"]
+
+    def test_entities_keep_first_seen_order_and_cap(self, service):
+        """Entities are deduplicated in first-seen order and capped at five."""
+        chunk_summaries = [
+            {"entities": ["b", "a", "b"]},
+            {"entities": ["c", "a", "d", "e", "f"]}
+        ]
+
+        section = service._build_section({"chunk_indices": [0, 1]}, chunk_summaries, 60)
+
+        assert section["entities"] == ["b", "a", "c", "d", "e"]
+
+
+class TestPodcastSummary:
+    """Tests for the single-call podcast summary."""
+
+    @pytest.mark.asyncio
+    async def test_requests_strict_schema_and_validates_output(self):
+        """The call asks for the podcast JSON schema and validates the response against it."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SummaryResultCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.llm_model = "gpt-4o-mini"
+        svc.settings.podcast_max_input_tokens = 32000
+        svc.settings.llm_cache_enabled = False
+        svc.summary_result_cache = SummaryResultCache()
+        svc.llm_response_cache = SummaryResultCache()
+        svc._llm_semaphore = asyncio.Semaphore(1)
+        svc._rate_limit_resume_at = 0.0
+        svc.client = MagicMock()
+        response = MagicMock()
+        response.choices[0].message.content = (
+            '{"executive_summary": "Weekly sync", "key_takeaways": [], "action_items": ["Ship"],'
+            ' "decisions_made": [], "topics_discussed": []}'
+        )
+        svc.client.chat.completions.create = AsyncMock(return_value=response)
+
+        result = await svc.generate_podcast_summary("transcript text", "Standup")
+
+        assert result["success"] is True
+        assert result["executive_summary"] == "Weekly sync"
+        assert result["action_items"] == ["Ship"]
+        request = svc.client.chat.completions.create.call_args.kwargs
+        assert request["response_format"]["type"] == "json_schema"
+        assert request["response_format"]["json_schema"]["strict"] is True
+        assert request["max_tokens"] == 2000
+
+        svc.summary_result_cache = SummaryResultCache()
+        response.choices[0].message.content = '{"executive_summary": "cut off'
+        result = await svc.generate_podcast_summary("transcript text", "Standup")
+
+        assert result["executive_summary"] == "Summary of Standup"
+        assert len(svc.summary_result_cache._cache) == 0
+
+        svc.summary_result_cache = SummaryResultCache()
+        svc.client.chat.completions.create.side_effect = RuntimeError("connection reset")
+        result = await svc.generate_podcast_summary("transcript text", "Standup")
+
+        assert result == {"success": False, "error": "connection reset"}
+
+    def test_truncate_to_tokens_falls_back_to_character_heuristic(self):
+        """Without tiktoken the token budget maps to CHARS_PER_TOKEN characters per token."""
+        from app.services.summarization_service import _truncate_to_tokens, CHARS_PER_TOKEN
+
+        with patch('app.services.summarization_service._get_token_encoder', return_value=None):
+            assert _truncate_to_tokens("x" * 100, 5) == "x" * (5 * CHARS_PER_TOKEN)
+            assert _truncate_to_tokens("short", 5) == "short"
+
+    def test_truncate_to_tokens_ends_on_a_sentence(self):
+        """A cut text is snapped back to the last sentence end near the cut."""
+        from app.services.summarization_service import _truncate_to_tokens, CHARS_PER_TOKEN
+
+        text = "First sentence here. Second one trails off without an end"
+        with patch('app.services.summarization_service._get_token_encoder', return_value=None):
+            assert _truncate_to_tokens(text, 40 // CHARS_PER_TOKEN) == "First sentence here."
+
+
+class TestInflightSummaries:
+    """Tests for coalescing concurrent summaries of the same transcript."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_pipeline_run(self):
+        """A second request for the same transcript awaits the first run instead of starting its own."""
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SummaryResultCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.summary_result_cache = SummaryResultCache()
+        svc._inflight_summaries = {}
+        runs = []
+
+        async def fake_pipeline(**kwargs):
+            runs.append(kwargs["video_id"])
+            await asyncio.sleep(0.01)
+            return {"success": True, "video_id": kwargs["video_id"], "sections": []}
+
+        svc._generate_summary_uncached = fake_pipeline
+
+        first, second = await asyncio.gather(
+            svc.generate_summary("same transcript", "Title", video_id="a"),
+            svc.generate_summary("same transcript", "Title", video_id="b")
+        )
+
+        assert runs == ["a"]
+        assert (first["video_id"], second["video_id"]) == ("a", "b")
+        assert first["sections"] is not second["sections"]
+        assert svc._inflight_summaries == {}
+
+
+class TestTopicSectionSummaries:
+    """Tests for the v1 topic-detection path."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("transcript, timestamp", [
+        ("[0:00] hello there [1:05] and goodbye", "0:00 - 1:05"),
+        ("hello there and goodbye", "0:00"),
+    ])
+    async def test_single_section_timestamp_spans_the_transcript(self, transcript, timestamp):
+        """The single section ends at the transcript's last timestamp, or omits the end without one."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.summarize_section = AsyncMock(return_value={"summary": "s", "key_points": ["p"], "entities": []})
+
+        result = await svc._generate_single_section_summary(transcript, "Title")
+
+        assert result["sections"][0]["timestamp"] == timestamp
+
+    @pytest.mark.asyncio
+    async def test_sections_are_summarized_concurrently_with_outline_context(self):
+        """Sections the batched call misses are retried concurrently with earlier outlines as base facts."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = False
+        svc.client = MagicMock()
+        svc.openrouter_client = None
+        svc.settings.openrouter_large_context_threshold = 50000
+        svc.detect_topics = AsyncMock(return_value={"sections": [
+            {"title": "Intro", "start_time": "0:00", "end_time": "1:00", "description": "Sets up the problem"},
+            {"title": "Demo", "start_time": "1:00", "end_time": "2:00", "description": "Walks through the fix"}
+        ]})
+        svc.finalize_summary = AsyncMock(side_effect=lambda title, result: result)
+
+        in_flight, peak, contexts = 0, 0, []
+
+        async def fake_section(title, content, previous_summaries=None):
+            nonlocal in_flight, peak
+            contexts.append((title, previous_summaries))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"summary": title, "key_points": [], "entities": []}
+
+        svc.summarize_section = fake_section
+        svc.summarize_all_sections = AsyncMock(return_value=[None, None])
+        transcript = "[0:00] " + "intro words " * 300 + "[1:00] " + "demo words " * 300
+
+        result = await svc._generate_summary_uncached(transcript, "Title")
+
+        assert peak == 2
+        assert [s["summary"] for s in result["sections"]] == ["Intro", "Demo"]
+        assert dict(contexts) == {
+            "Intro": None,
+            "Demo": [{"title": "Intro", "key_points": ["Sets up the problem"]}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_unfinalized_summary_dedups_key_points_only_without_takeaways(self):
+        """The fallback path only pays for key point dedup when the executive summary has no takeaways."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = False
+        svc.client = MagicMock()
+        svc.openrouter_client = None
+        svc.settings.openrouter_large_context_threshold = 50000
+        svc.detect_topics = AsyncMock(return_value={"sections": [
+            {"title": "Intro", "start_time": "0:00", "end_time": "1:00"},
+            {"title": "Demo", "start_time": "1:00", "end_time": "2:00"}
+        ]})
+        svc.summarize_all_sections = AsyncMock(return_value=[
+            {"summary": "intro", "key_points": ["a"], "entities": []},
+            {"summary": "demo", "key_points": ["b"], "entities": []}
+        ])
+        svc.finalize_summary = AsyncMock(return_value=None)
+        svc.consolidate_summary = AsyncMock(side_effect=lambda result: result)
+        svc.deduplicate_key_points = AsyncMock(return_value=["a", "b"])
+        transcript = "[0:00] " + "intro words " * 300 + "[1:00] " + "demo words " * 300
+
+        svc.generate_executive_summary = AsyncMock(return_value={"executive_summary": "e", "key_takeaways": ["t"]})
+        result = await svc._generate_summary_uncached(transcript, "Title")
+        assert result["key_takeaways"] == ["t"]
+        svc.deduplicate_key_points.assert_not_awaited()
+
+        svc.generate_executive_summary = AsyncMock(return_value={"error": "timeout"})
+        result = await svc._generate_summary_uncached(transcript, "Title")
+        assert result["key_takeaways"] == ["a", "b"]
+        svc.deduplicate_key_points.assert_awaited_once_with(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_short_transcript_is_one_section_call(self):
+        """Very short transcripts skip topic detection and the executive summary."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.client = MagicMock()
+        svc.openrouter_client = None
+        svc.settings.openrouter_large_context_threshold = 50000
+        svc.detect_topics = AsyncMock()
+        svc.generate_executive_summary = AsyncMock()
+        svc.summarize_section = AsyncMock(return_value={"summary": "s", "key_points": ["k"], "entities": ["e"]})
+
+        result = await svc._generate_summary_uncached("[0:00] a short clip about one thing", "Clip")
+
+        svc.summarize_section.assert_awaited_once_with("Clip", "[0:00] a short clip about one thing")
+        svc.detect_topics.assert_not_awaited()
+        svc.generate_executive_summary.assert_not_awaited()
+        assert result["executive_summary"] == "s"
+        assert result["key_takeaways"] == ["k"]
+        assert result["total_sections"] == 1
+        assert result["sections"][0]["entities"] == ["e"]
+
+    @pytest.mark.asyncio
+    async def test_finalize_fuses_executive_summary_and_consolidation(self):
+        """One structured call fills the executive fields and consolidated sections; failures return None."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService, FINAL_SUMMARY_RESPONSE_FORMAT
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        section = {"title": "T", "timestamp": "0:00 - 1:00", "description": "d",
+                   "summary": "s", "key_points": ["k"], "entities": []}
+        raw = {"success": True, "executive_summary": "", "sections": [section], "metadata": {"method": "m"}}
+        svc._call_llm = AsyncMock(return_value={
+            "executive_summary": "e", "key_takeaways": ["t"], "target_audience": "a",
+            "sections": [{**section, "summary": "consolidated"}]
+        })
+
+        result = await svc.finalize_summary("Title", raw)
+
+        assert svc._call_llm.call_args.kwargs["response_format"] is FINAL_SUMMARY_RESPONSE_FORMAT
+        assert result["executive_summary"] == "e"
+        assert result["sections"][0]["summary"] == "consolidated"
+        assert result["metadata"] == {"method": "m", "consolidated": True, "consolidation_model": "gpt-4o"}
+
+        svc._call_llm = AsyncMock(return_value={"error": "timeout"})
+        assert await svc.finalize_summary("Title", raw) is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_section_content_is_summarized_once(self):
+        """Sections mapping onto the same transcript span share one summary call."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = False
+        svc.summarize_section = AsyncMock(return_value={"summary": "outro", "key_points": ["k"], "entities": []})
+        svc.summarize_all_sections = AsyncMock()
+
+        results = await svc._summarize_topic_sections(
+            ["Outro", "Credits"], [{}, {}], ["Thanks for watching!", "thanks  for watching!"]
+        )
+
+        svc.summarize_section.assert_awaited_once()
+        svc.summarize_all_sections.assert_not_awaited()
+        assert results[0]["summary"] == "outro"
+        assert results[1] == {"summary": 'Covers the same content as "Outro".', "key_points": ["k"], "entities": []}
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_serves_near_duplicate_sections(self):
+        """Cached sections skip the LLM call; fresh ones are added to the cache."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SemanticCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = True
+        svc.section_summary_cache = SemanticCache(threshold=0.95)
+        svc.section_summary_cache.add([1.0, 0.0], {"summary": "cached intro", "key_points": ["k"]})
+        svc._embed_texts = AsyncMock(return_value=[[0.99, 0.01], [0.0, 1.0]])
+
+        results, vectors = await svc._lookup_cached_section_summaries(["intro text", "new text"])
+
+        assert results[0]["summary"] == "cached intro"
+        assert results[1] is None
+        assert vectors[1] == [0.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_cached_section_summaries_are_not_shared(self):
+        """Editing a summary after it is cached, or after a hit, leaves the cached entry intact."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+        from app.services.summary_cache import SemanticCache
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc.settings.chunk_semantic_cache_enabled = True
+        svc.section_summary_cache = SemanticCache(threshold=0.95)
+        svc._embed_texts = AsyncMock(return_value=[[1.0, 0.0]])
+        fresh = {"summary": "intro", "key_points": ["k"], "entities": []}
+        svc.summarize_section = AsyncMock(return_value=fresh)
+
+        results = await svc._summarize_topic_sections(["Intro"], [{}], ["intro text"])
+        results[0]["key_points"].append("edited for this video")
+
+        hits, _ = await svc._lookup_cached_section_summaries(["intro text"])
+        hits[0]["summary"] = "edited again"
+        again, _ = await svc._lookup_cached_section_summaries(["intro text"])
+
+        assert again[0] == {"summary": "intro", "key_points": ["k"], "entities": []}
+
+    @pytest.mark.asyncio
+    async def test_batched_call_summarizes_all_sections_in_one_request(self):
+        """One request covers every section; entries are placed by their index."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc._call_llm = AsyncMock(return_value={"sections": [
+            {"index": 2, "summary": "second", "key_points": ["b"], "entities": []},
+            {"index": 1, "summary": "first", "key_points": ["a"], "entities": ["E"]}
+        ]})
+
+        summaries = await svc.summarize_all_sections(["Intro", "Demo", "Outro"], ["x", "y", "z"])
+
+        assert svc._call_llm.await_count == 1
+        assert "<<<SECTION 3: Outro>>>" in svc._call_llm.call_args[0][0]
+        assert summaries == [
+            {"summary": "first", "key_points": ["a"], "entities": ["E"]},
+            {"summary": "second", "key_points": ["b"], "entities": []},
+            None
+        ]
+
+    @pytest.mark.asyncio
+    async def test_topic_detection_and_executive_use_their_own_models(self):
+        """detect_topics, generate_executive_summary and key point dedup pass the configured models."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import SummarizationService
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock(
+            llm_topic_model="topic-model", llm_exec_model="exec-model", llm_dedup_model="dedup-model"
+        )
+        svc._call_llm = AsyncMock(return_value={"sections": []})
+
+        await svc.detect_topics("transcript")
+        assert svc._call_llm.call_args.kwargs["model_override"] == "topic-model"
+
+        await svc.generate_executive_summary("Title", [{"title": "T", "summary": "s"}])
+        assert svc._call_llm.call_args.kwargs["model_override"] == "exec-model"
+
+        svc.is_available = MagicMock(return_value=True)
+        points = [" ".join(f"w{i}x{j}" for j in range(6)) for i in range(10)]
+        await svc.deduplicate_key_points(points)
+        assert svc._call_llm.call_args.kwargs["model_override"] == "dedup-model"
+
+    @pytest.mark.asyncio
+    async def test_bounded_output_calls_cap_max_tokens(self):
+        """Small-output v1 calls reserve less than the llm_max_tokens default against the TPM limit."""
+        from unittest.mock import AsyncMock
+        from app.services.summarization_service import (
+            SummarizationService, TOPIC_DETECTION_MAX_OUTPUT_TOKENS,
+            SECTION_SUMMARY_MAX_OUTPUT_TOKENS, EXECUTIVE_SUMMARY_MAX_OUTPUT_TOKENS,
+        )
+
+        with patch.object(SummarizationService, '__init__', lambda x: None):
+            svc = SummarizationService()
+        svc.settings = MagicMock()
+        svc._call_llm = AsyncMock(return_value={"sections": [], "summary": "s", "key_points": []})
+
+        await svc.detect_topics("transcript")
+        assert svc._call_llm.call_args.kwargs["max_tokens"] == TOPIC_DETECTION_MAX_OUTPUT_TOKENS
+        await svc.summarize_section("Title", "content")
+        assert svc._call_llm.call_args.kwargs["max_tokens"] == SECTION_SUMMARY_MAX_OUTPUT_TOKENS
+        await svc.generate_executive_summary("Title", [{"title": "T", "summary": "s"}])
+        assert svc._call_llm.call_args.kwargs["max_tokens"] == EXECUTIVE_SUMMARY_MAX_OUTPUT_TOKENS
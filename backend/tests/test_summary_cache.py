@@ -0,0 +1,165 @@
+"""
+Test suite for summarization caches.
+
+Tests the following features:
+1. Semantic cache hits on near-identical embeddings, misses otherwise
+2. TTL expiry and max-entry eviction
+3. SQLite persistence of exact-match entries
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.services.summary_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for embedding-similarity cache."""
+
+    def test_hit_on_similar_vector(self):
+        """A vector above the similarity threshold returns the cached value."""
+        cache = SemanticCache(threshold=0.95)
+        cache.add([1.0, 0.0, 0.0], {"summary": "intro"})
+
+        assert cache.lookup([0.99, 0.05, 0.0]) == {"summary": "intro"}
+        assert cache.hits == 1
+
+    def test_miss_on_dissimilar_vector(self):
+        """Vectors below the threshold miss."""
+        cache = SemanticCache(threshold=0.95)
+        cache.add([1.0, 0.0, 0.0], {"summary": "intro"})
+
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+        assert cache.misses == 1
+
+    def test_scale_invariant(self):
+        """Similarity is cosine-based, so vector magnitude does not matter."""
+        cache = SemanticCache(threshold=0.99)
+        cache.add([2.0, 2.0], {"summary": "ad read"})
+
+        assert cache.lookup([0.5, 0.5]) == {"summary": "ad read"}
+
+    def test_evicts_oldest_beyond_max_entries(self):
+        """Only the most recent max_entries are kept."""
+        cache = SemanticCache(max_entries=2)
+        cache.add([1.0, 0.0, 0.0], {"summary": "a"})
+        cache.add([0.0, 1.0, 0.0], {"summary": "b"})
+        cache.add([0.0, 0.0, 1.0], {"summary": "c"})
+
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+
+    def test_values_are_copied_in_and_out(self):
+        """Neither the added dict nor a returned hit shares state with the cached entry."""
+        cache = SemanticCache(threshold=0.95)
+        value = {"summary": "intro", "key_points": ["a"]}
+        cache.add([1.0, 0.0], value)
+        value["key_points"].append("added later")
+
+        hit = cache.lookup([1.0, 0.0])
+        hit["key_points"].append("edited by caller")
+
+        assert cache.lookup([1.0, 0.0]) == {"summary": "intro", "key_points": ["a"]}
+
+    def test_lookup_many_matches_lookup(self):
+        """Batched lookups return the same hits and misses as one-by-one lookups."""
+        cache = SemanticCache(threshold=0.95)
+        cache.add([1.0, 0.0, 0.0], {"summary": "intro"})
+        cache.add([0.0, 1.0, 0.0], {"summary": "outro"})
+
+        assert cache.lookup_many([[0.0, 0.99, 0.05], [0.0, 0.0, 1.0], [2.0, 0.0, 0.0]]) == [
+            {"summary": "outro"}, None, {"summary": "intro"}
+        ]
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_expired_entries_are_pruned(self):
+        """Entries older than the TTL no longer match."""
+        cache = SemanticCache(ttl_seconds=60)
+        with patch('app.services.summary_cache.time.monotonic', return_value=1000.0):
+            cache.add([1.0, 0.0], {"summary": "old"})
+        with patch('app.services.summary_cache.time.monotonic', return_value=1061.0):
+            assert cache.lookup([1.0, 0.0]) is None
+        assert len(cache) == 0
+
+
+class TestSummaryResultCache:
+    """Tests for the transcript-hash keyed final summary cache."""
+
+    def test_key_changes_with_any_part(self):
+        """Keys differ when the prompt version or transcript differ."""
+        from app.services.summary_cache import SummaryResultCache
+
+        base = SummaryResultCache.make_key("video", "2", "Title", "transcript")
+        assert base == SummaryResultCache.make_key("video", "2", "Title", "transcript")
+        assert base != SummaryResultCache.make_key("video", "3", "Title", "transcript")
+        assert base != SummaryResultCache.make_key("video", "2", "Title", "transcript!")
+
+    def test_returned_values_are_copies(self):
+        """Mutating a returned result does not corrupt the cached entry."""
+        from app.services.summary_cache import SummaryResultCache
+
+        cache = SummaryResultCache()
+        cache.set("k", {"video_id": "a", "sections": [{"title": "Intro"}]})
+
+        first = cache.get("k")
+        first.pop("video_id")
+        first["sections"][0]["title"] = "Changed"
+
+        assert cache.get("k") == {"video_id": "a", "sections": [{"title": "Intro"}]}
+        assert cache.hits == 2
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+
+class TestSqliteResultStore:
+    """Tests for the on-disk layer under the exact-match cache."""
+
+    def test_entries_survive_a_new_cache_instance(self, tmp_path):
+        """A fresh in-memory cache over the same file serves earlier entries."""
+        from app.services.summary_cache import SqliteResultStore, SummaryResultCache
+
+        path = str(tmp_path / "llm_cache.sqlite3")
+        first = SummaryResultCache(store=SqliteResultStore(path))
+        first.set("k", {"summary": "s", "key_points": ["a"]})
+        first.store.close()
+
+        second = SummaryResultCache(store=SqliteResultStore(path))
+        assert second.get("k") == {"summary": "s", "key_points": ["a"]}
+        assert second.get("missing") is None
+        second.store.close()
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_disk_io_in_a_thread(self, tmp_path):
+        """get_async/set_async reach the store through worker threads, not on the event loop."""
+        import threading
+        from app.services.summary_cache import SqliteResultStore, SummaryResultCache
+
+        path = str(tmp_path / "llm_cache.sqlite3")
+        loop_thread = threading.get_ident()
+        store = SqliteResultStore(path)
+        calls = []
+        for name in ("get", "set"):
+            method = getattr(store, name)
+            setattr(store, name, lambda *args, _method=method, _name=name: (
+                calls.append((_name, threading.get_ident() != loop_thread)), _method(*args)
+            )[1])
+
+        first = SummaryResultCache(store=store)
+        await first.set_async("k", {"summary": "s"})
+        second = SummaryResultCache(store=store)
+        assert await second.get_async("k") == {"summary": "s"}
+        assert await second.get_async("k") == {"summary": "s"}
+
+        assert calls == [("set", True), ("get", True)]
+        store.close()
+
+    def test_expired_rows_are_ignored(self, tmp_path):
+        """Rows older than the TTL count as misses."""
+        from app.services.summary_cache import SqliteResultStore
+
+        store = SqliteResultStore(str(tmp_path / "llm_cache.sqlite3"), ttl_seconds=60)
+        with patch('app.services.summary_cache.time.time', return_value=1000.0):
+            store.set("k", {"summary": "old"})
+        with patch('app.services.summary_cache.time.time', return_value=1061.0):
+            assert store.get("k") is None
+        store.close()